@@ -0,0 +1,46 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+"""Benchmarks of the plot items updated during a measurement."""
+
+import pyqtgraph as pg
+import pytest
+
+from pymeasure.display.curves import ResultsCurve, ResultsImage
+
+from helpers import write_rows
+
+
+@pytest.mark.parametrize("size", [1000, 100000])
+def bench_results_curve_update(benchmark, qapp, results, size):
+    write_rows(results, 0, size)
+    curve = ResultsCurve(results, "voltage", "current", pen=pg.mkPen())
+    benchmark(curve.update_data)
+    assert len(curve.xData) == size
+
+
+def bench_results_image_update(benchmark, qapp, results):
+    write_rows(results, 0, 121)
+    image = ResultsImage(results, "voltage", "current", "resistance (ohm)")
+    benchmark(image.update_data)
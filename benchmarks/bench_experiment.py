@@ -0,0 +1,83 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+"""Benchmarks of procedures, results files and workers."""
+
+import pytest
+
+from pymeasure.experiment.listeners import Recorder
+from pymeasure.experiment.results import CSVFormatter, Results
+from pymeasure.experiment.workers import Worker
+
+from helpers import BenchProcedure, make_row, write_rows
+
+
+def bench_procedure_init(benchmark):
+    benchmark(BenchProcedure)
+
+
+def bench_csv_formatter_format(benchmark):
+    formatter = CSVFormatter(BenchProcedure.DATA_COLUMNS)
+    row = make_row(42)
+    assert benchmark(formatter.format, row) == "0.9,0.30000000000000004,1042.0,ok"
+
+
+def bench_results_init(benchmark, tmp_path):
+    procedure = BenchProcedure()
+    files = iter(range(10 ** 9))
+    benchmark(lambda: Results(procedure, str(tmp_path / f"{next(files)}.csv")))
+
+
+@pytest.mark.parametrize("size", [1000, 10000, 100000])
+def bench_results_data_incremental(benchmark, results, size):
+    """Read 100 new rows of a results file of growing size, as the plots do."""
+    write_rows(results, 0, size)
+    assert len(results.data) == size
+    state = {"rows": size}
+
+    def setup():
+        write_rows(results, state["rows"], 100)
+        state["rows"] += 100
+
+    benchmark.pedantic(lambda: results.data, setup=setup, rounds=20)
+    assert len(results.data) == state["rows"]
+
+
+@pytest.mark.parametrize("size", [1000, 100000])
+def bench_results_reload(benchmark, results, size):
+    write_rows(results, 0, size)
+    benchmark.pedantic(results.reload, rounds=5)
+    assert len(results.data) == size
+
+
+def bench_worker_emit(benchmark, results):
+    worker = Worker(results)
+    worker.recorder = Recorder(results, worker.recorder_queue)
+    worker.recorder.start()
+    row = make_row(42)
+    try:
+        benchmark(worker.emit, "results", row)
+    finally:
+        worker.recorder.stop()
+    assert len(results.data) > 0
@@ -0,0 +1,65 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+"""Benchmarks of the instrument communication layer."""
+
+from pymeasure.adapters import SimulatedAdapter
+
+from helpers import BenchInstrument
+
+
+def bench_values(benchmark, instrument):
+    values = benchmark(instrument.values, "DATA?")
+    assert len(values) == 1000
+
+
+def bench_measurement(benchmark, instrument):
+    assert len(benchmark(lambda: instrument.data)) == 1000
+
+
+def bench_control_get(benchmark, instrument):
+    assert benchmark(lambda: instrument.voltage) == 1.5
+
+
+def bench_control_set(benchmark, instrument):
+    def set_voltage():
+        instrument.voltage = 2.5
+
+    benchmark(set_voltage)
+
+
+def bench_control_get_mapped(benchmark, instrument):
+    assert benchmark(lambda: instrument.mode) == "fast"
+
+
+def bench_control_set_mapped(benchmark, instrument):
+    def set_mode():
+        instrument.mode = "slow"
+
+    benchmark(set_mode)
+
+
+def bench_instrument_init(benchmark):
+    adapter = SimulatedAdapter(sleep=None)
+    benchmark(BenchInstrument, adapter)
@@ -0,0 +1,90 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+"""Instrument, procedure and data shared by the benchmarks."""
+
+import re
+
+from pymeasure.adapters import SimulatedAdapter
+from pymeasure.experiment import Procedure, FloatParameter, IntegerParameter, Parameter
+from pymeasure.experiment.results import Results
+from pymeasure.instruments import Instrument
+from pymeasure.instruments.validators import strict_discrete_set, strict_range
+
+POINTS = 1000
+
+
+class BenchInstrument(Instrument):
+    """Instrument with typical properties for the benchmarks."""
+
+    voltage = Instrument.control(
+        "VOLT?", "VOLT %g", "Control the voltage.",
+        validator=strict_range, values=[-10, 10])
+
+    mode = Instrument.control(
+        "MODE?", "MODE %s", "Control the mode.",
+        validator=strict_discrete_set, values={"fast": "F", "slow": "S"}, map_values=True)
+
+    data = Instrument.measurement("DATA?", "Get the data points.")
+
+    def __init__(self, adapter=None, name="Benchmark instrument", **kwargs):
+        if adapter is None:
+            adapter = SimulatedAdapter(
+                {"VOLT?": "1.5", re.compile(r"VOLT .*"): None,
+                 "MODE?": "F", re.compile(r"MODE .*"): None,
+                 "DATA?": ",".join(f"{i * 1.234567e-3:.6e}" for i in range(POINTS))},
+                sleep=None)
+        super().__init__(adapter, name, includeSCPI=False, **kwargs)
+
+
+class BenchProcedure(Procedure):
+    """Procedure with typical parameters for the benchmarks."""
+
+    iterations = IntegerParameter("Loop Iterations", default=100)
+    delay = FloatParameter("Delay Time", units="s", default=0.001)
+    voltage_start = FloatParameter("Voltage start", units="V", default=0.)
+    voltage_end = FloatParameter("Voltage end", units="V", default=1.)
+    voltage_step = FloatParameter("Voltage step", units="V", default=0.1)
+    current_start = FloatParameter("Current start", units="A", default=0.)
+    current_end = FloatParameter("Current end", units="A", default=1.)
+    current_step = FloatParameter("Current step", units="A", default=0.1)
+    comment = Parameter("Comment", default="benchmark")
+
+    DATA_COLUMNS = ["voltage", "current", "resistance (ohm)", "comment"]
+
+    def execute(self):
+        pass
+
+
+def make_row(i):
+    """Return a typical row of the benchmark data."""
+    return {"voltage": (i % 11) * 0.1, "current": (i // 11 % 11) * 0.1,
+            "resistance (ohm)": 1e3 + i, "comment": "ok"}
+
+
+def write_rows(results, start, count):
+    """Append `count` rows to the data file of `results`."""
+    with open(results.data_filename, "a") as file:
+        file.writelines(results.format(make_row(i)) + Results.LINE_BREAK
+                        for i in range(start, start + count))
@@ -40,7 +40,7 @@ from time import sleep
 
 from pymeasure.experiment import Procedure, IntegerParameter, Parameter, \
     FloatParameter
-from pymeasure.experiment import Results
+from pymeasure.experiment import Results, unique_filenames
 from pymeasure.display.Qt import QtWidgets
 from pymeasure.display.windows import ManagedWindow
 
@@ -96,8 +96,13 @@ class MainWindow(ManagedWindow):
         )
         self.setWindowTitle('GUI Example')
 
-    def queue(self, *, procedure=None):
-        filename = tempfile.mktemp()
+    def reserve_filenames(self, count):
+        # Reserve the data files of all measurements of a sequence at once
+        return unique_filenames(count, tempfile.gettempdir(), prefix='sequence', claim=True)
+
+    def queue(self, *, procedure=None, filename=None):
+        if filename is None:
+            filename = tempfile.mktemp()
 
         if procedure is None:
             procedure = self.make_procedure()
@@ -27,6 +27,9 @@ from .adapter import Adapter, FakeAdapter
 
 from .protocol import ProtocolAdapter
 
+from .profiler import CommunicationProfiler
+from .simulated import SimulatedAdapter
+
 from pymeasure.adapters.telnet import TelnetAdapter
 
 log = logging.getLogger(__name__)
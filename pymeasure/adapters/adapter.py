@@ -46,8 +46,13 @@ class Adapter:
 
     :param log: Parent logger of the 'Adapter' logger.
     :param \\**kwargs: Keyword arguments just to be cooperative.
+
+    The communication timing is recorded if a
+    :class:`~pymeasure.adapters.profiler.CommunicationProfiler` is attached to the adapter.
     """
 
+    profiler = None
+
     def __init__(self, preprocess_reply=None, log=None, **kwargs):
         super().__init__(**kwargs)
         self.preprocess_reply = preprocess_reply
@@ -84,7 +89,15 @@ class Adapter:
         :param \\**kwargs: Keyword arguments for the connection itself.
         """
         self.log.debug("WRITE:%s", command)
-        self._write(command, **kwargs)
+        if self.profiler is None:
+            self._write(command, **kwargs)
+        else:
+            start = self.profiler.start()
+            try:
+                self._write(command, **kwargs)
+            finally:
+                end = self.profiler.end()
+            self.profiler.wrote(command, start, end, len(command))
 
     def write_bytes(self, content, **kwargs):
         """Write the bytes `content` to the instrument.
@@ -95,7 +108,15 @@ class Adapter:
         :param \\**kwargs: Keyword arguments for the connection itself.
         """
         self.log.debug("WRITE:%s", content)
-        self._write_bytes(content, **kwargs)
+        if self.profiler is None:
+            self._write_bytes(content, **kwargs)
+        else:
+            start = self.profiler.start()
+            try:
+                self._write_bytes(content, **kwargs)
+            finally:
+                end = self.profiler.end()
+            self.profiler.wrote(content, start, end, len(content))
 
     def read(self, **kwargs):
         """Read up to (excluding) `read_termination` or the whole read buffer.
@@ -105,7 +126,15 @@ class Adapter:
         :param \\**kwargs: Keyword arguments for the connection itself.
         :returns str: ASCII response of the instrument (excluding read_termination).
         """
-        read = self._read(**kwargs)
+        if self.profiler is None:
+            read = self._read(**kwargs)
+        else:
+            start = self.profiler.start()
+            try:
+                read = self._read(**kwargs)
+            finally:
+                end = self.profiler.end()
+            self.profiler.read(start, end, len(read))
         self.log.debug("READ:%s", read)
         return read
 
@@ -120,7 +149,15 @@ class Adapter:
         :param \\**kwargs: Keyword arguments for the connection itself.
         :returns bytes: Bytes response of the instrument (including termination).
         """
-        read = self._read_bytes(count, break_on_termchar, **kwargs)
+        if self.profiler is None:
+            read = self._read_bytes(count, break_on_termchar, **kwargs)
+        else:
+            start = self.profiler.start()
+            try:
+                read = self._read_bytes(count, break_on_termchar, **kwargs)
+            finally:
+                end = self.profiler.end()
+            self.profiler.read(start, end, len(read))
         self.log.debug("READ:%s", read)
         return read
 
@@ -0,0 +1,256 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+import re
+from collections import deque
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+# Numeric arguments (after a space or a comma), which are replaced in the command templates.
+_NUMBER = re.compile(r"(?<=[\s,])[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?")
+_COLUMNS = ["instrument", "command", "template", "start", "write_time", "wait_time",
+            "read_time", "bytes_out", "bytes_in"]
+
+
+def command_template(command):
+    """Return the template of a command, with its numeric arguments replaced by :code:`{}`.
+
+    Numbers which are part of the mnemonics (e.g. channel numbers) are kept, such that the
+    template of :code:`"SOUR2:VOLT 1.5"` is :code:`"SOUR2:VOLT {}"`.
+
+    :param command: Command as sent to the instrument (str or bytes).
+    """
+    if command is None:
+        return "<read>"
+    if isinstance(command, (bytes, bytearray)):
+        # Binary messages are identified by their (ASCII) start only.
+        command = command[:32].decode(errors="replace").split("#", 1)[0] + "<bytes>"
+    return _NUMBER.sub("{}", command.strip())
+
+
+class CommunicationRecord:
+    """One message exchange with an instrument: a write and the reads following it.
+
+    All times are in seconds. The wait time is the time between the end of the write and
+    the start of the first read.
+    """
+
+    __slots__ = _COLUMNS
+
+    def __init__(self, instrument, command, start, write_time, bytes_out):
+        self.instrument = instrument
+        self.command = command
+        self.template = command_template(command)
+        self.start = start
+        self.write_time = write_time
+        self.wait_time = 0.
+        self.read_time = 0.
+        self.bytes_out = bytes_out
+        self.bytes_in = 0
+
+    @property
+    def total_time(self):
+        return self.write_time + self.wait_time + self.read_time
+
+    def as_tuple(self):
+        return tuple(getattr(self, name) for name in _COLUMNS)
+
+    def __repr__(self):
+        return (f"<CommunicationRecord({self.instrument!r}, {self.command!r}, "
+                f"{self.total_time * 1e3:.3f} ms)>")
+
+
+class _AdapterProbe:
+    """Connect one adapter to a :class:`CommunicationProfiler`, tracking its current exchange.
+
+    Messages sent while another message is in progress, e.g. the "++read eoi" of a
+    :class:`~pymeasure.adapters.PrologixAdapter` read, are part of the outer message and
+    are not recorded separately.
+    """
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.current = None
+        self.write_end = None
+        self.depth = 0  # Number of messages in progress
+
+    def start(self):
+        """Start timing a message and return the start time."""
+        self.depth += 1
+        return perf_counter()
+
+    def end(self):
+        """End timing a message and return the end time."""
+        self.depth -= 1
+        return perf_counter()
+
+    def wrote(self, command, start, end, size):
+        if self.depth:
+            return  # Part of an outer message
+        self.current = CommunicationRecord(self.name, command, start, end - start, size)
+        self.write_end = end
+        self.profiler.records.append(self.current)
+
+    def read(self, start, end, size):
+        if self.depth:
+            return  # Part of an outer message
+        if self.current is None:
+            # Reading without a preceding write, e.g. a streaming instrument.
+            self.current = CommunicationRecord(self.name, None, start, 0., 0)
+            self.profiler.records.append(self.current)
+        elif self.write_end is not None:
+            self.current.wait_time = start - self.write_end
+        self.write_end = None
+        self.current.read_time += end - start
+        self.current.bytes_in += size
+
+
+class CommunicationProfiler:
+    """Record the timing of the communication of instruments with their adapters.
+
+    The profiler records every write with the reads following it as one
+    :class:`CommunicationRecord` and aggregates them per instrument and per command template
+    (the command with its numeric arguments replaced, see :func:`command_template`).
+    Profiling is opt-in: adapters without an attached profiler do not measure anything.
+
+    .. code-block:: python
+
+        profiler = CommunicationProfiler()
+        profiler.attach(keithley)
+        profiler.attach(lockin, name="lockin")
+        run_sweep()
+        print(profiler.report())
+        df = profiler.summary()  # pandas DataFrame, most expensive commands first
+
+    :param max_records: Maximum number of stored records, older records are discarded.
+        None does not limit the number of records.
+    """
+
+    def __init__(self, max_records=None):
+        self.records = deque(maxlen=max_records)
+        self._adapters = []
+
+    def attach(self, instrument, name=None):
+        """Start profiling the communication of an instrument.
+
+        :param instrument: Instrument or adapter to profile.
+        :param name: Name of the instrument in the reports, defaults to the instrument's name.
+        """
+        adapter = getattr(instrument, "adapter", instrument)
+        if name is None:
+            name = getattr(instrument, "name", repr(adapter))
+        adapter.profiler = _AdapterProbe(self, name)
+        self._adapters.append(adapter)
+
+    def detach(self, instrument=None):
+        """Stop profiling an instrument (or adapter) or, if None, all attached instruments."""
+        adapters = self._adapters if instrument is None else [
+            getattr(instrument, "adapter", instrument)]
+        for adapter in list(adapters):
+            if getattr(adapter, "profiler", None) is not None \
+                    and adapter.profiler.profiler is self:
+                adapter.profiler = None
+            if adapter in self._adapters:
+                self._adapters.remove(adapter)
+
+    def clear(self):
+        """Discard all records."""
+        self.records.clear()
+
+    def to_dataframe(self):
+        """Return all records as a :class:`pandas.DataFrame`, one row per message exchange."""
+        df = pd.DataFrame([record.as_tuple() for record in self.records], columns=_COLUMNS)
+        df["total_time"] = df["write_time"] + df["wait_time"] + df["read_time"]
+        return df
+
+    def summary(self):
+        """Aggregate the records per instrument and command template.
+
+        :return: :class:`pandas.DataFrame` indexed by instrument and template with the number
+            of calls, the summed and mean times, the median and maximum total time,
+            the transferred bytes and the fraction of the overall communication time,
+            sorted by descending total time.
+        """
+        df = self.to_dataframe()
+        grouped = df.groupby(["instrument", "template"])
+        summary = grouped.agg(
+            count=("total_time", "size"),
+            total_time=("total_time", "sum"),
+            mean_time=("total_time", "mean"),
+            median_time=("total_time", "median"),
+            max_time=("total_time", "max"),
+            write_time=("write_time", "sum"),
+            wait_time=("wait_time", "sum"),
+            read_time=("read_time", "sum"),
+            bytes_out=("bytes_out", "sum"),
+            bytes_in=("bytes_in", "sum"),
+        )
+        overall = summary["total_time"].sum()
+        summary["fraction"] = summary["total_time"] / overall if overall else 0.
+        return summary.sort_values("total_time", ascending=False)
+
+    def histograms(self, bins=None, column="total_time"):
+        """Return latency histograms per instrument and command template.
+
+        :param bins: Bin edges in seconds. Defaults to logarithmic bins from 10 µs to 100 s,
+            preceded by a bin from 0 to 10 µs.
+        :param column: Time to histogram, e.g. "total_time", "wait_time" or "read_time".
+        :return: Dictionary of :code:`(instrument, template)` to a tuple of counts and bin edges.
+        """
+        if bins is None:
+            bins = np.concatenate(([0], np.logspace(-5, 2, 15)))
+        df = self.to_dataframe()
+        return {key: np.histogram(group[column], bins=bins)
+                for key, group in df.groupby(["instrument", "template"])}
+
+    def report(self, top=10):
+        """Return a text report of the most expensive commands with their latency histograms.
+
+        :param top: Number of command templates to show.
+        """
+        summary = self.summary().head(top)
+        if summary.empty:
+            return "No communication recorded."
+        total = sum(record.total_time for record in self.records)
+        lines = [f"{len(self.records)} message exchanges, {total:.3f} s in total", ""]
+        lines.append(summary[["count", "total_time", "mean_time", "max_time", "bytes_out",
+                              "bytes_in", "fraction"]].to_string())
+        lines.append("")
+        histograms = self.histograms()
+        for key in summary.index:
+            counts, edges = histograms[key]
+            lines.append(f"{key[0]}: {key[1]}")
+            peak = counts.max()
+            for count, low, high in zip(counts, edges[:-1], edges[1:]):
+                if count:
+                    bar = "#" * max(1, int(round(40 * count / peak)))
+                    lines.append(f"  {low * 1e3:10.3f} - {high * 1e3:10.3f} ms {count:6d} {bar}")
+        return "\n".join(lines)
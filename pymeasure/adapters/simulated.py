@@ -0,0 +1,230 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+import random
+import re
+import time
+
+from .adapter import Adapter
+from .protocol import to_bytes
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+class SimulatedAdapter(Adapter):
+    """Adapter simulating an instrument with realistic timing, for benchmarks without hardware.
+
+    The adapter answers from a response table and/or replays a recorded transcript.
+    Every message takes time: writing and reading transfer the bytes with the given
+    :code:`bandwidth` and the instrument needs :code:`latency` (plus a random jitter) to
+    process a command. The simulated time is accumulated in :attr:`elapsed`; with
+    :code:`sleep=None` the adapter does not actually wait, which allows to account the I/O
+    cost of a procedure without spending it.
+
+    .. code-block:: python
+
+        adapter = SimulatedAdapter(
+            responses={"*IDN?": "ACME,1234", re.compile(r"VOLT .*"): None,
+                       "MEAS?": lambda command: str(random.random())},
+            latency=2e-3, command_latency={"MEAS": 50e-3}, bandwidth=115200 / 10,
+            jitter=0.5e-3)
+        instrument = Instrument(adapter, "Simulated instrument")
+
+    :param responses: Dictionary of the response table. The keys are commands (str) or
+        compiled regular expressions, which have to match the whole command. The values are
+        the responses (str or bytes), None for commands without response, or callables,
+        which get the command and return the response.
+    :param transcript: Communication to replay in order: a list of communication pairs as
+        returned by :func:`pymeasure.generator.parse_stream`, a binary stream or the path of a
+        file containing a log in the test generator's format. A command which is not in
+        :code:`responses` has to match the next pair of the transcript.
+    :param bool loop: Restart the transcript at its end, for repeated benchmark runs.
+    :param bool strict: If False, unknown commands are accepted without response instead
+        of raising a :code:`ValueError`.
+    :param float latency: Processing time of the instrument for each command in seconds.
+    :param dict command_latency: Dictionary of regular expressions (matched at the start of
+        the command) to the processing time of these commands, overriding :code:`latency`.
+    :param bandwidth: Transfer rate of the bus in bytes per second, None for instantaneous
+        transfers.
+    :param float jitter: Maximum of the uniformly distributed random time added to the
+        processing time in seconds.
+    :param seed: Seed of the random generator of the jitter, for reproducible benchmarks.
+    :param sleep: Callable waiting for a time in seconds, None to only account the time in
+        :attr:`elapsed`.
+    :param \\**kwargs: Keyword arguments for the :class:`Adapter`.
+    """
+
+    def __init__(self, responses=None, transcript=None, loop=False, strict=True,
+                 latency=0., command_latency=None, bandwidth=None, jitter=0., seed=None,
+                 sleep=time.sleep, **kwargs):
+        super().__init__(**kwargs)
+        self.responses = {}
+        self.patterns = []
+        for key, value in (responses or {}).items():
+            if isinstance(key, re.Pattern):
+                self.patterns.append((key, value))
+            else:
+                self.responses[key] = value
+        self.transcript = self._load_transcript(transcript)
+        self.loop = loop
+        self.strict = strict
+        self.latency = latency
+        self.command_latency = [(re.compile(pattern), value)
+                                for pattern, value in (command_latency or {}).items()]
+        self.bandwidth = bandwidth
+        self.jitter = jitter
+        self._random = random.Random(seed)
+        self._sleep = sleep
+        self.elapsed = 0.
+        self._index = 0
+        self._read_buffer = None
+        self._pending_latency = 0.
+
+    @staticmethod
+    def _load_transcript(transcript):
+        if transcript is None:
+            return []
+        if isinstance(transcript, (list, tuple)):
+            return [(to_bytes(write), to_bytes(read)) for write, read in transcript]
+        # Imported here, as the generator imports the instruments, which import the adapters.
+        from pymeasure.generator import parse_stream
+        if isinstance(transcript, str):
+            with open(transcript, "rb") as file:
+                return parse_stream(file)
+        return parse_stream(transcript)
+
+    def _wait(self, duration):
+        """Let the simulated time pass."""
+        if duration <= 0:
+            return
+        self.elapsed += duration
+        if self._sleep is not None:
+            self._sleep(duration)
+
+    def _transfer(self, size):
+        if self.bandwidth:
+            self._wait(size / self.bandwidth)
+
+    def processing_time(self, command):
+        """Return the simulated processing time of a command including the random jitter."""
+        duration = self.latency
+        for pattern, value in self.command_latency:
+            if pattern.match(command):
+                duration = value
+                break
+        if self.jitter:
+            duration += self._random.uniform(0, self.jitter)
+        return duration
+
+    def _respond(self, command, content):
+        """Return the response (bytes or None) to a command."""
+        if command in self.responses:
+            response = self.responses[command]
+        else:
+            for pattern, value in self.patterns:
+                if pattern.fullmatch(command):
+                    response = value
+                    break
+            else:
+                return self._replay(content)
+        if callable(response):
+            response = response(command)
+        return to_bytes(response)
+
+    def _peek(self):
+        """Return the next pair of the transcript or None."""
+        if self._index >= len(self.transcript):
+            if not (self.loop and self.transcript):
+                return None
+            self._index = 0
+        return self.transcript[self._index]
+
+    def _replay(self, content):
+        pair = self._peek()
+        if pair is not None and pair[0] == content:
+            self._index += 1
+            return pair[1]
+        if self.strict:
+            raise ValueError(f"No simulated response to the command {content}.")
+        return None
+
+    def _write(self, command, **kwargs):
+        """Simulate writing a command to the instrument."""
+        self._write_bytes(command.encode(), **kwargs)
+
+    def _write_bytes(self, content, **kwargs):
+        """Simulate writing bytes to the instrument."""
+        self._transfer(len(content))
+        command = content.decode(errors="replace")
+        response = self._respond(command, content)
+        if response is None:
+            self._wait(self.processing_time(command))
+        else:
+            # The processing time passes until the response arrives.
+            self._pending_latency = self.processing_time(command)
+            self._read_buffer = response
+
+    def _read(self, **kwargs):
+        """Return the simulated response as a string."""
+        return self._read_bytes(-1).decode()
+
+    def _read_bytes(self, count, break_on_termchar=False, **kwargs):
+        """Return `count` bytes of the simulated response.
+
+        :param int count: Number of bytes to read. If -1, return the whole response.
+        """
+        if self._read_buffer is None:
+            # Reading without a command, e.g. a streaming instrument.
+            pair = self._peek()
+            if pair is None or pair[0] is not None or pair[1] is None:
+                raise ValueError("No simulated response to read.")
+            self._index += 1
+            self._read_buffer = pair[1]
+            self._pending_latency = self.processing_time("")
+        self._wait(self._pending_latency)
+        self._pending_latency = 0.
+        if count == -1 or count >= len(self._read_buffer):
+            read = self._read_buffer
+            self._read_buffer = None
+        else:
+            read = self._read_buffer[:count]
+            self._read_buffer = self._read_buffer[count:]
+        self._transfer(len(read))
+        return read
+
+    def flush_read_buffer(self):
+        """Discard a pending response."""
+        self._read_buffer = None
+        self._pending_latency = 0.
+
+    def rewind(self):
+        """Restart the transcript and reset the simulated time."""
+        self._index = 0
+        self.elapsed = 0.
+        self.flush_read_buffer()
+
+    def __repr__(self):
+        return "<SimulatedAdapter>"
@@ -24,6 +24,7 @@
 
 import logging
 
+from datetime import timedelta
 from os.path import basename
 
 from .Qt import QtCore, QtGui, QtWidgets
@@ -91,6 +92,35 @@ class BrowserItem(QtWidgets.QTreeWidgetItem, BaseBrowserItem):
         self.progressbar.setValue(int(progress))
 
 
+class PendingBrowserItem(QtWidgets.QTreeWidgetItem):
+    """ Represent the not yet generated experiments of a
+    :class:`~pymeasure.display.manager.PendingSequence` as a single row in the
+    :class:`~pymeasure.display.browser.Browser` tree widget
+    """
+
+    def __init__(self, pending, parent=None):
+        super().__init__(parent)
+        self.progressbar = QtWidgets.QProgressBar()
+        self.progressbar.setRange(0, 100)
+        self.progressbar.setValue(0)
+        self.update(pending)
+
+    def update(self, pending):
+        remaining = pending.remaining
+        if remaining is None:
+            self.setText(1, "Sequence (pending)")
+        else:
+            self.setText(1, "Sequence (%d of %d pending)" % (remaining, pending.length))
+            if pending.length:
+                self.progressbar.setValue(int(100 * pending.generated / pending.length))
+
+        eta = pending.eta()
+        if eta is None:
+            self.setText(3, "Pending")
+        else:
+            self.setText(3, "Pending, ETA %s" % timedelta(seconds=int(eta)))
+
+
 class Browser(QtWidgets.QTreeWidget):
     """Graphical list view of :class:`Experiment<pymeasure.display.manager.Experiment>`
     objects allowing the user to view the status of queued Experiments as well as
@@ -146,3 +176,13 @@ class Browser(QtWidgets.QTreeWidget):
         self.addTopLevelItem(item)
         self.setItemWidget(item, 2, item.progressbar)
         return item
+
+    def add_pending(self, pending):
+        """Add a row summarizing the pending entries of a
+        :class:`PendingSequence<pymeasure.display.manager.PendingSequence>` to the Browser.
+        """
+        item = PendingBrowserItem(pending)
+        pending.browser_item = item
+        self.addTopLevelItem(item)
+        self.setItemWidget(item, 2, item.progressbar)
+        return item
@@ -244,9 +244,10 @@ class ManagedConsole(QtCore.QCoreApplication):
 
         """
         if self.filename is not None:
-            return unique_filename(directory, prefix=self.filename, procedure=procedure)
+            return unique_filename(directory, prefix=self.filename, procedure=procedure,
+                                   claim=True)
         else:
-            return unique_filename(directory)
+            return unique_filename(directory, claim=True)
 
     def queue(self):
         procedure = self.procedure_class()
@@ -36,8 +36,15 @@ class ResultsCurve(pg.PlotDataItem):
     """ Creates a curve loaded dynamically from a file through the Results object. The data can
     be forced to fully reload on each update, useful for cases when the data is changing across
     the full file instead of just appending.
+
+    If the results have a downsampled :code:`preview` (see
+    :class:`ResultsLoader<pymeasure.display.loader.ResultsLoader>`), the curve plots the
+    preview, unless the view shows less than :attr:`zoom_threshold` of its x range. The full
+    data of lazily loaded results are only read once the view is zoomed in.
     """
 
+    zoom_threshold = 0.5
+
     def __init__(self, results, x, y, force_reload=False, wdg=None, **kwargs):
         super().__init__(**kwargs)
         self.results = results
@@ -46,16 +53,51 @@ class ResultsCurve(pg.PlotDataItem):
         self.x, self.y = x, y
         self.force_reload = force_reload
         self.color = self.opts['pen'].color()
+        self.full_resolution = False
+        self._preview_bounds = (None, None)
 
-    def update_data(self):
-        """Updates the data by polling the results"""
-        if self.force_reload:
-            self.results.reload()
-        data = self.results.data  # get the current snapshot
+    def update_data(self, data=None):
+        """Updates the data by polling the results
+
+        :param data: Snapshot of the results data (e.g. polled by a
+            :class:`RefreshScheduler<pymeasure.display.refresh.RefreshScheduler>`),
+            None to poll the results.
+        """
+        if self.showing_preview:
+            data = self.results.preview
+        elif data is None:
+            if self.force_reload:
+                self.results.reload()
+            data = self.results.data  # get the current snapshot
 
         # Set x-y data
         self.setData(data[self.x], data[self.y])
 
+    @property
+    def showing_preview(self):
+        """ Whether the curve plots the preview of the results instead of their data """
+        return getattr(self.results, 'preview', None) is not None and not self.full_resolution
+
+    def viewRangeChanged(self, vb=None, ranges=None, changed=None):
+        """Switches between the preview and the full data when zooming"""
+        super().viewRangeChanged(vb, ranges, changed)
+        vb = self.getViewBox()
+        if getattr(self.results, 'preview', None) is None or vb is None:
+            return
+        xmin, xmax = vb.viewRange()[0]
+        if self.full_resolution:
+            low, high = self._preview_bounds
+        else:
+            low, high = self._preview_bounds = self.dataBounds(0)
+        if low is None or not high > low:
+            return
+        # An auto-ranged view shows all data
+        full_resolution = (not vb.autoRangeEnabled()[0]
+                           and (xmax - xmin) < self.zoom_threshold * (high - low))
+        if full_resolution != self.full_resolution:
+            self.full_resolution = full_resolution
+            self.update_data()
+
     def set_color(self, color):
         self.pen.setColor(color)
         self.color = self.opts['pen'].color()
@@ -85,6 +127,7 @@ class ResultsImage(pg.ImageItem):
         self.img_data = np.zeros((self.ysize, self.xsize, 4))
         self.force_reload = force_reload
         self.cm = pg.colormap.get('viridis')
+        self._reset_values()
 
         super().__init__(image=self.img_data)
 
@@ -96,24 +139,61 @@ class ResultsImage(pg.ImageItem):
                      int(self.ystart / self.ystep) - 0.5)  # 0.5 so pixels centered
         self.setTransform(tr)
 
-    def update_data(self):
-        if self.force_reload:
-            self.results.reload()
+    def _reset_values(self):
+        # z values of the pixels (NaN if not measured), filled incrementally
+        self.values = np.full((self.ysize, self.xsize), np.nan)
+        self.img_data[:] = 0
+        self.zmin = np.inf
+        self.zmax = -np.inf
+        self._row_count = 0
+        self._axes = (self.x, self.y, self.z)
 
-        data = self.results.data
-        zmin = data[self.z].min()
-        zmax = data[self.z].max()
+    def update_data(self, data=None):
+        """Updates the image with the rows added to the results since the last update
 
-        # populate the image array with the new data
-        for idx, row in data.iterrows():
-            xdat = row[self.x]
-            ydat = row[self.y]
-            xidx, yidx = self.find_img_index(xdat, ydat)
-            self.img_data[yidx, xidx, :] = self.colormap((row[self.z] - zmin) / (zmax - zmin))
+        :param data: Snapshot of the results data, None to poll the results.
+        """
+        if data is None:
+            if self.force_reload:
+                self.results.reload()
+            data = self.results.data
+        if (self.force_reload or self._axes != (self.x, self.y, self.z)
+                or len(data) < self._row_count):
+            self._reset_values()
+
+        # populate the pixels with the new rows only
+        new = data.iloc[self._row_count:]
+        self._row_count = len(data)
+        if len(new) > 0:
+            z = new[self.z].to_numpy(dtype=float)
+            xidx, yidx = self.find_img_indices(new[self.x].to_numpy(dtype=float),
+                                               new[self.y].to_numpy(dtype=float))
+            self.values[yidx, xidx] = z
+            self.zmin = min(self.zmin, np.nanmin(z))
+            self.zmax = max(self.zmax, np.nanmax(z))
+
+        # the colors of all pixels depend on the z range, map them at once
+        measured = ~np.isnan(self.values)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            normalized = (self.values[measured] - self.zmin) / (self.zmax - self.zmin)
+        self.img_data[measured] = self.colormap(normalized)
 
         # set image data, need to transpose since pyqtgraph assumes column-major order
         self.setImage(image=np.transpose(self.img_data, axes=(1, 0, 2)))
 
+    def find_img_indices(self, x, y):
+        """ Vectorized version of :meth:`find_img_index` for arrays of x and y data. """
+        return (self._indices(x, self.xstart, self.xend, self.xstep, self.xsize),
+                self._indices(y, self.ystart, self.yend, self.ystep, self.ysize))
+
+    @staticmethod
+    def _indices(values, start, end, step, size):
+        indices = np.full(len(values), size - 1)  # default to the final pixel
+        inside = (start <= values) & (values <= end)
+        # round half up, like round_up
+        indices[inside] = np.floor((values[inside] - start) / step + 0.5).astype(int)
+        return indices
+
     def find_img_index(self, x, y):
         """ Finds the integer image indices corresponding to the
         closest x and y points of the data given some x and y data.
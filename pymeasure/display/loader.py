@@ -0,0 +1,183 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from .Qt import QtCore
+from ..experiment.results import Results
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+def read_preview(filename, max_points, should_stop=lambda: False):
+    """ Read a downsampled copy of the data of a file chunk by chunk, without holding
+    the full data in memory.
+
+    Every n-th row (n being a power of two) is kept, such that at most :code:`max_points`
+    rows (and the last row) are kept.
+
+    :param filename: Filename of the data file.
+    :param max_points: Maximum number of rows, None to keep all rows.
+    :param should_stop: Function called between the chunks, reading is cancelled if
+        it returns True.
+    :return: :class:`pandas.DataFrame`, or None if reading was cancelled.
+    """
+    step = 1
+    kept, rows, last = [], 0, None
+    with pd.read_csv(filename, comment=Results.COMMENT,
+                     chunksize=Results.CHUNK_SIZE) as reader:
+        for chunk in reader:
+            if should_stop():
+                return None
+            if len(chunk):
+                last = chunk.iloc[-1:]
+            kept.append(chunk[chunk.index % step == 0])
+            rows += len(kept[-1])
+            if max_points is not None and rows > max_points:
+                preview = pd.concat(kept)
+                while len(preview) > max_points:
+                    step *= 2
+                    preview = preview[preview.index % step == 0]
+                kept, rows = [preview], len(preview)
+    preview = pd.concat(kept)
+    if last is not None and preview.index[-1] != last.index[0]:
+        preview = pd.concat([preview, last])
+    return preview
+
+
+class ResultsLoader(QtCore.QObject):
+    """ Loads data files in background threads, to open many (large) files without
+    blocking the user interface.
+
+    Each file is loaded into a lazy :class:`Results<pymeasure.experiment.results.Results>`
+    object, whose :code:`preview` is set to a downsampled copy of the data (see
+    :func:`read_preview`). Only the preview is kept in memory: a
+    :class:`ResultsCurve<pymeasure.display.curves.ResultsCurve>` plots it and reads the
+    full data only when the view is zoomed in. The signals are emitted in the thread of
+    the loader (the GUI thread).
+
+    .. code-block:: python
+
+        loader = ResultsLoader()
+        loader.loaded.connect(add_experiment)
+        loader.progress.connect(progress_bar.setValue)
+        loader.load(filenames)
+
+    :param max_threads: Number of files loaded in parallel.
+    :param preview_points: Maximum number of rows of the previews.
+    """
+
+    loaded = QtCore.Signal(object)  # Results
+    failed = QtCore.Signal(str, object)  # filename, exception
+    progress = QtCore.Signal(int, int)  # files done, files in total
+    finished = QtCore.Signal()
+    _job_done = QtCore.Signal(str, object, object, object)  # filename, results, exception, stop
+
+    def __init__(self, max_threads=4, preview_points=2000, parent=None):
+        super().__init__(parent)
+        self.preview_points = preview_points
+        self._executor = ThreadPoolExecutor(max_workers=max_threads,
+                                            thread_name_prefix="ResultsLoader")
+        self._stop = threading.Event()
+        self._futures = {}
+        self._done = 0
+        self._total = 0
+        self._job_done.connect(self._finish_job)
+
+    @property
+    def pending(self):
+        """ Filenames which are being loaded """
+        return list(self._futures)
+
+    def is_loading(self):
+        return bool(self._futures)
+
+    def load(self, filenames, procedure_class=None):
+        """ Load data files in the background, emitting :code:`loaded` for each file.
+
+        :param filenames: Filenames of the data files.
+        :param procedure_class: Procedure class of the files, determined from their
+            headers if None.
+        """
+        if not self._futures:
+            # A new batch, independent of cancelled batches
+            self._stop = threading.Event()
+            self._done = self._total = 0
+        for filename in filenames:
+            if filename in self._futures:
+                continue
+            self._total += 1
+            self._futures[filename] = self._executor.submit(
+                self._load, filename, procedure_class, self._stop)
+        self.progress.emit(self._done, self._total)
+
+    def cancel(self):
+        """ Stop loading, files which are not completely loaded are discarded. """
+        if not self._futures:
+            return
+        self._stop.set()
+        for future in self._futures.values():
+            future.cancel()
+        # Running jobs stop at their next chunk of data and are ignored
+        self._futures.clear()
+        self._done = self._total
+        self.progress.emit(self._done, self._total)
+        self.finished.emit()
+
+    def shutdown(self):
+        """ Cancel loading and stop the threads. """
+        self.cancel()
+        self._executor.shutdown(wait=False)
+
+    def _load(self, filename, procedure_class, stop):
+        try:
+            if stop.is_set():
+                results = None
+            else:
+                results = Results.load(filename, procedure_class, lazy=True)
+                results.preview = read_preview(filename, self.preview_points, stop.is_set)
+                if results.preview is None:
+                    results = None
+            self._job_done.emit(filename, results, None, stop)
+        except Exception as exc:
+            self._job_done.emit(filename, None, exc, stop)
+
+    def _finish_job(self, filename, results, exception, stop):
+        if stop.is_set() or self._futures.pop(filename, None) is None:
+            return  # Cancelled
+        self._done += 1
+        if exception is not None:
+            log.error("Failed to load data file %s: %s", filename, exception)
+            self.failed.emit(filename, exception)
+        elif results is not None:
+            self.loaded.emit(results)
+        self.progress.emit(self._done, self._total)
+        if not self._futures:
+            self.finished.emit()
@@ -23,7 +23,9 @@
 #
 
 import logging
+import time
 
+from functools import partial
 from os.path import basename
 
 from .Qt import QtCore
@@ -56,14 +58,100 @@ class Experiment(QtCore.QObject):
         self.browser_item = browser_item
 
 
+class PendingSequence(QtCore.QObject):
+    """ Represents a sequence of measurements whose experiments are only
+    generated when the :class:`BaseManager` is about to run them, instead of
+    creating all the procedures, data files and experiments up front.
+
+    Each entry of the sequence is passed to :code:`queue_callable`, which is
+    expected to queue a single experiment on the manager (e.g. through the
+    :code:`queue` method of a
+    :class:`~pymeasure.display.windows.managed_window.ManagedWindow`).
+    The sequence is consumed lazily, such that it can also be a generator.
+
+    :param sequence: iterable of sequence entries
+    :param queue_callable: callable that queues the experiment of one entry
+    :param length: total number of entries; if not given, :code:`len(sequence)` is used
+        when available
+    :param parent: parent QObject
+    """
+
+    def __init__(self, sequence, queue_callable, length=None, parent=None):
+        super().__init__(parent)
+        if length is None and hasattr(sequence, '__len__'):
+            length = len(sequence)
+        self.length = length
+        self.generated = 0
+        self.browser_item = None
+        self._queue_callable = queue_callable
+        self._iterator = iter(sequence)
+        self._total_duration = 0.
+        self._finished_count = 0
+        self._last_experiment = None
+        self._fetch_entry()
+
+    def _fetch_entry(self):
+        try:
+            self._next_entry = next(self._iterator)
+        except StopIteration:
+            self._next_entry = None
+            self._iterator = iter(())
+
+    def has_next(self):
+        """ Returns True if the sequence has entries left to be queued """
+        return self._next_entry is not None
+
+    @property
+    def remaining(self):
+        """ Number of entries that have not been queued yet, or None if unknown """
+        if self.length is None:
+            return None if self.has_next() else 0
+        return self.length - self.generated
+
+    def queue_next(self):
+        """ Queue the experiment of the next entry of the sequence """
+        if not self.has_next():
+            raise StopIteration("The sequence has no pending entries")
+        entry = self._next_entry
+        self._fetch_entry()
+        self.generated += 1
+        self._queue_callable(entry)
+
+    def experiment_queued(self, experiment):
+        """ Registers an experiment generated from this sequence """
+        self._last_experiment = experiment
+
+    def experiment_finished(self, experiment, duration):
+        """ Takes the duration of a finished experiment into account for the ETA,
+        if the experiment was generated from this sequence.
+        """
+        if experiment is self._last_experiment:
+            self._total_duration += duration
+            self._finished_count += 1
+
+    def eta(self):
+        """ Returns the estimated time (in seconds) needed to run the pending
+        entries, based on the mean duration of the finished experiments of this
+        sequence, or None if no estimate is available yet.
+        """
+        remaining = self.remaining
+        if self._finished_count == 0 or remaining is None:
+            return None
+        return remaining * self._total_duration / self._finished_count
+
+
 class ExperimentQueue(QtCore.QObject):
     """ Represents a queue of Experiments and allows queries to
     be easily preformed.
+
+    Besides the Experiments, the queue holds :class:`PendingSequence` objects,
+    whose experiments are generated by the :class:`BaseManager` when needed.
     """
 
     def __init__(self):
         super().__init__()
         self.queue = []
+        self.pending = []
 
     def append(self, experiment):
         self.queue.append(experiment)
@@ -99,8 +187,8 @@ class ExperimentQueue(QtCore.QObject):
                 return experiment
         raise StopIteration("There are no queued experiments")
 
-    def has_next(self):
-        """ Returns True if another item is on the queue
+    def has_queued(self):
+        """ Returns True if a queued experiment is on the queue
         """
         try:
             self.next()
@@ -109,6 +197,14 @@ class ExperimentQueue(QtCore.QObject):
 
         return True
 
+    def has_next(self):
+        """ Returns True if another item is on the queue, including
+        experiments of pending sequences that are not generated yet
+        """
+        if self.has_queued():
+            return True
+        return any(pending.has_next() for pending in self.pending)
+
     def with_browser_item(self, item):
         for experiment in self.queue:
             if experiment.browser_item is item:
@@ -116,10 +212,39 @@ class ExperimentQueue(QtCore.QObject):
         return None
 
 
+class _RunningExperiment:
+    """ Bookkeeping of an experiment which is being run by a :class:`.Worker` """
+
+    def __init__(self, worker, monitor, slot, resources):
+        self.worker = worker
+        self.monitor = monitor
+        self.slot = slot
+        self.resources = resources
+        self.start_time = time.time()
+
+
 class BaseManager(QtCore.QObject):
     """Controls the execution of :class:`.Experiment` classes by implementing
     a queue system in which Experiments are added, removed, executed, or
     aborted.
+
+    By default, the experiments are run one after the other. If :code:`max_workers`
+    is larger than one, up to that number of experiments are run in parallel, each
+    by its own :class:`.Worker`. Only experiments whose procedures use disjoint
+    resources (see :meth:`Procedure.get_resources
+    <pymeasure.experiment.procedure.Procedure.get_resources>`) run at the same time;
+    procedures which do not declare their resources are always run on their own.
+    Experiments are started in the order of the queue, and an experiment waiting for
+    a resource is not overtaken by later experiments needing the same resource.
+    The Worker of the n-th parallel slot publishes on :code:`port + n`.
+
+    :param port: TCP port on which the Workers publish their messages
+    :param log_level: logging level of the Workers
+    :param max_workers: maximum number of experiments which are run in parallel
+    :param worker_class: class of the Workers running the experiments, e.g.
+        :class:`~pymeasure.experiment.workers.ProcessWorker` to run each procedure in a
+        separate process
+    :param parent: parent QObject
     """
     _is_continuous = True
     _start_on_add = True
@@ -129,38 +254,49 @@ class BaseManager(QtCore.QObject):
     failed = QtCore.Signal(object)
     aborted = QtCore.Signal(object)
     abort_returned = QtCore.Signal(object)
+    sequence_queued = QtCore.Signal(object)
     log = QtCore.Signal(object)
 
-    def __init__(self, port=5888, log_level=logging.INFO, parent=None):
+    def __init__(self, port=5888, log_level=logging.INFO, max_workers=1, worker_class=Worker,
+                 parent=None):
         super().__init__(parent)
 
         self.experiments = ExperimentQueue()
-        self._worker = None
-        self._running_experiment = None
-        self._monitor = None
+        self._running_experiments = {}
+        self._generating = None
         self.log_level = log_level
+        self.max_workers = max_workers
+        self.worker_class = worker_class
 
         self.port = port
 
     def is_running(self):
         """ Returns True if a procedure is currently running
         """
-        return self._running_experiment is not None
+        return len(self._running_experiments) > 0
 
     def running_experiment(self):
+        """ Returns the running experiment. If several experiments are running,
+        the one started first is returned.
+        """
         if self.is_running():
-            return self._running_experiment
+            return next(iter(self._running_experiments))
         else:
             raise Exception("There is no Experiment running")
 
-    def _update_progress(self, progress):
-        if self.is_running():
-            self._running_experiment.browser_item.setProgress(progress)
+    def running_experiments(self):
+        """ Returns a list of the running experiments
+        """
+        return list(self._running_experiments)
 
-    def _update_status(self, status):
-        if self.is_running():
-            self._running_experiment.procedure.status = status
-            self._running_experiment.browser_item.setStatus(status)
+    def _update_progress(self, experiment, progress):
+        if experiment in self._running_experiments:
+            experiment.browser_item.setProgress(progress)
+
+    def _update_status(self, experiment, status):
+        if experiment in self._running_experiments:
+            experiment.procedure.status = status
+            experiment.browser_item.setStatus(status)
 
     def _update_log(self, record):
         self.log.emit(record)
@@ -174,8 +310,19 @@ class BaseManager(QtCore.QObject):
         """ Adds an experiment to the queue.
         """
         self.load(experiment)
+        if self._generating is not None:
+            self._generating.experiment_queued(experiment)
         self.queued.emit(experiment)
-        if self._start_on_add and not self.is_running():
+        if self._start_on_add and self._has_free_worker() and self._generating is None:
+            self.next()
+
+    def queue_sequence(self, pending):
+        """ Adds a :class:`PendingSequence` to the queue. Its experiments are
+        generated one at a time, when the previously queued experiments are done.
+        """
+        self.experiments.pending.append(pending)
+        self.sequence_queued.emit(pending)
+        if self._start_on_add and self._has_free_worker():
             self.next()
 
     def remove(self, experiment):
@@ -183,71 +330,173 @@ class BaseManager(QtCore.QObject):
         """
         self.experiments.remove(experiment)
 
+    def remove_sequence(self, pending):
+        """ Removes a :class:`PendingSequence`, discarding its pending entries
+        """
+        self.experiments.pending.remove(pending)
+
     def clear(self):
-        """ Remove all Experiments
+        """ Remove all Experiments and pending sequences
         """
+        for pending in self.experiments.pending[:]:
+            self.remove_sequence(pending)
         for experiment in self.experiments[:]:
             self.remove(experiment)
 
+    def _update_sequence(self, pending):
+        """ Called after an experiment of a pending sequence has been generated
+        """
+        pass
+
+    def _queue_pending(self):
+        """ Generates experiments from the pending sequences until a queued
+        experiment is available or all pending sequences are exhausted.
+        """
+        while not self._has_waiting() and self.experiments.pending:
+            pending = self.experiments.pending[0]
+            if not pending.has_next():
+                self.remove_sequence(pending)
+                continue
+
+            self._generating = pending
+            try:
+                pending.queue_next()
+            except Exception:
+                log.error("Failed to queue the next experiment of a sequence, "
+                          "discarding the remaining entries", exc_info=True)
+                self.remove_sequence(pending)
+                continue
+            finally:
+                self._generating = None
+
+            if pending.has_next():
+                self._update_sequence(pending)
+            else:
+                self.remove_sequence(pending)
+
+    def _has_free_worker(self):
+        return len(self._running_experiments) < self.max_workers
+
+    def _waiting(self):
+        """ Returns the queued experiments which are not started yet """
+        return [experiment for experiment in self.experiments.queue
+                if experiment.procedure.status == Procedure.QUEUED
+                and experiment not in self._running_experiments]
+
+    def _has_waiting(self):
+        return len(self._waiting()) > 0
+
+    @staticmethod
+    def _resources(experiment):
+        """ Returns the resources of the experiment's procedure, or None if the
+        procedure requires exclusive use of all resources
+        """
+        resources = experiment.procedure.get_resources()
+        return None if resources is None else frozenset(resources)
+
+    def _startable(self):
+        """ Returns the experiments which can be started now, in the order of the
+        queue. The resources of experiments which have to wait are reserved, such
+        that they are not overtaken by later experiments needing the same resources.
+        """
+        reserved = set()
+        exclusive = False
+        for running in self._running_experiments.values():
+            if running.resources is None:
+                exclusive = True
+            else:
+                reserved |= running.resources
+
+        startable = []
+        free_workers = self.max_workers - len(self._running_experiments)
+        for experiment in self._waiting():
+            if exclusive or free_workers == 0:
+                break
+            resources = self._resources(experiment)
+            if resources is None:
+                # Running experiments without resources do not reserve any
+                if not (reserved or startable or self._running_experiments):
+                    startable.append(experiment)
+                exclusive = True
+            else:
+                if reserved.isdisjoint(resources):
+                    startable.append(experiment)
+                    free_workers -= 1
+                reserved |= resources
+        return startable
+
     def next(self):
-        """ Initiates the start of the next experiment in the queue as long
-        as no other experiments are currently running and there is a procedure
-        in the queue.
+        """ Initiates the start of the next experiments in the queue as long
+        as workers are available and there is a procedure in the queue whose
+        resources are not in use.
         """
-        if self.is_running():
+        if not self._has_free_worker():
             raise Exception("Another procedure is already running")
         else:
-            if self.experiments.has_next():
-                log.debug("Manager is initiating the next experiment")
-                experiment = self.experiments.next()
-                self._running_experiment = experiment
-
-                self._worker = Worker(experiment.results, port=self.port, log_level=self.log_level)
-
-                self._monitor = Monitor(self._worker.monitor_queue)
-                self._monitor.worker_running.connect(self._running)
-                self._monitor.worker_failed.connect(self._failed)
-                self._monitor.worker_abort_returned.connect(self._abort_returned)
-                self._monitor.worker_finished.connect(self._finish)
-                self._monitor.progress.connect(self._update_progress)
-                self._monitor.status.connect(self._update_status)
-                self._monitor.log.connect(self._update_log)
-
-                self._monitor.start()
-                self._worker.start()
-
-    def _running(self):
-        if self.is_running():
-            self.running.emit(self._running_experiment)
-
-    def _clean_up(self):
-        self._worker.join()
-        del self._worker
-        self._monitor.wait()
-        del self._monitor
-        self._worker = None
-        self._running_experiment = None
+            self._queue_pending()
+            for experiment in self._startable():
+                self._start(experiment)
+
+    def _start(self, experiment):
+        log.debug("Manager is initiating the next experiment")
+        used_slots = {running.slot for running in self._running_experiments.values()}
+        slot = min(set(range(self.max_workers)) - used_slots)
+        port = None if self.port is None else self.port + slot
+
+        worker = self.worker_class(experiment.results, port=port, log_level=self.log_level)
+
+        monitor = Monitor(worker.monitor_queue)
+        monitor.worker_running.connect(partial(self._running, experiment))
+        monitor.worker_failed.connect(partial(self._failed, experiment))
+        monitor.worker_abort_returned.connect(partial(self._abort_returned, experiment))
+        monitor.worker_finished.connect(partial(self._finish, experiment))
+        monitor.progress.connect(partial(self._update_progress, experiment))
+        monitor.status.connect(partial(self._update_status, experiment))
+        monitor.log.connect(self._update_log)
+
+        self._running_experiments[experiment] = _RunningExperiment(
+            worker, monitor, slot, self._resources(experiment))
+        monitor.start()
+        worker.start()
+
+    def _running(self, experiment):
+        if experiment in self._running_experiments:
+            self.running.emit(experiment)
+
+    def _clean_up(self, experiment):
+        running = self._running_experiments.pop(experiment)
+        running.worker.join()
+        running.monitor.wait()
         log.debug("Manager has cleaned up after the Worker")
 
-    def _failed(self):
+    def _sequence_finished(self, experiment):
+        duration = time.time() - self._running_experiments[experiment].start_time
+        for pending in self.experiments.pending:
+            pending.experiment_finished(experiment, duration)
+            self._update_sequence(pending)
+
+    def _failed(self, experiment):
         log.debug("Manager's running experiment has failed")
-        experiment = self._running_experiment
-        self._clean_up()
+        self._clean_up(experiment)
         self.failed.emit(experiment)
 
-    def _abort_returned(self):
+    def _abort_returned(self, experiment):
         log.debug("Manager's running experiment has returned after an abort")
-        experiment = self._running_experiment
-        self._clean_up()
+        self._clean_up(experiment)
         self.abort_returned.emit(experiment)
 
-    def _finish(self):
+    def _finish(self, experiment):
         log.debug("Manager's running experiment has finished")
-        experiment = self._running_experiment
-        self._clean_up()
+        self._sequence_finished(experiment)
+        self._clean_up(experiment)
         experiment.browser_item.setProgress(100)
         self.finished.emit(experiment)
-        if self._is_continuous:  # Continue running procedures
+        self._continue()
+
+    def _continue(self):
+        """ Start further experiments, if the queue is processed continuously
+        """
+        if self._is_continuous and self._has_free_worker():  # Continue running procedures
             self.next()
 
     def resume(self):
@@ -255,10 +504,11 @@ class BaseManager(QtCore.QObject):
         """
         self._start_on_add = True
         self._is_continuous = True
-        self.next()
+        if self._has_free_worker():
+            self.next()
 
     def abort(self):
-        """ Aborts the currently running Experiment, but raises an exception if
+        """ Aborts the currently running Experiments, but raises an exception if
         there is no running experiment
         """
         if not self.is_running():
@@ -268,9 +518,9 @@ class BaseManager(QtCore.QObject):
             self._start_on_add = False
             self._is_continuous = False
 
-            self._worker.stop()
-
-            self.aborted.emit(self._running_experiment)
+            for experiment, running in list(self._running_experiments.items()):
+                running.worker.stop()
+                self.aborted.emit(experiment)
 
 
 class Manager(BaseManager):
@@ -281,20 +531,14 @@ class Manager(BaseManager):
         in accordance with the execution status of the Experiments.
         """
 
-    def __init__(self, widget_list, browser, port=5888, log_level=logging.INFO, parent=None):
-        super().__init__(parent)
-
-        self.experiments = ExperimentQueue()
-        self._worker = None
-        self._running_experiment = None
-        self._monitor = None
-        self.log_level = log_level
+    def __init__(self, widget_list, browser, port=5888, log_level=logging.INFO, max_workers=1,
+                 worker_class=Worker, parent=None):
+        super().__init__(port=port, log_level=log_level, max_workers=max_workers,
+                         worker_class=worker_class, parent=parent)
 
         self.widget_list = widget_list
         self.browser = browser
 
-        self.port = port
-
     def load(self, experiment):
         """ Load a previously executed Experiment
         """
@@ -317,14 +561,31 @@ class Manager(BaseManager):
             if curve:
                 curve.wdg.remove(curve)
 
-    def _finish(self):
+    def queue_sequence(self, pending):
+        """ Adds a :class:`PendingSequence` to the queue and represents its
+        pending entries by a single row in the browser
+        """
+        self.browser.add_pending(pending)
+        super().queue_sequence(pending)
+
+    def remove_sequence(self, pending):
+        """ Removes a :class:`PendingSequence`, discarding its pending entries
+        """
+        super().remove_sequence(pending)
+
+        self.browser.takeTopLevelItem(
+            self.browser.indexOfTopLevelItem(pending.browser_item))
+
+    def _update_sequence(self, pending):
+        pending.browser_item.update(pending)
+
+    def _finish(self, experiment):
         log.debug("Manager's running experiment has finished")
-        experiment = self._running_experiment
-        self._clean_up()
+        self._sequence_finished(experiment)
+        self._clean_up(experiment)
         experiment.browser_item.setProgress(100)
         for curve in experiment.curve_list:
             if curve:
                 curve.update_data()
         self.finished.emit(experiment)
-        if self._is_continuous:  # Continue running procedures
-            self.next()
+        self._continue()
@@ -0,0 +1,154 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import logging
+import time
+import weakref
+
+from .Qt import QtCore
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+class RefreshScheduler(QtCore.QObject):
+    """ Refreshes the plots and tables of several widgets with a single timer.
+
+    On each tick, the scheduler asks every registered widget for the items to update
+    (curves, images or tables), polls the data of each
+    :class:`Results<pymeasure.experiment.results.Results>` object once and passes the
+    snapshot to all items showing these results. Items whose
+    results did not change since their last refresh are skipped, and widgets which are
+    not visible (e.g. in a hidden tab) are only refreshed once they are shown again.
+
+    If a refresh takes longer than the fraction :code:`max_load` of the refresh time, the
+    interval is stretched (up to :code:`max_refresh_time`), such that redrawing large
+    data sets does not block the user interface.
+
+    A widget registered with :meth:`register` has to implement :code:`refresh_items(force)`,
+    returning the items to refresh (each with a :code:`results` attribute and an
+    :code:`update_data(data)` method), and can implement :code:`refreshed()`, which is called
+    after each tick.
+
+    :param refresh_time: Nominal time between two refreshes in seconds.
+    :param adaptive: Whether to stretch the interval if refreshing takes long.
+    :param max_load: Maximum fraction of the time spent refreshing.
+    :param max_refresh_time: Maximum time between two refreshes in seconds.
+    """
+
+    _shared = {}
+
+    def __init__(self, refresh_time=0.2, adaptive=True, max_load=0.5, max_refresh_time=2.,
+                 parent=None):
+        super().__init__(parent)
+        self.refresh_time = refresh_time
+        self.adaptive = adaptive
+        self.max_load = max_load
+        self.max_refresh_time = max_refresh_time
+        self.interval = refresh_time
+        self.last_duration = 0.
+        self.widgets = []
+        self._stale = set()  # ids of widgets skipped while hidden
+        self._rows = weakref.WeakKeyDictionary()  # rows of the last update of each item
+        self.timer = QtCore.QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+
+    @classmethod
+    def shared(cls, refresh_time=0.2):
+        """ Return the scheduler shared by all widgets with this refresh time. """
+        if refresh_time not in cls._shared:
+            cls._shared[refresh_time] = cls(refresh_time)
+        return cls._shared[refresh_time]
+
+    def register(self, widget):
+        """ Refresh a widget on each tick, starting the timer if necessary. """
+        if widget not in self.widgets:
+            self.widgets.append(widget)
+            widget.destroyed.connect(lambda *args: self.unregister(widget))
+        if not self.timer.isActive():
+            self.timer.start(int(self.interval * 1e3))
+
+    def unregister(self, widget):
+        """ Stop refreshing a widget, stopping the timer without widgets. """
+        if widget in self.widgets:
+            self.widgets.remove(widget)
+        self._stale.discard(id(widget))
+        if not self.widgets:
+            try:
+                self.timer.stop()
+            except RuntimeError:
+                pass  # The timer has been deleted, e.g. on exit
+
+    def refresh(self):
+        """ Refresh the items of all visible widgets, polling each results object once. """
+        start = time.perf_counter()
+        snapshots = {}
+        for widget in list(self.widgets):
+            try:
+                visible = widget.isVisible()
+            except RuntimeError:  # The underlying Qt object has been deleted
+                self.unregister(widget)
+                continue
+            if not visible:
+                self._stale.add(id(widget))
+                continue
+            force = id(widget) in self._stale
+            self._stale.discard(id(widget))
+            for item in widget.refresh_items(force):
+                self._update_item(item, snapshots)
+        for widget in list(self.widgets):
+            if hasattr(widget, "refreshed"):
+                widget.refreshed()
+        self.last_duration = time.perf_counter() - start
+        self._adapt()
+
+    def _update_item(self, item, snapshots):
+        if getattr(item, "showing_preview", False):
+            # The preview does not change, do not read the (lazily loaded) data
+            if item not in self._rows:
+                item.update_data()
+                self._rows[item] = None
+            return
+        results = item.results
+        reload = getattr(item, "force_reload", False)
+        if id(results) not in snapshots:
+            if reload:
+                results.reload()
+            snapshots[id(results)] = results.data
+        data = snapshots[id(results)]
+        if not reload and self._rows.get(item) == len(data):
+            return  # No new rows since the last update
+        item.update_data(data)
+        self._rows[item] = len(data)
+
+    def _adapt(self):
+        if not self.adaptive:
+            return
+        interval = min(max(self.last_duration / self.max_load, self.refresh_time),
+                       self.max_refresh_time)
+        if abs(interval - self.interval) > 0.1 * self.interval:
+            self.interval = interval
+            log.debug("Refresh interval changed to %g s", interval)
+            self.timer.setInterval(int(interval * 1e3))
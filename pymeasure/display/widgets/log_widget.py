@@ -23,6 +23,7 @@
 #
 
 import logging
+from collections import deque
 
 from ..log import LogHandler
 from ..Qt import QtWidgets, QtCore, QtGui
@@ -66,16 +67,31 @@ class HTMLFormatter(logging.Formatter):
         return formatted
 
 
+# Messages of these levels (see HTMLFormatter) are never dropped
+_IMPORTANT = ("<!--WARNING-->", "<!--ERROR-->", "<!--CRITICAL-->")
+
+
 class LogWidget(TabWidget, QtWidgets.QWidget):
     """ Widget to display logging information in GUI
 
     It is recommended to include this widget in all subclasses of
     :class:`ManagedWindowBase<pymeasure.display.windows.managed_window.ManagedWindowBase>`
+
+    The messages are collected and appended in batches every
+    :attr:`flush_interval` milliseconds, such that a flood of log messages
+    does not block the GUI. Consecutive identical messages are shown once
+    with their count, at most :attr:`max_pending` messages are kept between
+    two batches (older ones are dropped and counted, but never warnings and
+    errors) and the view retains at most :attr:`max_blocks` messages.
     """
 
     fmt = '%(asctime)s : %(message)s (%(levelname)s)'
     datefmt = '%m/%d/%Y %I:%M:%S %p'
 
+    flush_interval = 100  # ms
+    max_pending = 1000
+    max_blocks = 10000
+
     tab_widget = None
     tab_index = None
 
@@ -100,12 +116,52 @@ class LogWidget(TabWidget, QtWidgets.QWidget):
     def _setup_ui(self):
         self.view = QtWidgets.QPlainTextEdit()
         self.view.setReadOnly(True)
+        self.view.setMaximumBlockCount(self.max_blocks)
         self.handler = LogHandler()
         self.handler.setFormatter(HTMLFormatter(
             fmt=self.fmt,
             datefmt=self.datefmt,
         ))
-        self.handler.connect(self.view.appendHtml)
+        # Pending messages as [message, repetitions] lists
+        self._pending = deque()
+        self._dropped = 0
+        self.handler.connect(self._enqueue)
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self.flush)
+
+    def _enqueue(self, message):
+        if self._pending and self._pending[-1][0] == message:
+            self._pending[-1][1] += 1
+        else:
+            if len(self._pending) >= self.max_pending:
+                self._drop_oldest()
+            self._pending.append([message, 1])
+        if not self._flush_timer.isActive():
+            self._flush_timer.start(self.flush_interval)
+
+    def _drop_oldest(self):
+        """Drop the oldest pending message below WARNING level, if any."""
+        for i, (message, repetitions) in enumerate(self._pending):
+            if not message.startswith(_IMPORTANT):
+                del self._pending[i]
+                self._dropped += repetitions
+                return
+
+    def flush(self):
+        """Append the pending messages to the view."""
+        paragraphs = []
+        if self._dropped:
+            paragraphs.append(f"<p><!--WARNING--><font color=\"DarkOrange\">"
+                              f"{self._dropped} log messages dropped</font></p>")
+            self._dropped = 0
+        for message, repetitions in self._pending:
+            if repetitions > 1:
+                message += f" [repeated {repetitions} times]"
+            paragraphs.append(f"<p>{message}</p>")
+        self._pending.clear()
+        if paragraphs:
+            self.view.appendHtml("".join(paragraphs))
 
     def _layout(self):
         vbox = QtWidgets.QVBoxLayout(self)
@@ -132,13 +188,6 @@ class LogWidget(TabWidget, QtWidgets.QWidget):
             self.tab_widget.setTabIcon(self.tab_index, QtGui.QIcon())
 
     def _blinking_start(self, message):
-        # Delayed setup, since only now the widget is added to the TabWidget
-        if self.tab_widget is None:
-            self.tab_widget = self.parent().parent()
-            self.tab_index = self.tab_widget.indexOf(self)
-            self.tab_widget.tabBar().setIconSize(QtCore.QSize(12, 12))
-            self.tab_widget.tabBar().currentChanged.connect(self._blinking_stop)
-
         if message.startswith("<!--ERROR-->") or message.startswith("<!--CRITICAL-->"):
             error = True
         elif message.startswith("<!--WARNING-->"):
@@ -146,6 +195,15 @@ class LogWidget(TabWidget, QtWidgets.QWidget):
         else:  # no blinking
             return
 
+        # Delayed setup, since only now the widget is added to the TabWidget
+        if self.tab_widget is None:
+            if self.parent() is None:  # not in a TabWidget
+                return
+            self.tab_widget = self.parent().parent()
+            self.tab_index = self.tab_widget.indexOf(self)
+            self.tab_widget.tabBar().setIconSize(QtCore.QSize(12, 12))
+            self.tab_widget.tabBar().currentChanged.connect(self._blinking_stop)
+
         # Check if the current tab is actually the log-tab
         if self.tab_widget.currentIndex() == self.tab_index:
             self._blinking_stop(self.tab_widget.currentIndex())
@@ -29,6 +29,7 @@ import pyqtgraph as pg
 
 from ..curves import ResultsCurve, Crosshairs
 from ..Qt import QtCore, QtWidgets
+from ..refresh import RefreshScheduler
 from ...experiment import Procedure
 
 log = logging.getLogger(__name__)
@@ -39,6 +40,10 @@ class PlotFrame(QtWidgets.QFrame):
     """ Combines a PyQtGraph Plot with Crosshairs. Refreshes
     the plot based on the refresh_time, and allows the axes
     to be changed on the fly, which updates the plotted data
+
+    The plot is refreshed by the
+    :class:`RefreshScheduler<pymeasure.display.refresh.RefreshScheduler>` shared by all
+    widgets with the same refresh_time.
     """
 
     LABEL_STYLE = {'font-size': '10pt', 'font-family': 'Arial', 'color': '#000000'}
@@ -81,23 +86,28 @@ class PlotFrame(QtWidgets.QFrame):
                                                   style=QtCore.Qt.PenStyle.DashLine))
         self.crosshairs.coordinates.connect(self.update_coordinates)
 
-        self.timer = QtCore.QTimer(self)
-        self.timer.timeout.connect(self.update_curves)
-        self.timer.timeout.connect(self.crosshairs.update)
-        self.timer.timeout.connect(self.updated)
-        self.timer.start(int(self.refresh_time * 1e3))
+        if self.refresh_time is not None:
+            self.scheduler = RefreshScheduler.shared(self.refresh_time)
+            self.scheduler.register(self)
 
     def update_coordinates(self, x, y):
         self.coordinates.setText(f"({x:g}, {y:g})")
 
+    def refresh_items(self, force=False):
+        """ Return the curves to refresh, i.e. those of running procedures if
+        check_status is set, or all curves if forced """
+        return [item for item in self.plot.items
+                if isinstance(item, self.ResultsClass) and (
+                    force or not self.check_status
+                    or item.results.procedure.status == Procedure.RUNNING)]
+
+    def refreshed(self):
+        self.crosshairs.update()
+        self.updated.emit()
+
     def update_curves(self):
-        for item in self.plot.items:
-            if isinstance(item, self.ResultsClass):
-                if self.check_status:
-                    if item.results.procedure.status == Procedure.RUNNING:
-                        item.update_data()
-                else:
-                    item.update_data()
+        for item in self.refresh_items():
+            item.update_data()
 
     def parse_axis(self, axis):
         """ Returns the units of an axis by searching the string
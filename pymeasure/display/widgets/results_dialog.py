@@ -25,19 +25,48 @@
 import logging
 
 import os
+import sqlite3
 
 from ..Qt import QtCore, QtWidgets
+from ...experiment.index import ResultsIndex
 from ...experiment.results import Results
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 
+class ResultsFilterModel(QtCore.QSortFilterProxyModel):
+    """ Filter the files shown by a file dialog to a set of filenames, showing all
+    directories """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.filenames = None
+
+    def set_filenames(self, filenames):
+        """ Show only these files, or all files if None """
+        if filenames is not None:
+            filenames = {os.path.normpath(filename) for filename in filenames}
+        self.filenames = filenames
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self.filenames is None:
+            return True
+        model = self.sourceModel()
+        index = model.index(source_row, 0, source_parent)
+        return model.isDir(index) or os.path.normpath(model.filePath(index)) in self.filenames
+
+
 class ResultsDialog(QtWidgets.QFileDialog):
     """
     Widget that displays a dialog box for loading a past experiment run.
     It shows a preview of curves from the results file when selected in the dialog box.
 
+    The files can be filtered by their parameters and metadata with conditions like
+    "Field > 1 T, Sample = A3", using the
+    :class:`ResultsIndex<pymeasure.experiment.index.ResultsIndex>` of the directory.
+
     This widget used by the `open_experiment` method in
     :class:`ManagedWindowBase<pymeasure.display.windows.managed_window.ManagedWindowBase>` class
     """
@@ -85,7 +114,17 @@ class ResultsDialog(QtWidgets.QFileDialog):
         metadata_vbox_widget.setLayout(metadata_vbox)
         preview_tab.addTab(param_vbox_widget, "Run Parameters")
         preview_tab.addTab(metadata_vbox_widget, "Metadata")
-        self.layout().addWidget(preview_tab, 0, 5, 4, 1)
+        self.filter_label = QtWidgets.QLabel("Filter:")
+        self.filter_edit = QtWidgets.QLineEdit()
+        self.filter_edit.setPlaceholderText("e.g. Field > 1 T, Sample = A3")
+        self.filter_edit.editingFinished.connect(self.update_filter)
+        self.filter_model = ResultsFilterModel(self)
+        self.setProxyModel(self.filter_model)
+        self.directoryEntered.connect(self.update_filter)
+        self.layout().addWidget(self.filter_label, 4, 0)
+        self.layout().addWidget(self.filter_edit, 4, 1, 1, 2)
+
+        self.layout().addWidget(preview_tab, 0, 5, 5, 1)
         self.layout().setColumnStretch(5, 1)
         self.setMinimumSize(900, 500)
         self.resize(900, 500)
@@ -93,6 +132,25 @@ class ResultsDialog(QtWidgets.QFileDialog):
         self.setFileMode(QtWidgets.QFileDialog.FileMode.ExistingFiles)
         self.currentChanged.connect(self.update_preview)
 
+    def update_filter(self):
+        """ Show only the results files fulfilling the conditions of the filter """
+        conditions = [condition for condition in self.filter_edit.text().split(",")
+                      if condition.strip()]
+        if not conditions:
+            self.filter_model.set_filenames(None)
+            self.filter_edit.setToolTip("")
+            return
+        try:
+            with ResultsIndex(self.directory().absolutePath()) as index:
+                index.update()
+                filenames = index.query(*conditions)
+        except (ValueError, OSError, sqlite3.Error) as exc:
+            log.warning("Invalid results filter: %s", exc)
+            self.filter_edit.setToolTip(str(exc))
+            return
+        self.filter_edit.setToolTip(f"{len(filenames)} matching files")
+        self.filter_model.set_filenames(filenames)
+
     def update_preview(self, filename):
         # Add preview tabs as appropriate
         if not os.path.isdir(filename) and filename != '':
@@ -25,9 +25,9 @@ import logging
 import os
 from functools import partial
 from inspect import signature
-from collections import ChainMap
 
 from ..Qt import QtCore, QtWidgets, QtGui
+from ..manager import PendingSequence
 from ...experiment.sequencer import SequenceHandler, SequenceEvaluationError
 
 log = logging.getLogger(__name__)
@@ -532,10 +532,18 @@ class SequencerWidget(QtWidgets.QWidget):
     def get_sequence(self):
         return self.data.parameters_sequence(self.names_inv)
 
-    def queue_sequence(self):
+    def queue_sequence(self, *, start=0, skip=()):
         """
-        Obtain a list of parameters from the sequence tree, enter these into
-        procedures, and queue these procedures.
+        Obtain the sequence of parameters from the sequence tree and queue it as a
+        :class:`~pymeasure.display.manager.PendingSequence`: the procedure of
+        each entry is only made and queued when the manager is about to run it.
+        The parameters that are not part of the sequence are fixed to the values
+        entered at the moment of queueing.
+
+        :param start: index of the first entry of the sequence to be queued, e.g. to
+            resume an interrupted sequence
+        :param skip: collection of indices of entries that are not queued, e.g. because
+            they were already completed
         """
 
         self.queue_button.setEnabled(False)
@@ -545,21 +553,43 @@ class SequencerWidget(QtWidgets.QWidget):
         except SequenceEvaluationError:
             log.error("Evaluation of one of the sequence strings went wrong, no sequence queued.")
         else:
+            length = sequence.remaining(start, skip)
             log.info(
-                "Queuing %d measurements based on the entered sequences." % len(sequence)
+                "Queuing %d measurements based on the entered sequences." % length
             )
 
-            for entry in sequence:
-                QtWidgets.QApplication.processEvents()
-                parameters = dict(ChainMap(*entry[::-1]))
-
-                procedure = self._parent.make_procedure()
-                procedure.set_parameters(parameters)
-                self._parent.queue(procedure=procedure)
+            base_parameters = {
+                name: value
+                for name, value in self._parent.make_procedure().parameter_values().items()
+                if value is not None
+            }
+            filenames = self._parent.reserve_filenames(length)
+            if filenames is not None:
+                filenames = iter(filenames)
+            pending = PendingSequence(
+                sequence.iter_from(start, skip),
+                partial(self._queue_entry, base_parameters, filenames),
+                length=length,
+                parent=self,
+            )
+            self._parent.manager.queue_sequence(pending)
 
         finally:
             self.queue_button.setEnabled(True)
 
+    def _queue_entry(self, base_parameters, filenames, parameters):
+        """
+        Make the procedure for a single entry of the sequence and queue it, with the
+        next of the reserved filenames, if any.
+        """
+        procedure = self._parent.make_procedure()
+        procedure.set_parameters(base_parameters)
+        procedure.set_parameters(parameters)
+        if filenames is None:
+            self._parent.queue(procedure=procedure)
+        else:
+            self._parent.queue(procedure=procedure, filename=next(filenames))
+
     def save_sequence(self):
         dialog = SequenceDialog(save=True)
         if dialog.exec():
@@ -23,6 +23,7 @@
 #
 
 import logging
+from collections import OrderedDict
 from numpy import float64, NaN
 from functools import partial
 import pyqtgraph as pg
@@ -30,6 +31,7 @@ import pandas as pd
 
 from ..Qt import QtCore, QtWidgets, QtGui
 from .tab_widget import TabWidget
+from ..refresh import RefreshScheduler
 from ...experiment import Procedure
 
 SORT_ROLE = QtCore.Qt.ItemDataRole.UserRole + 1
@@ -66,6 +68,24 @@ class ResultsTable(QtCore.QObject):
             self._data = self._data.set_index(self.column_index)
         else:
             self._data.reset_index()
+        # Column arrays (views for numerical columns), for fast access to single cells
+        self._arrays = [self._data.iloc[:, i].to_numpy() for i in range(self._data.shape[1])]
+        self._types = list(self._data.dtypes)
+        self._positions = None
+
+    def value(self, row, col):
+        """ Return the value of a cell and the type of its column """
+        if row is None:
+            raise IndexError("Index not found")
+        return self._arrays[col][row], self._types[col]
+
+    def position(self, label):
+        """ Return the row of an index label, or None """
+        if self._positions is None:
+            # Keep the first row of duplicated labels
+            self._positions = {label: row for row, label
+                               in reversed(list(enumerate(self._data.index)))}
+        return self._positions.get(label)
 
     @property
     def rows(self):
@@ -84,12 +104,14 @@ class ResultsTable(QtCore.QObject):
     def stop(self):
         self._started = False
 
-    def update_data(self):
+    def update_data(self, data=None):
         if not self._started:
             return
-        if self.force_reload:
-            self.results.reload()
-        self.data = self.results.data
+        if data is None:
+            if self.force_reload:
+                self.results.reload()
+            data = self.results.data
+        self.data = data
         current_row_count, columns = self._data.shape
         if (self.last_row_count < current_row_count):
             # Request cells content update
@@ -124,19 +146,28 @@ class PandasModelBase(QtCore.QAbstractTableModel):
 
     float_digits = 6
     concat_axis = 0
+    cache_size = 20000  # Number of formatted cells kept, a few screens of the table
+    export_chunk_size = 10000  # Number of rows written at once by export_csv
 
-    def __init__(self, column_index=None, results_list=[], parent=None):
+    def __init__(self, column_index=None, results_list=None, parent=None):
         super().__init__(parent)
         self.column_index = column_index
+        self._cache = OrderedDict()
         self._init_data(results_list)
 
     def _init_data(self, results_list=None):
         if results_list is None:
             results_list = []
         self.results_list = results_list
+        self._invalidate()
         self.row_count = self.pandas_row_count()
         self.column_count = self.pandas_column_count()
 
+    def _invalidate(self):
+        """ Discard the cached headers and cells """
+        self._vertical_header = None
+        self._cache.clear()
+
     def clear(self):
         self.beginResetModel()
         for results in self.results_list:
@@ -158,6 +189,7 @@ class PandasModelBase(QtCore.QAbstractTableModel):
         self.beginResetModel()
         if results in self.results_list:
             self.results_list.remove(results)
+        self._invalidate()
         self.row_count = self.pandas_row_count()
         self.column_count = self.pandas_column_count()
         results.stop()
@@ -171,27 +203,41 @@ class PandasModelBase(QtCore.QAbstractTableModel):
 
     def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
         if index.isValid() and role in (QtCore.Qt.ItemDataRole.DisplayRole, SORT_ROLE):
+            results, row, col = self.translate_to_local(index.row(), index.column())
+            if role == QtCore.Qt.ItemDataRole.DisplayRole:
+                return self._display(results, row, col)
             try:
-                results, row, col = self.translate_to_local(index.row(), index.column())
-                value = results.data.iloc[row][col]
-                column_type = results.data.dtypes[col]
-                # Cast to column type
-                value_render = column_type.type(value)
+                value, _ = results.value(row, col)
             except (IndexError, ValueError, TypeError):
                 value = NaN
-                value_render = ""
-            if isinstance(value_render, float64):
-                # limit maximum number of decimal digits displayed
-                value_render = f"{value_render:.{self.float_digits:d}g}"
-
-            if role == QtCore.Qt.ItemDataRole.DisplayRole:
-                return str(value_render)
-            elif role == SORT_ROLE:
-                # For numerical sort
-                return float(value)
+            # For numerical sort
+            return float(value)
 
         return None
 
+    def _display(self, results, row, col):
+        """ Return the formatted content of a cell, from the cache if possible """
+        key = (results, row, col)
+        try:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        except KeyError:
+            pass
+        try:
+            value, column_type = results.value(row, col)
+            # Cast to column type
+            value_render = column_type.type(value)
+        except (IndexError, ValueError, TypeError):
+            return ""  # Not cached, as the cell may be filled later
+        if isinstance(value_render, float64):
+            # limit maximum number of decimal digits displayed
+            value_render = f"{value_render:.{self.float_digits:d}g}"
+        text = str(value_render)
+        self._cache[key] = text
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return text
+
     def _get_new_rows_columns(self, results, r1, c1, r2, c2):
         new_rows = self.pandas_row_count() - self.row_count
         new_rows_start = self.row_count
@@ -222,27 +268,41 @@ class PandasModelBase(QtCore.QAbstractTableModel):
         return None
 
     def _data_changed(self, results, r1, c1, r2, c2):
-        """ Internal method to handle data changed signal """
+        """ Internal method to handle data changed signal
+
+        Appended rows are signalled as inserted rows, only cells which existed before
+        are signalled as changed.
+        """
+        self._vertical_header = None
+        if results.force_reload:
+            # Existing rows may have changed, other cells are cached in the coordinates
+            # of their results, which appending rows does not change
+            for key in [key for key in self._cache if key[0] is results]:
+                del self._cache[key]
         rows, rows_start, columns, columns_start = \
             self._get_new_rows_columns(results, r1, c1, r2, c2)
-        if rows or columns:
-            if rows > 0:
-                # New rows available
-                self.beginInsertRows(QtCore.QModelIndex(),
-                                     rows_start,
-                                     rows_start + rows - 1)
-                self.row_count += rows
-                self.endInsertRows()
-
-            if columns > 0:
-                # New columns available
-                self.beginInsertColumns(QtCore.QModelIndex(),
-                                        columns_start,
-                                        columns_start + columns - 1)
-                self.column_count += columns
-                self.endInsertColumns()
-        else:
-            top_bottom = self._get_row_column_set(results, r1, c1, r2, c2)
+        if rows > 0:
+            # New rows available
+            self.beginInsertRows(QtCore.QModelIndex(),
+                                 rows_start,
+                                 rows_start + rows - 1)
+            self.row_count += rows
+            self.endInsertRows()
+
+        if columns > 0:
+            # New columns available
+            self.beginInsertColumns(QtCore.QModelIndex(),
+                                    columns_start,
+                                    columns_start + columns - 1)
+            self.column_count += columns
+            self.endInsertColumns()
+
+        if self.column_index is not None:
+            # New index labels can be sorted anywhere in the table
+            self.dataChanged.emit(self.createIndex(0, 0),
+                                  self.createIndex(self.row_count - 1, self.column_count - 1))
+        elif r2 - rows >= r1:
+            top_bottom = self._get_row_column_set(results, r1, c1, r2 - rows, c2)
             for r1, c1, r2, c2 in top_bottom:
                 self.dataChanged.emit(self.createIndex(r1, c1),
                                       self.createIndex(r2, c2))
@@ -300,6 +360,25 @@ class PandasModelBase(QtCore.QAbstractTableModel):
             df = pd.concat(df_list, axis=self.concat_axis).replace(to_replace=NaN, value="")
         return df
 
+    def export_csv(self, filename):
+        """ Write the table to a CSV file like :code:`export_df().to_csv(filename)`, but
+        in chunks of rows, without copying all data into a single data frame.
+
+        :return: False if the table is empty, True otherwise.
+        """
+        if not self.results_list:
+            return False
+        with open(filename, "w", newline="") as file:
+            header = True
+            for chunk in self.export_chunks():
+                chunk.to_csv(file, header=header)
+                header = False
+        return True
+
+    def export_chunks(self):
+        """ Yield the table data as data frames of at most export_chunk_size rows """
+        raise Exception("Subclass should implement it")
+
     def set_index(self, index):
         self.column_index = index
         # Update results list
@@ -307,6 +386,7 @@ class PandasModelBase(QtCore.QAbstractTableModel):
             r.stop()
             r.set_index(index)
         self.beginResetModel()
+        self._invalidate()
         for r in self.results_list:
             r.start()
             r.update_data()
@@ -334,11 +414,24 @@ class PandasModelByRow(PandasModelBase):
             cols = self.results_list[0].columns
         return cols
 
+    def _get_new_rows_columns(self, results, r1, c1, r2, c2):
+        new_rows, _, new_columns, new_columns_start = \
+            super()._get_new_rows_columns(results, r1, c1, r2, c2)
+        # Rows are appended after the last row of the results, not of the table
+        new_rows_start, _ = self.translate_to_global(results, r2 - new_rows + 1, 0)
+        return new_rows, new_rows_start, new_columns, new_columns_start
+
     def _get_row_column_set(self, results, r1, c1, r2, c2):
         top = self.translate_to_global(results, r1, c1)
         bottom = self.translate_to_global(results, r2, c2)
         return (top + bottom),
 
+    def export_chunks(self):
+        for results in self.results_list:
+            data = results.data
+            for start in range(0, len(data), self.export_chunk_size):
+                yield data.iloc[start:start + self.export_chunk_size]
+
     def translate_to_local(self, row, col):
         """ Translate from full table coordinate to single results coordinates """
         for index, results in enumerate(self.results_list):
@@ -353,18 +446,19 @@ class PandasModelByRow(PandasModelBase):
         for res in self.results_list:
             if res == results:
                 break
-            rows += results.rows
+            rows += res.rows
         return rows + row, col
 
     @property
     def vertical_header(self):
         if self.column_index is None:
-            header = range(self.row_count)
-        else:
+            return range(self.row_count)
+        if self._vertical_header is None:
             header = []
             for r in self.results_list:
                 header.extend(r.data.index)
-        return header
+            self._vertical_header = header
+        return self._vertical_header
 
     @property
     def horizontal_header(self):
@@ -397,13 +491,18 @@ class PandasModelByColumn(PandasModelBase):
         return cols
 
     def _get_row_column_set(self, results, r1, c1, r2, c2):
-        top_bottoms = []
-        for i in range(c1, c2 + 1):
-            top = self.translate_to_global(results, r1, i)
-            bottom = self.translate_to_global(results, r2, i)
-            top_bottoms.append(top + bottom)
+        # The columns of a results are adjacent
+        top = self.translate_to_global(results, r1, c1)
+        bottom = self.translate_to_global(results, r2, c2)
+        return (top + bottom),
 
-        return top_bottoms
+    def export_chunks(self):
+        header = self.vertical_header if self.column_index is not None \
+            else range(self.row_count)
+        for start in range(0, len(header), self.export_chunk_size):
+            labels = header[start:start + self.export_chunk_size]
+            yield pd.concat([results.data.reindex(labels) for results in self.results_list],
+                            axis=1)
 
     def translate_to_local(self, row, col):
         """ Translate from full table coordinate to single results coordinates """
@@ -414,11 +513,7 @@ class PandasModelByColumn(PandasModelBase):
             columns += results.columns
         if (self.column_index is not None):
             # Remap row to matching index entry when indexing is used
-            try:
-                index = self.vertical_header[row]
-                row = list(results.data.index).index(index)
-            except ValueError:
-                row = None
+            row = results.position(self.vertical_header[row])
         return results, row, col - columns
 
     def translate_to_global(self, results, row, col):
@@ -427,7 +522,7 @@ class PandasModelByColumn(PandasModelBase):
         for res in self.results_list:
             if res == results:
                 break
-            columns += results.columns
+            columns += res.columns
         return row, col + columns
 
     @property
@@ -447,11 +542,12 @@ class PandasModelByColumn(PandasModelBase):
 
     @property
     def vertical_header(self):
-        header = set([])
-        for r in self.results_list:
-            header = header.union(set(r.data.index))
-        header = sorted(list(header))
-        return header
+        if self._vertical_header is None:
+            header = set([])
+            for r in self.results_list:
+                header = header.union(set(r.data.index))
+            self._vertical_header = sorted(list(header))
+        return self._vertical_header
 
 
 class Table(QtWidgets.QTableView):
@@ -491,9 +587,8 @@ class Table(QtWidgets.QTableView):
         self.refresh_time = refresh_time
         self.check_status = check_status
         if self.refresh_time is not None:
-            self.timer = QtCore.QTimer(self)
-            self.timer.timeout.connect(self.update_tables)
-            self.timer.start(int(self.refresh_time * 1e3))
+            self.scheduler = RefreshScheduler.shared(self.refresh_time)
+            self.scheduler.register(self)
 
     def setModel(self, model):
         model.float_digits = self.float_digits
@@ -512,9 +607,9 @@ class Table(QtWidgets.QTableView):
         return model
 
     def export_action(self):
-        df = self.source_model().export_df()
+        model = self.source_model()
 
-        if df is not None:
+        if model.results_list:
             formats = ";;".join(self.supported_formats.keys())
             filename_and_ext = QtWidgets.QFileDialog.getSaveFileName(
                 self,
@@ -526,6 +621,11 @@ class Table(QtWidgets.QTableView):
             ext = filename_and_ext[1]
             if filename:
                 mode = self.supported_formats[ext]
+                if mode == "csv":
+                    # Streamed, large tables are not copied into a single data frame
+                    model.export_csv(filename)
+                    return
+                df = model.export_df()
                 prefix = df.style if mode == "latex" else df
                 getattr(prefix, 'to_' + mode)(filename)
 
@@ -554,14 +654,16 @@ class Table(QtWidgets.QTableView):
         menu.addAction(self.export)
         menu.exec(self.mapToGlobal(point))
 
+    def refresh_items(self, force=False):
+        """ Return the tables to refresh, i.e. those of running procedures if
+        check_status is set, or all tables if forced """
+        return [item for item in self.source_model().results_list
+                if force or not self.check_status
+                or item.results.procedure.status == Procedure.RUNNING]
+
     def update_tables(self, force=False):
-        model = self.source_model()
-        for item in model.results_list:
-            if not self.check_status or force:
-                item.update_data()
-            else:
-                if item.results.procedure.status == Procedure.RUNNING:
-                    item.update_data()
+        for item in self.refresh_items(force):
+            item.update_data()
 
     def set_color(self, table, color):
         table.set_color(color)
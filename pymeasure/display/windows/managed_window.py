@@ -30,7 +30,8 @@ import subprocess
 
 import pyqtgraph as pg
 
-from ..browser import BrowserItem
+from ..browser import BrowserItem, PendingBrowserItem
+from ..loader import ResultsLoader
 from ..manager import Manager, Experiment
 from ..Qt import QtCore, QtWidgets, QtGui
 from ..widgets import (
@@ -43,7 +44,7 @@ from ..widgets import (
     DirectoryLineEdit,
     EstimatorWidget,
 )
-from ...experiment import Results, Procedure
+from ...experiment import Procedure, Worker
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
@@ -109,6 +110,13 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
     :param directory_input: specify, if present, where the experiment's result will be saved.
     :param hide_groups: a boolean controlling whether parameter groups are hidden (True, default)
         or disabled/grayed-out (False) when the group conditions are not met.
+    :param max_workers: maximum number of experiments run in parallel by the
+        :class:`~pymeasure.display.manager.Manager` (default 1). Only experiments whose procedures
+        declare disjoint resources (see
+        :meth:`~pymeasure.experiment.procedure.Procedure.get_resources`) run in parallel.
+    :param worker_class: class of the workers running the procedures; use
+        :class:`~pymeasure.experiment.workers.ProcessWorker` to run each procedure in a separate
+        process, isolated from the user interface.
     """
 
     def __init__(self,
@@ -125,6 +133,8 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
                  inputs_in_scrollarea=False,
                  directory_input=False,
                  hide_groups=True,
+                 max_workers=1,
+                 worker_class=Worker,
                  ):
 
         super().__init__(parent)
@@ -139,6 +149,8 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
         self.sequence_file = sequence_file
         self.inputs_in_scrollarea = inputs_in_scrollarea
         self.directory_input = directory_input
+        self.max_workers = max_workers
+        self.worker_class = worker_class
         self.log = logging.getLogger(log_channel)
         self.log_level = log_level
         log.setLevel(log_level)
@@ -179,6 +191,12 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
         self.browser_widget.open_button.clicked.connect(self.open_experiment)
         self.browser = self.browser_widget.browser
 
+        self.loader = ResultsLoader(parent=self)
+        self.loader.loaded.connect(self.experiment_loaded)
+        self.loader.failed.connect(self.experiment_load_failed)
+        self.loader.progress.connect(self._loading_progress)
+        self.loading_dialog = None
+
         self.browser.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
         self.browser.customContextMenuRequested.connect(self.browser_item_menu)
         self.browser.itemChanged.connect(self.browser_item_changed)
@@ -193,9 +211,12 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
         self.manager = Manager(self.widget_list,
                                self.browser,
                                log_level=self.log_level,
+                               max_workers=self.max_workers,
+                               worker_class=self.worker_class,
                                parent=self)
         self.manager.abort_returned.connect(self.abort_returned)
         self.manager.queued.connect(self.queued)
+        self.manager.sequence_queued.connect(self.queued)
         self.manager.running.connect(self.running)
         self.manager.finished.connect(self.finished)
         self.manager.log.connect(self.log.handle)
@@ -287,6 +308,7 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
         self.resize(1000, 800)
 
     def quit(self, evt=None):
+        self.loader.shutdown()
         if self.manager.is_running():
             self.abort()
 
@@ -296,6 +318,8 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
         if column == 0:
             state = item.checkState(0)
             experiment = self.manager.experiments.with_browser_item(item)
+            if experiment is None:
+                return
             if state == QtCore.Qt.CheckState.Unchecked:
                 for curve in experiment.curve_list:
                     if curve:
@@ -308,7 +332,20 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
     def browser_item_menu(self, position):
         item = self.browser.itemAt(position)
 
-        if item is not None:
+        if isinstance(item, PendingBrowserItem):
+            pending = next(pending for pending in self.manager.experiments.pending
+                           if pending.browser_item is item)
+
+            menu = QtWidgets.QMenu(self)
+
+            # Remove pending
+            action_remove = QtGui.QAction(menu)
+            action_remove.setText("Remove Pending Measurements")
+            action_remove.triggered.connect(lambda: self.manager.remove_sequence(pending))
+            menu.addAction(action_remove)
+            menu.exec(self.browser.viewport().mapToGlobal(position))
+
+        elif item is not None:
             experiment = self.manager.experiments.with_browser_item(item)
 
             menu = QtWidgets.QMenu(self)
@@ -330,18 +367,16 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
             # Remove
             action_remove = QtGui.QAction(menu)
             action_remove.setText("Remove Graph")
-            if self.manager.is_running():
-                if self.manager.running_experiment() == experiment:  # Experiment running
-                    action_remove.setEnabled(False)
+            if experiment in self.manager.running_experiments():  # Experiment running
+                action_remove.setEnabled(False)
             action_remove.triggered.connect(lambda: self.remove_experiment(experiment))
             menu.addAction(action_remove)
 
             # Delete
             action_delete = QtGui.QAction(menu)
             action_delete.setText("Delete Data File")
-            if self.manager.is_running():
-                if self.manager.running_experiment() == experiment:  # Experiment running
-                    action_delete.setEnabled(False)
+            if experiment in self.manager.running_experiments():  # Experiment running
+                action_delete.setEnabled(False)
             action_delete.triggered.connect(lambda: self.delete_experiment_data(experiment))
             menu.addAction(action_delete)
 
@@ -376,13 +411,15 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
         root = self.browser.invisibleRootItem()
         for i in range(root.childCount()):
             item = root.child(i)
-            item.setCheckState(0, QtCore.Qt.CheckState.Checked)
+            if not isinstance(item, PendingBrowserItem):
+                item.setCheckState(0, QtCore.Qt.CheckState.Checked)
 
     def hide_experiments(self):
         root = self.browser.invisibleRootItem()
         for i in range(root.childCount()):
             item = root.child(i)
-            item.setCheckState(0, QtCore.Qt.CheckState.Unchecked)
+            if not isinstance(item, PendingBrowserItem):
+                item.setCheckState(0, QtCore.Qt.CheckState.Unchecked)
 
     def clear_experiments(self):
         self.manager.clear()
@@ -392,8 +429,9 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
                                widget_list=self.widget_list)
         if dialog.exec():
             filenames = dialog.selectedFiles()
+            to_load = []
             for filename in map(str, filenames):
-                if filename in self.manager.experiments:
+                if filename in self.manager.experiments or filename in self.loader.pending:
                     QtWidgets.QMessageBox.warning(
                         self, "Load Error",
                         "The file %s cannot be opened twice." % os.path.basename(filename)
@@ -401,14 +439,38 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
                 elif filename == '':
                     return
                 else:
-                    results = Results.load(filename)
-                    experiment = self.new_experiment(results)
-                    for curve in experiment.curve_list:
-                        if curve:
-                            curve.update_data()
-                    experiment.browser_item.progressbar.setValue(100)
-                    self.manager.load(experiment)
-                    log.info('Opened data file %s' % filename)
+                    to_load.append(filename)
+            # Files are read in the background, see experiment_loaded
+            self.loader.load(to_load)
+
+    def experiment_loaded(self, results):
+        """ Add an experiment for results loaded by :attr:`loader` """
+        experiment = self.new_experiment(results)
+        for curve in experiment.curve_list:
+            if curve:
+                curve.update_data()
+        experiment.browser_item.progressbar.setValue(100)
+        self.manager.load(experiment)
+        log.info('Opened data file %s' % results.data_filename)
+
+    def experiment_load_failed(self, filename, exception):
+        QtWidgets.QMessageBox.warning(
+            self, "Load Error",
+            "The file %s cannot be opened: %s" % (os.path.basename(filename), exception)
+        )
+
+    def _loading_progress(self, done, total):
+        if done >= total:
+            if self.loading_dialog is not None:
+                self.loading_dialog.reset()
+            return
+        if self.loading_dialog is None:
+            self.loading_dialog = QtWidgets.QProgressDialog(
+                "Opening data files...", "Cancel", 0, total, self)
+            self.loading_dialog.setMinimumDuration(500)
+            self.loading_dialog.canceled.connect(self.loader.cancel)
+        self.loading_dialog.setMaximum(total)
+        self.loading_dialog.setValue(done)
 
     def change_color(self, experiment):
         color = QtWidgets.QColorDialog.getColor(
@@ -523,6 +585,28 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
         raise NotImplementedError(
             "Abstract method ManagedWindow.queue not implemented")
 
+    def reserve_filenames(self, count):
+        """
+        Reserve the data filenames of a sequence of measurements at once.
+
+        This method is called by the
+        :class:`~pymeasure.display.widgets.sequencer_widget.SequencerWidget` when a
+        sequence is queued. By default it returns None and :meth:`queue` chooses the
+        filename of each measurement. If it is overridden to return a list of `count`
+        filenames, they are passed one by one to :meth:`queue` as the `filename` keyword
+        argument. Files of measurements which are not run remain empty.
+
+        For example:
+
+        .. code-block:: python
+
+            def reserve_filenames(self, count):
+                return unique_filenames(count, 'results', prefix="data", claim=True)
+
+        :param count: number of measurements of the sequence
+        """
+        return None
+
     def abort(self):
         self.abort_button.setEnabled(False)
         self.abort_button.setText("Resume")
@@ -555,6 +639,8 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
         self.browser_widget.clear_button.setEnabled(False)
 
     def abort_returned(self, experiment):
+        if self.manager.is_running():
+            return
         if self.manager.experiments.has_next():
             self.abort_button.setText("Resume")
             self.abort_button.setEnabled(True)
@@ -562,7 +648,7 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
             self.browser_widget.clear_button.setEnabled(True)
 
     def finished(self, experiment):
-        if not self.manager.experiments.has_next():
+        if not self.manager.experiments.has_next() and not self.manager.is_running():
             self.abort_button.setEnabled(False)
             self.browser_widget.clear_button.setEnabled(True)
 
@@ -26,8 +26,9 @@ from .parameters import (Parameter, IntegerParameter, FloatParameter,
                          VectorParameter, ListParameter, BooleanParameter,
                          Measurable, Metadata)
 from .procedure import Procedure, UnknownProcedure
-from .results import Results, unique_filename, replace_placeholders
-from .workers import Worker
+from .results import Results, unique_filename, unique_filenames, replace_placeholders
+from .index import ResultsIndex
+from .workers import Worker, ProcessWorker
 from .listeners import Listener, Recorder
 from .config import get_config
 from .experiment import Experiment, get_array, get_array_steps, get_array_zero
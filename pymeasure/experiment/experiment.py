@@ -28,6 +28,7 @@ import tempfile
 import gc
 
 import numpy as np
+import pandas as pd
 
 from .results import unique_filename
 from .config import get_config, set_mpl_rcparams
@@ -99,10 +100,25 @@ class Experiment:
     :param analyse: Post-analysis function, which takes a pandas dataframe as input and
         returns it with added (analysed) columns. The analysed results are accessible via
         experiment.data, as opposed to experiment.results.data for the 'raw' data.
+        The data are only analysed again when new data arrived.
+    :param incremental: If True, the analyse function only gets the rows added since its
+        previous call and its previous state, and returns the analysed rows and its new
+        state, e.g. ``analyse(new_rows, state) -> (analysed_rows, state)``. The state is
+        None on the first call. This keeps the analysis of long measurements cheap, for
+        example for running averages:
+
+        .. code-block:: python
+
+            def running_mean(rows, state):
+                total, count = state or (0, 0)
+                cumulative = rows['y'].cumsum() + total
+                rows['mean'] = cumulative / np.arange(count + 1, count + len(rows) + 1)
+                return rows, (cumulative.iloc[-1], count + len(rows))
+
     :param _data_timeout: Time limit for how long live plotting should wait for datapoints.
     """
 
-    def __init__(self, title, procedure, analyse=(lambda x: x)):
+    def __init__(self, title, procedure, analyse=(lambda x: x), incremental=False):
         self.title = title
         self.procedure = procedure
         self.measlist = []
@@ -111,6 +127,11 @@ class Experiment:
         self.figs = []
         self._data = []
         self.analyse = analyse
+        self.incremental = incremental
+        self._raw = None  # Raw data which has been analysed
+        self._analysed_rows = 0
+        self._state = None
+        self._plotted = None
         self._data_timeout = 10
 
         config = get_config()
@@ -138,10 +159,29 @@ class Experiment:
     @property
     def data(self):
         """Data property which returns analysed data, if an analyse function
-        is defined, otherwise returns the raw data."""
-        self._data = self.analyse(self.results.data.copy())
+        is defined, otherwise returns the raw data. The analysed data are cached
+        until new data arrive."""
+        raw = self.results.data
+        if raw is not self._raw:
+            self._data = self._analyse(raw)
+            self._raw = raw
         return self._data
 
+    def _analyse(self, raw):
+        if not self.incremental:
+            return self.analyse(raw.copy())
+        if self._raw is None or len(raw) < self._analysed_rows:
+            # First analysis, or the data were reloaded
+            self._analysed_rows = 0
+            self._state = None
+        elif len(raw) == self._analysed_rows:
+            return self._data
+        analysed, self._state = self.analyse(raw.iloc[self._analysed_rows:].copy(), self._state)
+        if self._analysed_rows:
+            analysed = pd.concat([self._data, analysed])
+        self._analysed_rows = len(raw)
+        return analysed
+
     def wait_for_data(self):
         """Wait for the data attribute to fill with datapoints."""
         t = time.time()
@@ -191,18 +231,20 @@ class Experiment:
         """Update the plots in the plots list with new data from the experiment.data
         pandas dataframe."""
         try:
-            self.data
-            for plot in self.plots:
-                ax = plot['ax']
-                if plot['type'] == 'plot':
-                    x, y = plot['args'][0], plot['args'][1]
-                    if type(y) == str:
-                        y = [y]
-                    for yname, line in zip(y, ax.lines):
-                        self.update_line(ax, line, x, yname)
-
-            display.clear_output(wait=True)
-            display.display(*self.figs)
+            data = self.data
+            if data is not self._plotted:  # Redraw only with new data
+                self._plotted = data
+                for plot in self.plots:
+                    ax = plot['ax']
+                    if plot['type'] == 'plot':
+                        x, y = plot['args'][0], plot['args'][1]
+                        if isinstance(y, str):
+                            y = [y]
+                        for yname, line in zip(y, ax.lines):
+                            self.update_line(ax, line, x, yname)
+
+                display.clear_output(wait=True)
+                display.display(*self.figs)
             time.sleep(0.1)
         except KeyboardInterrupt:
             display.clear_output(wait=True)
@@ -0,0 +1,312 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import glob
+import json
+import logging
+import os
+import re
+import sqlite3
+
+import pandas as pd
+
+from .procedure import Procedure
+from .results import Results
+from pymeasure.units import ureg
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    filename TEXT PRIMARY KEY,
+    procedure TEXT,
+    status INTEGER,
+    rows INTEGER,
+    columns TEXT,
+    mtime REAL,
+    size INTEGER
+);
+CREATE TABLE IF NOT EXISTS entries (
+    filename TEXT,
+    kind TEXT,
+    name TEXT,
+    value TEXT,
+    magnitude REAL,
+    dimensionality TEXT
+);
+CREATE INDEX IF NOT EXISTS entries_filename ON entries (filename);
+CREATE INDEX IF NOT EXISTS entries_name ON entries (name, magnitude);
+"""
+
+_CONDITION = re.compile(r"^\s*(?P<name>.+?)\s*(?P<op><=|>=|==|!=|<|>|=)\s*(?P<value>.+?)\s*$")
+_OPERATORS = {"<": "<", ">": ">", "<=": "<=", ">=": ">=", "=": "=", "==": "=", "!=": "!="}
+# Relative tolerance of numerical equality, as unit conversions are not exact
+# (700 mT and 0.7 T differ in base units)
+_TOLERANCE = 1e-9
+
+
+def read_header_values(filename):
+    """ Read the header of a data file without reconstructing its procedure.
+
+    :return: Dictionary with the procedure name (:code:`"module.Class"`), the
+        parameters and metadata (dictionaries of names to the values as written),
+        the column names and the number of data rows.
+    """
+    info = {"procedure": None, "parameters": {}, "metadata": {}, "columns": [], "rows": 0}
+    section = None
+    with open(filename, "rb") as f:
+        line = f.readline()
+        while line.startswith(Results.COMMENT.encode()):
+            text = line.decode().rstrip("\r\n")[1:]  # Uncomment
+            if text.startswith("Procedure"):
+                match = re.search(r"<(?P<name>[^>]+)>", text)
+                info["procedure"] = match.group("name") if match else None
+            elif text.startswith("Parameters"):
+                section = info["parameters"]
+            elif text.startswith("Metadata"):
+                section = info["metadata"]
+            elif text.startswith("\t") and section is not None:
+                name, separator, value = text[1:].partition(": ")
+                if separator:
+                    section[name] = value
+            line = f.readline()
+        if info["procedure"] is None:
+            raise ValueError("Header does not contain the Procedure class")
+        if line:
+            info["columns"] = line.decode().strip().split(Results.DELIMITER)
+        # Count the data lines in blocks, without parsing them
+        rows, last = 0, b"\n"
+        for block in iter(lambda: f.read(1 << 20), b""):
+            rows += block.count(b"\n")
+            last = block[-1:]
+        if last != b"\n":
+            rows += 1  # Last line without line break
+        info["rows"] = rows
+    return info
+
+
+def _quantity(value):
+    """ Return the magnitude in base units and the dimensionality of a value, or Nones
+    if it is not numerical """
+    try:
+        quantity = ureg.Quantity(value)
+        if isinstance(quantity.magnitude, bool):
+            return None, None
+        quantity = quantity.to_base_units()
+        return float(quantity.magnitude), str(quantity.dimensionality)
+    except Exception:
+        return None, None
+
+
+class ResultsIndex:
+    """ Index of the data files in a directory, stored in a SQLite database next to them.
+
+    The index holds the procedure class, the parameter and metadata values, the column
+    names, the number of rows, the status and the modification time of each file, such
+    that files can be searched without reading (or even opening) them. :meth:`update`
+    only reads the headers of new or modified files.
+
+    .. code-block:: python
+
+        index = ResultsIndex("data")
+        index.update()
+        filenames = index.query("Magnetic Field > 1 T", "Sample = A3")
+        df = index.to_dataframe()  # one row per file, with a column per parameter
+
+    :param directory: Directory of the data files.
+    :param database: Filename of the database, by default :attr:`FILENAME` in the directory.
+    :param pattern: Glob pattern of the data files.
+    :param recursive: Whether to include the data files in subdirectories.
+    """
+
+    FILENAME = ".pymeasure_index.sqlite"
+
+    def __init__(self, directory, database=None, pattern="*.csv", recursive=False):
+        self.directory = os.path.abspath(directory)
+        if database is None:
+            database = os.path.join(self.directory, self.FILENAME)
+        self.database = database
+        self.pattern = pattern
+        self.recursive = recursive
+        self.connection = sqlite3.connect(database)
+        with self.connection:
+            self.connection.executescript(_SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _relative(self, filename):
+        return os.path.relpath(os.path.abspath(filename), self.directory)
+
+    def _absolute(self, filename):
+        return os.path.join(self.directory, filename)
+
+    def files(self):
+        """ Return the filenames (relative to the directory) matching the pattern. """
+        pattern = os.path.join("**", self.pattern) if self.recursive else self.pattern
+        return [self._relative(filename) for filename in
+                glob.glob(os.path.join(glob.escape(self.directory), pattern),
+                          recursive=self.recursive)
+                if os.path.isfile(filename)]
+
+    def update(self):
+        """ Index new and modified data files and forget removed files.
+
+        :return: List of the (re)indexed filenames.
+        """
+        known = {filename: (mtime, size) for filename, mtime, size in
+                 self.connection.execute("SELECT filename, mtime, size FROM files")}
+        found = self.files()
+        changed = []
+        with self.connection:
+            for filename in found:
+                stat = os.stat(self._absolute(filename))
+                if known.get(filename) != (stat.st_mtime, stat.st_size):
+                    self._index(filename, stat)
+                    changed.append(self._absolute(filename))
+            for filename in set(known) - set(found):
+                self._forget(filename)
+        return changed
+
+    def _forget(self, filename):
+        self.connection.execute("DELETE FROM files WHERE filename = ?", (filename,))
+        self.connection.execute("DELETE FROM entries WHERE filename = ?", (filename,))
+
+    def _index(self, filename, stat):
+        try:
+            info = read_header_values(self._absolute(filename))
+        except (OSError, ValueError, UnicodeDecodeError) as exc:
+            # Indexed without procedure, not to be read again until modified
+            log.debug("File %s is not a results file: %s", filename, exc)
+            info = {"procedure": None, "parameters": {}, "metadata": {}, "columns": [],
+                    "rows": None}
+        status = self.connection.execute(
+            "SELECT status FROM files WHERE filename = ?", (filename,)).fetchone()
+        self._forget(filename)
+        self.connection.execute(
+            "INSERT INTO files VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (filename, info["procedure"], Procedure.FINISHED if status is None else status[0],
+             info["rows"], json.dumps(info["columns"]), stat.st_mtime, stat.st_size))
+        entries = []
+        for kind in ("parameters", "metadata"):
+            for name, value in info[kind].items():
+                entries.append((filename, kind, name, value, *_quantity(value)))
+        self.connection.executemany("INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?)", entries)
+
+    def set_status(self, filename, status):
+        """ Set the status of an indexed file, e.g. :code:`Procedure.FAILED`.
+
+        The status is not stored in the data files, files are indexed as finished.
+        """
+        with self.connection:
+            self.connection.execute("UPDATE files SET status = ? WHERE filename = ?",
+                                    (status, self._relative(filename)))
+
+    def entry(self, filename):
+        """ Return the indexed information of a file as a dictionary, or None. """
+        filename = self._relative(filename)
+        row = self.connection.execute(
+            "SELECT procedure, status, rows, columns, mtime FROM files "
+            "WHERE filename = ? AND procedure IS NOT NULL", (filename,)).fetchone()
+        if row is None:
+            return None
+        entry = {"filename": self._absolute(filename), "procedure": row[0], "status": row[1],
+                 "rows": row[2], "columns": json.loads(row[3]), "mtime": row[4],
+                 "parameters": {}, "metadata": {}}
+        for kind, name, value in self.connection.execute(
+                "SELECT kind, name, value FROM entries WHERE filename = ?", (filename,)):
+            entry[kind][name] = value
+        return entry
+
+    def query(self, *conditions, procedure=None, status=None):
+        """ Return the filenames of the indexed results files fulfilling all conditions.
+
+        A condition compares a parameter or metadata value, like :code:`"Field > 1 T"` or
+        :code:`"Sample = A3"`, with one of the operators :code:`<, <=, >, >=, =, !=`.
+        Numerical values are compared in consistent units (only with values of the same
+        dimensionality, equal within a relative tolerance of 1e-9), other values are
+        compared as text.
+
+        :param conditions: Conditions as strings.
+        :param procedure: Name of the procedure class, with or without module.
+        :param status: Status of the procedure, e.g. :code:`Procedure.FINISHED`.
+        """
+        sql = "SELECT filename FROM files WHERE procedure IS NOT NULL"
+        args = []
+        if procedure is not None:
+            sql += " AND (procedure = ? OR procedure LIKE ?)"
+            args += [procedure, "%." + procedure]
+        if status is not None:
+            sql += " AND status = ?"
+            args.append(status)
+        for condition in conditions:
+            match = _CONDITION.match(condition)
+            if match is None:
+                raise ValueError(f"Invalid condition '{condition}'.")
+            name, operator, value = match.group("name", "op", "value")
+            operator = _OPERATORS[operator]
+            magnitude, dimensionality = _quantity(value)
+            if magnitude is not None and operator in ("=", "!="):
+                tolerance = _TOLERANCE * abs(magnitude)
+                negation = "NOT " if operator == "!=" else ""
+                sql += (" AND filename IN (SELECT filename FROM entries WHERE name = ? "
+                        f"AND dimensionality = ? AND magnitude {negation}BETWEEN ? AND ?)")
+                args += [name, dimensionality, magnitude - tolerance, magnitude + tolerance]
+            elif magnitude is not None:
+                sql += (" AND filename IN (SELECT filename FROM entries WHERE name = ? "
+                        f"AND dimensionality = ? AND magnitude {operator} ?)")
+                args += [name, dimensionality, magnitude]
+            elif operator in ("=", "!="):
+                sql += (" AND filename IN (SELECT filename FROM entries WHERE name = ? "
+                        f"AND value {operator} ?)")
+                args += [name, value]
+            else:
+                raise ValueError(f"Cannot compare '{name}' to the non-numerical value "
+                                 f"'{value}'.")
+        sql += " ORDER BY filename"
+        return [self._absolute(filename) for filename, in self.connection.execute(sql, args)]
+
+    def to_dataframe(self):
+        """ Return the index as a :class:`pandas.DataFrame`, one row per results file with
+        its procedure, status, number of rows, modification time and a column per
+        parameter and metadata value (as text). """
+        files = pd.read_sql_query(
+            "SELECT filename, procedure, status, rows, mtime FROM files "
+            "WHERE procedure IS NOT NULL ORDER BY filename", self.connection)
+        entries = pd.read_sql_query("SELECT filename, name, value FROM entries",
+                                    self.connection)
+        if not entries.empty:
+            values = entries.pivot_table(index="filename", columns="name", values="value",
+                                         aggfunc="first")
+            files = files.join(values, on="filename")
+        files["filename"] = [self._absolute(filename) for filename in files["filename"]]
+        return files
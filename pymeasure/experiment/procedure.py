@@ -59,6 +59,7 @@ class Procedure:
 
     DATA_COLUMNS = []
     MEASURE = {}
+    RESOURCES = None
     FINISHED, FAILED, ABORTED, QUEUED, RUNNING = 0, 1, 2, 3, 4
     STATUS_STRINGS = {
         FINISHED: 'Finished', FAILED: 'Failed',
@@ -269,6 +270,17 @@ class Procedure:
     def should_stop(self):
         raise NotImplementedError('should be monkey patched by a worker')
 
+    def get_resources(self):
+        """ Returns the resources (e.g. the instruments, identified by their resource
+        names) used by the procedure, which are used to decide which procedures can
+        be run in parallel by a :class:`~pymeasure.display.manager.BaseManager` with
+        several workers. By default, the :code:`RESOURCES` class attribute is returned.
+        Can be reimplemented by subclasses, e.g. if the resources depend on parameters.
+        Should return a collection of hashable objects, or None if the procedure has to
+        be run on its own (the default).
+        """
+        return self.RESOURCES
+
     def get_estimates(self):
         """ Function that returns estimates that are to be displayed by
         the EstimatorWidget. Must be reimplemented by subclasses. Should
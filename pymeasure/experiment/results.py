@@ -23,10 +23,12 @@
 #
 
 from decimal import Decimal
+import locale
 import logging
 import os
 import re
 import sys
+import threading
 from importlib import import_module
 from importlib.machinery import SourceFileLoader
 from datetime import datetime
@@ -88,34 +90,119 @@ def replace_placeholders(string, procedure, date_format="%Y-%m-%d", time_format=
     return string.format(**placeholders)
 
 
+# Highest allocated index of the indexed filenames per (path without index, suffix, ext)
+_last_indices = {}
+# Empty files created by unique_filenames to claim their names, which Results may write to
+_claimed_filenames = set()
+_indices_lock = threading.Lock()
+
+
+def _highest_index(directory, basename, suffix, ext):
+    """ Returns the highest index of the files named "<basename>_<index><suffix>.<ext>" in
+    the directory, or 0 if there are none """
+    pattern = re.compile(re.escape(basename) + r"_(\d+)" + re.escape(f"{suffix}.{ext}"))
+    highest = 0
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            match = pattern.fullmatch(entry.name)
+            if match:
+                highest = max(highest, int(match.group(1)))
+    return highest
+
+
+def _prepare_directory(directory, dated_folder, now):
+    directory = os.path.abspath(directory)
+    if dated_folder:
+        directory = os.path.join(directory, now.strftime('%Y-%m-%d'))
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    return directory
+
+
+def unique_filenames(count, directory, prefix='DATA', suffix='', ext='csv',
+                     dated_folder=False, datetimeformat="%Y-%m-%d", procedure=None,
+                     claim=False):
+    """ Returns a number of unique, indexed filenames at once, e.g. for the experiments
+    of a sequence
+
+    The highest index is cached per directory and prefix, such that the directory is
+    only scanned for existing files once. For the arguments see :func:`unique_filename`.
+
+    :param count: Number of filenames
+    :param claim: If True, the files are created empty to reserve their names, which is
+        atomic also against other processes, and :class:`Results` writes its header into
+        them. Otherwise the names are only free at the time of the call and no file is
+        created, such that calls before the files are written return the same names.
+    """
+    now = datetime.now()
+    directory = _prepare_directory(directory, dated_folder, now)
+
+    if procedure is not None:
+        prefix = replace_placeholders(prefix, procedure)
+        suffix = replace_placeholders(suffix, procedure)
+
+    basename = f"{prefix}{now.strftime(datetimeformat)}"
+    basepath = os.path.join(directory, basename)
+    key = (basepath, suffix, ext)
+    filenames = []
+    with _indices_lock:
+        i = _last_indices.get(key)
+        if i is None:
+            i = _highest_index(directory, basename, suffix, ext)
+        highest = i  # Highest index in use
+        while len(filenames) < count:
+            i += 1
+            filename = "%s_%d%s.%s" % (basepath, i, suffix, ext)
+            if claim:
+                try:
+                    os.close(os.open(filename, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                except FileExistsError:
+                    continue  # Claimed meanwhile, e.g. by another process
+                _claimed_filenames.add(filename)
+                highest = i
+            elif os.path.exists(filename):
+                if not filenames:
+                    highest = i
+                continue
+            filenames.append(filename)
+        _last_indices[key] = highest
+    return filenames
+
+
 def unique_filename(directory, prefix='DATA', suffix='', ext='csv',
                     dated_folder=False, index=True, datetimeformat="%Y-%m-%d",
-                    procedure=None):
+                    procedure=None, claim=False):
     """ Returns a unique filename based on the directory and prefix
+
+    With :code:`index=True`, the filename gets the index following the highest
+    index in use, see :func:`unique_filenames`. With :code:`claim=True` the file is
+    created empty to reserve the name.
     """
+    if index:
+        return unique_filenames(1, directory, prefix=prefix, suffix=suffix, ext=ext,
+                                dated_folder=dated_folder, datetimeformat=datetimeformat,
+                                procedure=procedure, claim=claim)[0]
+
     now = datetime.now()
-    directory = os.path.abspath(directory)
+    directory = _prepare_directory(directory, dated_folder, now)
 
     if procedure is not None:
         prefix = replace_placeholders(prefix, procedure)
         suffix = replace_placeholders(suffix, procedure)
 
-    if dated_folder:
-        directory = os.path.join(directory, now.strftime('%Y-%m-%d'))
-    if not os.path.exists(directory):
-        os.makedirs(directory)
-    if index:
-        i = 1
-        basename = f"{prefix}{now.strftime(datetimeformat)}"
-        basepath = os.path.join(directory, basename)
-        filename = "%s_%d%s.%s" % (basepath, i, suffix, ext)
-        while os.path.exists(filename):
-            i += 1
-            filename = "%s_%d%s.%s" % (basepath, i, suffix, ext)
-    else:
-        basename = f"{prefix}{now.strftime(datetimeformat)}{suffix}.{ext}"
-        filename = os.path.join(directory, basename)
-    return filename
+    basename = f"{prefix}{now.strftime(datetimeformat)}{suffix}.{ext}"
+    return os.path.join(directory, basename)
+
+
+def _release_claim(filename):
+    """ Returns True if the file has been claimed by :func:`unique_filenames` and is
+    still empty, and forgets the claim """
+    with _indices_lock:
+        try:
+            _claimed_filenames.remove(os.path.abspath(filename))
+        except KeyError:
+            return False
+    return os.path.getsize(filename) == 0
 
 
 class CSVFormatter(logging.Formatter):
@@ -197,18 +284,23 @@ class Results:
     :cvar DELIMITER: The character used to delimit the data (default: ,)
     :cvar LINE_BREAK: The character used for line breaks (default \\n)
     :cvar CHUNK_SIZE: The length of the data chuck that is read
+    :cvar METADATA_WIDTH: The number of characters reserved in the header for
+        each metadata value, see :meth:`store_metadata`
 
     :param procedure: Procedure object
     :param data_filename: The data filename where the data is or should be
                           stored
+    :param lazy: If True, the data of an existing file is only read when
+                 it is first accessed
     """
 
     COMMENT = '#'
     DELIMITER = ','
     LINE_BREAK = "\n"
     CHUNK_SIZE = 1000
+    METADATA_WIDTH = 64
 
-    def __init__(self, procedure, data_filename):
+    def __init__(self, procedure, data_filename, lazy=False):
         if not isinstance(procedure, Procedure):
             raise ValueError("Results require a Procedure object")
         self.procedure = procedure
@@ -216,6 +308,9 @@ class Results:
         self.parameters = procedure.parameter_objects()
         self._header_count = -1
         self._metadata_count = -1
+        # Downsampled data, e.g. to plot many large files, see pymeasure.display.loader
+        self.preview = None
+        self._data_size = None  # File size when the data was read
 
         self.formatter = CSVFormatter(columns=self.procedure.DATA_COLUMNS)
 
@@ -227,8 +322,12 @@ class Results:
         self.data_filename = data_filename
         self.data_filenames = data_filenames
 
-        if os.path.exists(data_filename):  # Assume header is already written
-            self.reload()
+        # Assume header is already written, unless the file has just been claimed
+        # by unique_filename
+        if os.path.exists(data_filename) and not _release_claim(data_filename):
+            self._data = None
+            if not lazy:
+                self.reload()
             self.procedure.status = Procedure.FINISHED
             # TODO: Correctly store and retrieve status
         else:
@@ -283,6 +382,8 @@ class Results:
         for name, parameter in self.parameters.items():
             h.append("\t{}: {}".format(parameter.name, str(
                 parameter).encode("unicode_escape").decode("utf-8")))
+        # Blank lines, which are overwritten by the metadata
+        h.extend(" " * (length - 1) for length in self._metadata_reserve())
         h.append("Data:")
         self._header_count = len(h)
         h = [Results.COMMENT + line for line in h]  # Comment each line
@@ -322,21 +423,79 @@ class Results:
         m = [Results.COMMENT + line for line in m]  # Comment each line
         return Results.LINE_BREAK.join(m) + Results.LINE_BREAK
 
+    def _metadata_reserve(self):
+        """ Returns the lengths of the comment lines (without line breaks) reserved
+        in the header for the metadata """
+        metadata = self.procedure.metadata_objects()
+        if not metadata:
+            return []
+        lengths = [len(Results.COMMENT + "Metadata:")]
+        for m in metadata.values():
+            lengths.append(len(f"{Results.COMMENT}\t{m.name}: ") + Results.METADATA_WIDTH)
+        lengths.append(len(Results.COMMENT))  # Takes the unused space
+        return lengths
+
     def store_metadata(self):
-        """ Inserts the metadata header (if any) into the datafile """
+        """ Writes the metadata header (if any) into the datafile
+
+        The metadata overwrite the blank lines reserved in the header, such that the
+        data already written are neither read nor copied, and the file stays open
+        for the :class:`~pymeasure.experiment.listeners.Recorder`. Only if the
+        metadata exceed the reserved space (see :attr:`METADATA_WIDTH`) or the file
+        has no reserved lines, the whole file is rewritten.
+        """
         c_header = self.metadata()
         if c_header is None:
             return
 
-        for filename in self.data_filenames:
-            with open(filename, 'r+') as f:
-                contents = f.readlines()
+        added = [self._store_metadata(filename, c_header) for filename in self.data_filenames]
+        # The header count refers to the data_filename, which is the only one read back;
+        # a mirrored file may have been rewritten differently
+        self._header_count += added[self.data_filenames.index(self.data_filename)]
+
+    def _store_metadata(self, filename, c_header):
+        """ Writes the metadata header into a file and returns the number of added lines """
+        lines = c_header.split(Results.LINE_BREAK)[:-1]
+        count = len(lines) + 1  # Including the line of the unused space
+        comment = Results.COMMENT.encode()
+        blank = re.compile(re.escape(comment) + rb" *\r?\n")
+        encoding = locale.getpreferredencoding(False)  # as used by open
+        with open(filename, 'rb+') as f:
+            index, offset = 0, 0
+            line = f.readline()
+            while line.startswith(comment) and not blank.fullmatch(line):
+                index += 1
+                offset += len(line)
+                line = f.readline()
+            reserved = []
+            while len(reserved) < count and blank.fullmatch(line):
+                reserved.append(line)
+                line = f.readline()
+            if len(reserved) == count:
+                newline = b"\r\n" if reserved[0].endswith(b"\r\n") else b"\n"
+                block = b"".join(text.encode(encoding) + newline for text in lines)
+                space = sum(len(line) for line in reserved) - len(block) \
+                    - len(comment) - len(newline)
+                if space >= 0:
+                    f.seek(offset)
+                    f.write(block + comment + b" " * space + newline)
+                    return 0
+
+        log.info("Rewriting '%s' to store the metadata, as they do not fit into the "
+                 "reserved header lines.", filename)
+        with open(filename, 'r+') as f:
+            contents = f.readlines()
+            if len(reserved) == count:
+                contents[index:index + count] = [c_header, Results.COMMENT + Results.LINE_BREAK]
+                added = 0
+            else:
                 contents.insert(self._header_count - 1, c_header)
+                added = self._metadata_count
 
-                f.seek(0)
-                f.writelines(contents)
-
-        self._header_count += self._metadata_count
+            f.seek(0)
+            f.writelines(contents)
+            f.truncate()
+        return added
 
     @staticmethod
     def parse_header(header, procedure_class=None):
@@ -407,9 +566,11 @@ class Results:
         return procedure
 
     @staticmethod
-    def load(data_filename, procedure_class=None):
+    def load(data_filename, procedure_class=None, lazy=False):
         """ Returns a Results object with the associated Procedure object and
         data
+
+        :param lazy: If True, the data is only read when it is first accessed
         """
         header = ""
         header_read = False
@@ -423,10 +584,15 @@ class Results:
                 else:
                     header_read = True
         procedure = Results.parse_header(header[:-1], procedure_class)
-        results = Results(procedure, data_filename)
+        results = Results(procedure, data_filename, lazy=lazy)
         results._header_count = header_count
         return results
 
+    @property
+    def loaded(self):
+        """ Whether the data of the file has been read """
+        return self._data is not None
+
     @property
     def data(self):
         # Need to update header count for correct referencing
@@ -440,42 +606,68 @@ class Results:
             except Exception:
                 # Empty dataframe
                 self._data = pd.DataFrame(columns=self.procedure.DATA_COLUMNS)
-        else:  # Concatenate additional data, if any, to already loaded data
-            skiprows = len(self._data) + self._header_count
-            chunks = pd.read_csv(
-                self.data_filename,
-                comment=Results.COMMENT,
-                header=0,
-                names=self._data.columns,
-                chunksize=Results.CHUNK_SIZE, skiprows=skiprows, iterator=True
-            )
-            try:
-                tmp_frame = pd.concat(chunks, ignore_index=True)
-                # only append new data if there is any
-                # if no new data, tmp_frame dtype is object, which override's
-                # self._data's original dtype - this can cause problems plotting
-                # (e.g. if trying to plot int data on a log axis)
-                if len(tmp_frame) > 0:
-                    self._data = pd.concat([self._data, tmp_frame],
-                                           ignore_index=True)
-            except Exception:
-                pass  # All data is up to date
+        else:
+            # Concatenate additional data, if any, to already loaded data,
+            # unless the file did not change
+            size = self._file_size()
+            if size is None or size != self._data_size:
+                skiprows = len(self._data) + self._header_count
+                chunks = pd.read_csv(
+                    self.data_filename,
+                    comment=Results.COMMENT,
+                    header=0,
+                    names=self._data.columns,
+                    chunksize=Results.CHUNK_SIZE, skiprows=skiprows, iterator=True
+                )
+                try:
+                    tmp_frame = pd.concat(chunks, ignore_index=True)
+                    # only append new data if there is any
+                    # if no new data, tmp_frame dtype is object, which override's
+                    # self._data's original dtype - this can cause problems plotting
+                    # (e.g. if trying to plot int data on a log axis)
+                    if len(tmp_frame) > 0:
+                        self._data = pd.concat([self._data, tmp_frame],
+                                               ignore_index=True)
+                    self._data_size = size
+                except Exception:
+                    pass  # All data is up to date
         return self._data
 
-    def reload(self):
+    def _file_size(self):
+        try:
+            return os.path.getsize(self.data_filename)
+        except OSError:
+            return None
+
+    def reload(self, should_stop=None):
         """ Preforms a full reloading of the file data, neglecting
         any changes in the comments
+
+        :param should_stop: Function called between the chunks of data, reading
+            is cancelled (keeping the previous data) if it returns True
+        :return: False if reading was cancelled, True otherwise
         """
-        chunks = pd.read_csv(
+        size = self._file_size()
+        reader = pd.read_csv(
             self.data_filename,
             comment=Results.COMMENT,
             chunksize=Results.CHUNK_SIZE,
             iterator=True
         )
+        chunks = reader
+        if should_stop is not None:
+            chunks = []
+            for chunk in reader:
+                if should_stop():
+                    reader.close()
+                    return False
+                chunks.append(chunk)
         try:
             self._data = pd.concat(chunks, ignore_index=True)
         except Exception:
-            self._data = chunks.read()
+            self._data = reader.read()
+        self._data_size = size
+        return True
 
     def __repr__(self):
         return "<{}(filename='{}',procedure={},shape={})>".format(
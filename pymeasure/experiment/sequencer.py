@@ -23,9 +23,13 @@
 #
 
 import logging
+import operator
 import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
 import numpy
-from itertools import product
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
@@ -36,6 +40,36 @@ class SequenceEvaluationError(Exception):
     pass
 
 
+class _ArrayCache:
+    """ Least recently used cache of arrays, bounded by their total size in bytes """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            array = self.entries.get(key)
+            if array is not None:
+                self.entries.move_to_end(key)
+            return array
+
+    def put(self, key, array):
+        if array.nbytes > self.max_bytes:
+            return
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.size -= old.nbytes
+            self.entries[key] = array
+            self.size += array.nbytes
+            while self.size > self.max_bytes:
+                _, old = self.entries.popitem(last=False)
+                self.size -= old.nbytes
+
+
 class SequenceItem(object):
     """ Class representing a sequence row """
     column_map = {
@@ -131,6 +165,18 @@ class SequenceHandler:
         'tan': numpy.tan,
         'tanh': numpy.tanh,
     }
+    # Names of SAFE_FUNCTIONS which always give the same result for the same arguments:
+    # deterministic builtins and numpy functions and constants (no random numbers, no time).
+    # The results of expressions using only these names are memoized. Functions added to
+    # SAFE_FUNCTIONS are not memoized, unless they are added here as well.
+    PURE_FUNCTIONS = frozenset((
+        "range", "sorted", "list", "arange", "linspace", "arccos", "arcsin", "arctan",
+        "arctan2", "ceil", "cos", "cosh", "degrees", "e", "exp", "fabs", "floor", "fmod",
+        "frexp", "hypot", "ldexp", "log", "log10", "modf", "pi", "power", "radians", "sin",
+        "sinh", "sqrt", "tan", "tanh"
+    ))
+    # Memoized results of pure expressions, at most 16 MB
+    _pure_results = _ArrayCache(2 ** 24)
 
     def __init__(self, valid_inputs=(), file_obj=None):
         self._sequences = []
@@ -146,6 +192,11 @@ class SequenceHandler:
         execution of malicious code. For this purpose, also any built-in
         functions or global variables are not available.
 
+        The compiled expressions are cached by their source text. The results
+        of expressions which only use :attr:`PURE_FUNCTIONS` are memoized (up to
+        a total size of 16 MB), such that repeatedly evaluating the same sequence
+        is cheap. Each call returns a new array.
+
         :param string: String to be interpreted.
         :param name: Name of the to-be-interpreted string, only used for
             error messages.
@@ -154,12 +205,9 @@ class SequenceHandler:
         :param log_enabled: Enable log messages.
         """
 
-        evaluated_string = None
         if len(string) > 0:
             try:
-                evaluated_string = eval(
-                    string, {"__builtins__": None}, SequenceHandler.SAFE_FUNCTIONS
-                )
+                evaluated_string = SequenceHandler._evaluate(string)
             except TypeError:
                 if log_enabled:
                     log.error("TypeError, likely a typo in one of the " +
@@ -185,9 +233,34 @@ class SequenceHandler:
                           "for parameter '{}', depth {}".format(name, depth))
             raise SequenceEvaluationError("No sequence entered")
 
-        evaluated_string = numpy.array(evaluated_string)
         return evaluated_string
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _compile(string):
+        """ Compile the given string once, the code objects are cached by source text """
+        return compile(string, "<sequence>", "eval")
+
+    @staticmethod
+    def _evaluate(string):
+        """ Evaluate the given string, using the memoized result if the expression
+        only uses pure functions.
+        """
+        code = SequenceHandler._compile(string)
+        if not SequenceHandler.PURE_FUNCTIONS.issuperset(code.co_names):
+            return SequenceHandler._evaluate_code(code)
+        evaluated_string = SequenceHandler._pure_results.get(string)
+        if evaluated_string is None:
+            evaluated_string = SequenceHandler._evaluate_code(code)
+            SequenceHandler._pure_results.put(string, evaluated_string)
+        # The memoized array stays unchanged, if the caller modifies its copy
+        return evaluated_string.copy()
+
+    @staticmethod
+    def _evaluate_code(code):
+        evaluated_string = eval(code, {"__builtins__": None}, SequenceHandler.SAFE_FUNCTIONS)
+        return numpy.array(evaluated_string)
+
     def _get_idx(self, seq_item):
         """ Return the index and level of the list whose value correspond to sequence """
         try:
@@ -353,72 +426,142 @@ class SequenceHandler:
 
     def parameters_sequence(self, names_map=None):
         """
-        Generate a list of parameters from the sequence tree.
+        Generate the sequence of parameters from the sequence tree.
+
+        The sequence expressions are evaluated once, but the combinations of
+        parameters are only generated when iterated over (see
+        :class:`ParametersSequence`).
 
         :param names_map: an optional dict to map paramter name
-        :return: A list of dictionaries. Each dictionary represents a parameters setting
-        for running an experiment.
+        :return: A :class:`ParametersSequence` of dictionaries. Each dictionary represents a
+            parameters setting for running an experiment.
         """
 
-        sequences = []
-        current_sequence = [[] for i in range(self.MAXDEPTH)]
-        temp_sequence = [[] for i in range(self.MAXDEPTH)]
+        nodes = [[] for i in range(self.MAXDEPTH + 1)]
 
-        idx = 0
-        while (idx < len(self._sequences)):
-            depth, parameter, seq = self._sequences[idx].level, \
-                self._sequences[idx].parameter, \
-                self._sequences[idx].expression
-            values = self.eval_string(seq, parameter, depth)
+        for seq_item in reversed(self._sequences):
+            depth, parameter = seq_item.level, seq_item.parameter
+            values = self.eval_string(seq_item.expression, parameter, depth)
             if names_map is not None:
                 parameter = names_map[parameter]
 
             try:
-                sequence_entry = [{parameter: value} for value in values]
+                values = list(values)
             except TypeError:
                 log.error(
                     "TypeError, likely no sequence for one of the parameters"
                 )
+                values = []
+
+            children = nodes[depth + 1][::-1]
+            nodes[depth + 1] = []
+            nodes[depth].append(_SequenceNode(parameter, values, children))
+
+        return ParametersSequence(nodes[0][::-1])
+
+
+class _SequenceNode:
+    """ Evaluated node of the sequence tree, which knows how many parameter
+    settings it generates.
+    """
+
+    def __init__(self, parameter, values, children):
+        self.parameter = parameter
+        self.values = values
+        self.children = children
+        self.children_count = _count(children) if children else 1
+        self.count = len(values) * self.children_count
+
+
+def _count(nodes):
+    return sum(node.count for node in nodes)
+
+
+def _get_item(nodes, index):
+    """ Return the parameters of the index-th setting generated by nodes """
+    for node in nodes:
+        if index < node.count:
+            value_index, index = divmod(index, node.children_count)
+            parameters = {node.parameter: node.values[value_index]}
+            if node.children:
+                parameters.update(_get_item(node.children, index))
+            return parameters
+        index -= node.count
+    raise IndexError("Sequence index out of range")
+
+
+def _iter_nodes(nodes, start=0):
+    """ Generate the parameter settings of nodes, starting at index start """
+    for node in nodes:
+        if start >= node.count:
+            start -= node.count
+            continue
+
+        value_index, start = divmod(start, node.children_count)
+        for value in node.values[value_index:]:
+            if node.children:
+                for parameters in _iter_nodes(node.children, start):
+                    yield {node.parameter: value, **parameters}
             else:
-                current_sequence[depth].extend(sequence_entry)
+                yield {node.parameter: value}
+            start = 0
+        start = 0
 
-            idx += 1
-            next_depth = -1 if idx >= len(self._sequences) else self._sequences[idx].level
-
-            for depth_idx in range(depth, next_depth, -1):
-                temp_sequence[depth_idx].extend(current_sequence[depth_idx])
-
-                if depth_idx != 0:
-                    sequence_products = list(product(
-                        current_sequence[depth_idx - 1],
-                        temp_sequence[depth_idx]
-                    ))
-
-                    for i in range(len(sequence_products)):
-                        try:
-                            element = sequence_products[i][1]
-                        except IndexError:
-                            log.error(
-                                "IndexError, likely empty nested parameter"
-                            )
-                        else:
-                            if isinstance(element, tuple):
-                                sequence_products[i] = (
-                                    sequence_products[i][0], *element)
-
-                    temp_sequence[depth_idx - 1].extend(sequence_products)
-                    temp_sequence[depth_idx] = []
-
-                current_sequence[depth_idx] = []
-                current_sequence[depth_idx - 1] = []
-
-            if depth == next_depth:
-                temp_sequence[depth].extend(current_sequence[depth])
-                current_sequence[depth] = []
-
-        sequences = temp_sequence[0]
-
-        for idx in range(len(sequences)):
-            if not isinstance(sequences[idx], tuple):
-                sequences[idx] = (sequences[idx],)
-        return sequences
+
+class ParametersSequence:
+    """ Lazy sequence of parameter settings generated from a sequence tree by
+    :meth:`SequenceHandler.parameters_sequence`.
+
+    Each element is a dictionary of parameter names and values, where the values of
+    nested parameters take precedence over those of their parents.
+    The settings are generated on the fly while iterating, so that the memory needed
+    does not depend on the length of the sequence. The length and any element can be
+    obtained without generating the preceding elements, which allows, for example, to
+    resume a sequence from a given index.
+
+    .. code-block:: python
+
+        sequence = handler.parameters_sequence()
+        len(sequence)  # total number of settings
+        sequence[10]  # parameters of the 11th setting
+        for parameters in sequence.iter_from(10, skip={12, 13}):
+            ...  # settings from the 11th on, skipping already completed points
+
+    :param nodes: the evaluated root nodes of the sequence tree
+    """
+
+    def __init__(self, nodes):
+        self._nodes = nodes
+        self._length = _count(nodes)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        index = operator.index(index)
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Sequence index out of range")
+        return _get_item(self._nodes, index)
+
+    def __iter__(self):
+        return _iter_nodes(self._nodes)
+
+    def iter_from(self, start=0, skip=()):
+        """ Generate the parameter settings starting at a given index.
+
+        :param start: index of the first setting to be generated
+        :param skip: collection of indices of the settings to be skipped, e.g. those
+            which were already completed
+        """
+        skip = set(skip)
+        for index, parameters in enumerate(_iter_nodes(self._nodes, start), start):
+            if index not in skip:
+                yield parameters
+
+    def remaining(self, start=0, skip=()):
+        """ Return the number of settings that :meth:`iter_from` generates for the
+        given arguments, without generating them.
+        """
+        return max(self._length - start, 0) - len({i for i in skip if start <= i < self._length})
@@ -23,6 +23,7 @@
 #
 
 import logging
+import threading
 import time
 import traceback
 from queue import Queue
@@ -30,6 +31,8 @@ from queue import Queue
 from .listeners import Recorder
 from .procedure import Procedure
 from .results import Results
+from ..log import TopicQueueHandler
+from ..process import StoppableProcess, context
 from ..thread import StoppableThread
 
 log = logging.getLogger(__name__)
@@ -188,3 +191,79 @@ class Worker(StoppableThread):
             self.procedure.__class__.__name__,
             self.should_stop()
         )
+
+
+class ProcessWorker(StoppableProcess):
+    """ ProcessWorker runs the procedure in a separate process, such that
+    the procedure does not compete with the user interface for the GIL.
+
+    It is a drop-in replacement for the :class:`Worker`: inside the process,
+    a :class:`Worker` runs the procedure, records the results and publishes
+    them over the ZMQ TCP port. Status and progress messages as well as the
+    log records of the process are forwarded to the :attr:`monitor_queue`, and
+    :meth:`stop` aborts the procedure in the same way.
+
+    The :class:`.Results` (and with it the procedure) are transferred to the
+    process, hence the procedure class has to be defined in an importable
+    module file.
+    """
+
+    #: Time in seconds to wait for the process to exit after joining, before terminating it
+    exit_timeout = 10
+
+    def __init__(self, results, log_queue=None, log_level=logging.INFO, port=None):
+        """ Constructs a ProcessWorker to perform the Procedure
+        defined in the file at the filepath
+        """
+        super().__init__()
+
+        self.port = port
+        if not isinstance(results, Results):
+            raise ValueError("Invalid Results object during Worker construction")
+        self.results = results
+        self.results.procedure.check_parameters()
+        self.results.procedure.status = Procedure.QUEUED
+
+        self.monitor_queue = context.Queue()
+        self.log_level = log_level
+
+    def join(self, timeout=0):
+        """ Wait up to `timeout` seconds for the procedure to end and stop it, like
+        :meth:`Worker.join`.
+
+        If the process has not exited within the timeout, it is joined in a background
+        thread and terminated after :attr:`exit_timeout`, such that the caller (e.g. the
+        manager in the GUI thread) is not blocked.
+        """
+        deadline = time.perf_counter() + timeout
+        try:
+            super().join(timeout)
+            context.Process.join(self, max(deadline - time.perf_counter(), 0))
+        except (KeyboardInterrupt, SystemExit):
+            log.warning("User stopped Worker join prematurely")
+            self.stop()
+        if self.is_alive():
+            threading.Thread(target=self._terminate_after_exit_timeout, daemon=True).start()
+
+    def _terminate_after_exit_timeout(self):
+        context.Process.join(self, self.exit_timeout)
+        if self.is_alive():
+            log.warning("Terminating the process of %r", self)
+            self.terminate()
+
+    def run(self):
+        # Forward all log records of the process to the monitor
+        root_logger = logging.getLogger()
+        root_logger.handlers = [TopicQueueHandler(self.monitor_queue, picklable=True)]
+
+        worker = Worker(self.results, log_level=self.log_level, port=self.port)
+        worker.monitor_queue = self.monitor_queue
+        worker._should_stop = self._should_stop
+        worker.run()
+
+    def __repr__(self):
+        return "<{}(port={},procedure={},should_stop={})>".format(
+            self.__class__.__name__, self.port,
+            self.results.procedure.__class__.__name__,
+            self.should_stop()
+        )
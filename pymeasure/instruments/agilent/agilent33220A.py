@@ -22,9 +22,12 @@
 # THE SOFTWARE.
 #
 
+import numpy as np
+
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import strict_discrete_set,\
     strict_range, joined_validators
+from .agilent33500 import _arb_block, _upload_arb
 from time import time
 from pyvisa.errors import VisaIOError
 
@@ -75,6 +78,9 @@ class Agilent33220A(Instrument):
             name,
             **kwargs
         )
+        self.arb_cache = {}
+        """Dict of the arbitrary traces uploaded by :meth:`data_arb`, which are not sent again.
+        Clear it, if the volatile memory was changed otherwise (e.g. by a power cycle)."""
 
     shape = Instrument.control(
         "FUNC?", "FUNC %s",
@@ -246,6 +252,30 @@ class Agilent33220A(Instrument):
         cast=lambda v: int(float(v))
     )
 
+    arb_file = Instrument.control(
+        "FUNC:USER?", "FUNC:USER %s",
+        """ A string property that selects the arbitrary waveform, which is output with the
+        shape USER. "VOLATILE" selects the waveform uploaded with :meth:`data_arb`.""",
+    )
+
+    def data_arb(self, data_points, data_format="DAC"):
+        """ Upload an arbitrary waveform into the volatile memory as a binary block. Select it
+        with :attr:`arb_file` set to "VOLATILE". The identical waveform is not sent again.
+
+        :param data_points: Points of the waveform, for example as a numpy array, with
+            1 to 65536 points.
+        :param data_format: 'DAC' (default) for integer values ranging from -8191 to +8191 or
+            'float' for values ranging from -1.0 to +1.0, which are converted to DAC values.
+        """
+        if data_format == "float":
+            data_points = np.asarray(data_points)
+            if data_points.size and np.abs(data_points).max() > 1:
+                raise ValueError("Data points of format float must be within +-1.")
+            data_points = np.rint(data_points * 8191)
+            data_format = "DAC"
+        data_bytes, _ = _arb_block(data_points, data_format, dac_limit=8191)
+        _upload_arb(self, self.arb_cache, "DATA:DAC", "VOLATILE", data_bytes)
+
     def trigger(self):
         """ Send a trigger signal to the function generator. """
         self.write("*TRG;*WAI")
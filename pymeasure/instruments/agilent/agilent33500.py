@@ -24,7 +24,11 @@
 
 # Parts of this code were copied and adapted from the Agilent33220A class.
 
+import hashlib
 import logging
+
+import numpy as np
+
 from pymeasure.instruments import Instrument, Channel
 from pymeasure.instruments.validators import strict_discrete_set, strict_range
 from time import time
@@ -46,6 +50,56 @@ log.addHandler(logging.NullHandler())
 # string_validator = joined_validators(capitalize_string, strict_discrete_set)
 
 
+def _arb_block(data_points, data_format, dac_limit=32767):
+    """Convert the points of an arbitrary trace to the bytes of a binary block.
+
+    DAC values are sent as big endian 16 bit integers and floating point values as big endian
+    32 bit floats, matching the "FORM:BORD NORM" byte order.
+
+    :param data_points: Sequence or numpy array of points.
+    :param data_format: 'DAC' or 'float', see :meth:`Agilent33500.data_arb`.
+    :param dac_limit: Largest absolute DAC value of the device.
+    :returns: Tuple of the data bytes and the command suffix for the format.
+    """
+    if data_format == "DAC":
+        limit, dtype, suffix = dac_limit, ">i2", ":DAC"
+    elif data_format == "float":
+        limit, dtype, suffix = 1, ">f4", ""
+    elif data_format == "binary":
+        raise NotImplementedError(
+            'Use "DAC" or "float", the data points are transferred in binary format.'
+        )
+    else:
+        raise ValueError(
+            'Undefined format keyword was used. Valid entries are "DAC", "float" and "binary"'
+        )
+    values = np.asarray(data_points)
+    if values.size and np.abs(values).max() > limit:
+        raise ValueError(f"Data points of format {data_format} must be within +-{limit}.")
+    return values.astype(dtype).tobytes(), suffix
+
+
+def _upload_arb(target, cache, command, arb_name, data_bytes):
+    """Send the bytes of an arbitrary trace as an IEEE block, unless the identical trace has
+    already been uploaded under that name.
+
+    :param target: Instrument or channel to write to.
+    :param cache: Dict of the uploaded traces, see :attr:`Agilent33500.arb_cache`.
+    :param command: Command, to which the name and the data block are appended.
+    :returns: True if the trace has been sent, False if it was cached.
+    """
+    key = (target.id if isinstance(target, Channel) else None, arb_name)
+    digest = hashlib.sha1(command.encode() + data_bytes).digest()
+    if cache.get(key) == digest:
+        log.debug("Arbitrary trace '%s' is already uploaded.", arb_name)
+        return False
+    target.write("FORM:BORD NORM")
+    target.write_binary_values(f"{command} {arb_name}, ", data_bytes, datatype="s",
+                               termination="\n")
+    cache[key] = digest
+    return True
+
+
 class Agilent33500Channel(Channel):
     """Implementation of a base Agilent 33500 channel"""
 
@@ -306,15 +360,17 @@ class Agilent33500Channel(Channel):
         if a trace is loaded which already exists in memory.
         """
         self.write("SOUR{ch}:DATA:VOL:CLE")
+        self.parent.arb_cache.clear()
 
     def data_arb(self, arb_name, data_points, data_format="DAC"):
         """
         Uploads an arbitrary trace into the volatile memory of the device for a given channel.
 
-        The data_points can be given as:
-        comma separated 16 bit DAC values (ranging from -32767 to +32767),
-        as comma separated floating point values (ranging from -1.0 to +1.0),
-        or as a binary data stream.
+        The data_points can be given as
+        16 bit DAC values (ranging from -32767 to +32767) or
+        as floating point values (ranging from -1.0 to +1.0), for example as a numpy array.
+        They are transferred as a binary block. A trace, which has already been uploaded with
+        the same name and the same data, is not sent again (see :attr:`Agilent33500.arb_cache`).
         Check the manual for more information. The storage depends on the device type and ranges
         from 8 Sa to 16 MSa (maximum).
 
@@ -324,36 +380,17 @@ class Agilent33500Channel(Channel):
         :param data_points: Individual points of the trace. The format depends on the format
                             parameter.
 
-                            format = 'DAC' (default): Accepts list of integer values ranging from
+                            format = 'DAC' (default): Accepts integer values ranging from
                             -32767 to +32767. Minimum of 8 a maximum of 65536 points.
 
-                            format = 'float': Accepts list of floating point values ranging from
+                            format = 'float': Accepts floating point values ranging from
                             -1.0 to +1.0. Minimum of 8 a maximum of 65536 points.
-
-                            format = 'binary': Accepts a binary stream of 8 bit data.
-        :param data_format: Defines the format of data_points. Can be 'DAC' (default), 'float' or
-                            'binary'. See documentation on parameter data_points above.
+        :param data_format: Defines the format of data_points. Can be 'DAC' (default) or 'float'.
+                            See documentation on parameter data_points above.
         """
-        if data_format == "DAC":
-            separator = ", "
-            data_points_str = [str(item) for item in data_points]  # Turn list entries into strings
-            data_string = separator.join(data_points_str)  # Join strings with separator
-            self.write(f"SOUR{{ch}}:DATA:ARB:DAC {arb_name}, {data_string}")
-            return
-        elif data_format == "float":
-            separator = ", "
-            data_points_str = [str(item) for item in data_points]  # Turn list entries into strings
-            data_string = separator.join(data_points_str)  # Join strings with separator
-            self.write(f"SOUR{{ch}}:DATA:ARB {arb_name}, {data_string}")
-            return
-        elif data_format == "binary":  # TODO: *Binary is not yet implemented*
-            raise NotImplementedError(
-                'The binary format has not yet been implemented. Use "DAC" or "float" instead.'
-            )
-        else:
-            raise ValueError(
-                'Undefined format keyword was used. Valid entries are "DAC", "float" and "binary"'
-            )
+        data_bytes, suffix = _arb_block(data_points, data_format)
+        _upload_arb(self, self.parent.arb_cache, "SOUR{ch}:DATA:ARB" + suffix, arb_name,
+                    data_bytes)
 
 
 class Agilent33500(Instrument):
@@ -398,6 +435,10 @@ class Agilent33500(Instrument):
         super().__init__(
             adapter, name, **kwargs
         )
+        self.arb_cache = {}
+        """Dict of the arbitrary traces uploaded by :meth:`data_arb`, which are not sent again.
+        It is cleared by :meth:`data_volatile_clear`, clear it yourself if the volatile memory
+        was changed otherwise (e.g. by a power cycle)."""
 
     def beep(self):
         """Causes a system beep."""
@@ -692,6 +733,7 @@ class Agilent33500(Instrument):
         will occur if a trace is loaded which already exists in the memory.
         """
         self.write("DATA:VOL:CLE")
+        self.arb_cache.clear()
 
     def phase_sync(self):
         """ Synchronize the phase of all channels."""
@@ -701,10 +743,11 @@ class Agilent33500(Instrument):
         """
         Uploads an arbitrary trace into the volatile memory of the device.
 
-        The data_points can be given as:
-        comma separated 16 bit DAC values (ranging from -32767 to +32767),
-        as comma separated floating point values (ranging from -1.0 to +1.0)
-        or as a binary data stream.
+        The data_points can be given as
+        16 bit DAC values (ranging from -32767 to +32767) or
+        as floating point values (ranging from -1.0 to +1.0), for example as a numpy array.
+        They are transferred as a binary block. A trace, which has already been uploaded with
+        the same name and the same data, is not sent again (see :attr:`arb_cache`).
         Check the manual for more information.
         The storage depends on the device type and ranges
         from 8 Sa to 16 MSa (maximum).
@@ -713,34 +756,15 @@ class Agilent33500(Instrument):
                          trace.
         :param data_points: Individual points of the trace. The format depends on the format
                             parameter.
-                            format = 'DAC' (default): Accepts list of integer values ranging from
+                            format = 'DAC' (default): Accepts integer values ranging from
                             -32767 to +32767. Minimum of 8 a maximum of 65536 points.
-                            format = 'float': Accepts list of floating point values ranging from
+                            format = 'float': Accepts floating point values ranging from
                             -1.0 to +1.0. Minimum of 8 a maximum of 65536 points.
-                            format = 'binary': Accepts a binary stream of 8 bit data.
-        :param data_format: Defines the format of data_points. Can be 'DAC' (default), 'float' or
-                            'binary'. See documentation on parameter data_points above.
+        :param data_format: Defines the format of data_points. Can be 'DAC' (default) or 'float'.
+                            See documentation on parameter data_points above.
         """
-        if data_format == "DAC":
-            separator = ", "
-            data_points_str = [str(item) for item in data_points]  # Turn list entries into strings
-            data_string = separator.join(data_points_str)  # Join strings with separator
-            self.write(f"DATA:ARB:DAC {arb_name}, {data_string}")
-            return
-        elif data_format == "float":
-            separator = ", "
-            data_points_str = [str(item) for item in data_points]  # Turn list entries into strings
-            data_string = separator.join(data_points_str)  # Join strings with separator
-            self.write(f"DATA:ARB {arb_name}, {data_string}")
-            return
-        elif data_format == "binary":  # TODO: *Binary is not yet implemented*
-            raise NotImplementedError(
-                'The binary format has not yet been implemented. Use "DAC" or "float" instead.'
-            )
-        else:
-            raise ValueError(
-                'Undefined format keyword was used. Valid entries are "DAC", "float" and "binary"'
-            )
+        data_bytes, suffix = _arb_block(data_points, data_format)
+        _upload_arb(self, self.arb_cache, "DATA:ARB" + suffix, arb_name, data_bytes)
 
     display = Instrument.setting(
         "DISP:TEXT '%s'",
@@ -25,7 +25,6 @@
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import truncated_range
 
-from io import StringIO
 import numpy as np
 import pandas as pd
 
@@ -39,23 +38,29 @@ class AgilentE4408B(Instrument):
     start_frequency = Instrument.control(
         ":SENS:FREQ:STAR?;", ":SENS:FREQ:STAR %e Hz;",
         """ A floating point property that represents the start frequency
-        in Hz. This property can be set.
-        """
+        in Hz. This property can be set. The value is cached.
+        """,
+        cache=True,
+        invalidates=("stop_frequency",)
     )
     stop_frequency = Instrument.control(
         ":SENS:FREQ:STOP?;", ":SENS:FREQ:STOP %e Hz;",
         """ A floating point property that represents the stop frequency
-        in Hz. This property can be set.
-        """
+        in Hz. This property can be set. The value is cached.
+        """,
+        cache=True,
+        invalidates=("start_frequency",)
     )
     frequency_points = Instrument.control(
         ":SENSe:SWEEp:POINts?;", ":SENSe:SWEEp:POINts %d;",
         """ An integer property that represents the number of frequency
         points in the sweep. This property can take values from 101 to 8192.
+        The value is cached.
         """,
         validator=truncated_range,
         values=[101, 8192],
-        cast=int
+        cast=int,
+        cache=True
     )
     frequency_step = Instrument.control(
         ":SENS:FREQ:CENT:STEP:INCR?;", ":SENS:FREQ:CENT:STEP:INCR %g Hz;",
@@ -67,7 +72,8 @@ class AgilentE4408B(Instrument):
         ":SENS:FREQ:CENT?;", ":SENS:FREQ:CENT %e Hz;",
         """ A floating point property that represents the center frequency
         in Hz. This property can be set.
-        """
+        """,
+        invalidates=("start_frequency", "stop_frequency")
     )
     sweep_time = Instrument.control(
         ":SENS:SWE:TIME?;", ":SENS:SWE:TIME %.2e;",
@@ -87,6 +93,7 @@ class AgilentE4408B(Instrument):
     def frequencies(self):
         """ Returns a numpy array of frequencies in Hz that
         correspond to the current settings of the instrument.
+        The settings are cached until they are set.
         """
         return np.linspace(
             self.start_frequency,
@@ -97,15 +104,12 @@ class AgilentE4408B(Instrument):
 
     def trace(self, number=1):
         """ Returns a numpy array of the data for a particular trace
-        based on the trace number (1, 2, or 3).
+        based on the trace number (1, 2, or 3). The data are
+        transferred in binary format (REAL,32).
         """
-        self.write(":FORMat:TRACe:DATA ASCII;")
-        data = np.loadtxt(
-            StringIO(self.ask(":TRACE:DATA? TRACE%d;" % number)),
-            delimiter=',',
-            dtype=np.float64
-        )
-        return data
+        self.write(":FORMat:TRACe:DATA REAL,32;:TRACE:DATA? TRACE%d;" % number)
+        data = np.frombuffer(self.read_ieee_block(), dtype=">f4")
+        return data.astype(np.float64)
 
     def trace_df(self, number=1):
         """ Returns a pandas DataFrame containing the frequency
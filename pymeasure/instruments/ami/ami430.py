@@ -23,7 +23,7 @@
 #
 
 from pymeasure.instruments import Instrument
-from time import sleep, time
+from pymeasure.instruments.waiting import wait_until
 
 import logging
 log = logging.getLogger(__name__)
@@ -200,15 +200,15 @@ class AMI430(Instrument):
 
     def wait_for_holding(self, should_stop=lambda: False,
                          timeout=800, interval=0.1):
+        """ Blocks the program until the magnet is holding (or paused or at zero current).
+
+        :param should_stop: A function that returns True if the waiting should stop early.
+        :param timeout: A time in seconds after which a TimeoutError is raised.
+        :param interval: The maximum time in seconds between checks of the state.
         """
-        """
-        t = time()
-        while self.state != 2 and self.state != 3 and self.state != 8:
-            sleep(interval)
-            if should_stop():
-                return
-            if (time() - t) > timeout:
-                raise Exception("Timed out waiting for AMI430 switch to warm up.")
+        wait_until(lambda: self.state in (2, 3, 8), timeout=timeout, should_stop=should_stop,
+                   interval=interval,
+                   timeout_message="Timed out waiting for AMI430 switch to warm up.")
 
     def shutdown(self, ramp_rate=0.0357):
         """ Turns on the persistent switch,
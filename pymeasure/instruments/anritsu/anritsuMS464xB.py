@@ -22,6 +22,10 @@
 # THE SOFTWARE.
 #
 import logging
+import re
+from contextlib import contextmanager
+
+import numpy as np
 
 from pymeasure.instruments import Instrument, Channel
 from pymeasure.instruments.validators import (
@@ -32,6 +36,11 @@ from pymeasure.instruments.validators import (
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
+# Commands, which change the cached sweep setup of a channel or of all channels
+_CHANNEL_SWEEP_COMMAND = re.compile(r":?SENS(\d+):(FREQ|SWE)|:?CALC(\d+):PAR\d*:(DEF|COUN)",
+                                    re.IGNORECASE)
+_RESET_COMMAND = re.compile(r"\*RST|:?SYST:PRES|:?SYST:POIN|:?MMEM:LOAD", re.IGNORECASE)
+
 
 class AnritsuMS464xB(Instrument):
     """ A class representing the Anritsu MS464xB Vector Network Analyzer (VNA) series.
@@ -117,6 +126,41 @@ class AnritsuMS464xB(Instrument):
                            frequency_range=self.FREQUENCY_RANGE,
                            **kwargs)
 
+    def write(self, command, **kwargs):
+        """Write a string command to the instrument and forget the cached sweep setup
+        (see :meth:`MeasurementChannel.read_sparameters`) if the command changes it."""
+        for part in command.split(";"):
+            part = part.strip()
+            if "?" in part:
+                continue
+            if _RESET_COMMAND.match(part):
+                for channel in getattr(self, "channels", {}).values():
+                    channel.clear_sweep_cache()
+            else:
+                match = _CHANNEL_SWEEP_COMMAND.match(part)
+                channels = getattr(self, "channels", {})
+                if match and int(match.group(1) or match.group(3)) in channels:
+                    channels[int(match.group(1) or match.group(3))].clear_sweep_cache()
+        super().write(command, **kwargs)
+
+    @contextmanager
+    def _binary_format(self):
+        """Select 8 byte floats (LSB first) with a fixed length block header for the queries
+        within the context and restore the previous data format afterwards."""
+        previous = (self.ask(":FORM:DATA?").strip(),
+                    self.ask(":FORM:BORD?").strip(),
+                    int(self.ask("FDHX?")))
+        self.write(":FORM:DATA REAL;:FORM:BORD SWAP;FDH1")
+        try:
+            yield
+        finally:
+            self.write(":FORM:DATA %s;:FORM:BORD %s;FDH%d" % previous)
+
+    def _binary_values(self, command):
+        """Query an IEEE block of 8 byte floats, to be called within :meth:`_binary_format`."""
+        self.write(command)
+        return np.frombuffer(self.read_ieee_block(), dtype="<f8")
+
     def check_errors(self):
         """ Read all errors from the instrument.
 
@@ -576,6 +620,7 @@ class MeasurementChannel(Channel):
 
     def __init__(self, *args, frequency_range=None, traces=None, **kwargs):
         super().__init__(*args, **kwargs)
+        self.clear_sweep_cache()
 
         for pt in range(self.parent.PORTS):
             self.add_child(Port, pt + 1, collection="ports", prefix="pt_")
@@ -629,6 +674,54 @@ class MeasurementChannel(Channel):
     def check_errors(self):
         return self.parent.check_errors()
 
+    def clear_sweep_cache(self):
+        """Forget the frequencies and trace parameters cached by :meth:`read_sparameters`.
+
+        Commands sent by this driver do that automatically, call it if the sweep setup was
+        changed otherwise, e.g. at the front panel.
+        """
+        self._frequencies = None
+        self._trace_parameters = None
+
+    def read_sparameters(self):
+        """Read the S-parameter data of all traces of the channel.
+
+        The data are transferred in binary format (8 byte floats), with one block per trace;
+        the previous data format, byte order and block header format are restored afterwards.
+        The frequencies and the measurement parameters of the traces are cached until a
+        command of this driver changes them, so repeated sweeps cost one query per trace
+        besides switching the data format.
+        Each trace is selected (activated) for reading.
+
+        :return: structured numpy array with the field "frequency" and a complex field for each
+            trace, named after its measurement parameter (e.g. "S21"); if several traces have
+            the same parameter, the trace number is appended (e.g. "S21_3").
+        """
+        if self._trace_parameters is None:
+            self.update_traces()
+            parameters = []
+            for tr, trace in sorted(self.traces.items()):
+                name = trace.measurement_parameter
+                if name in (n for _, n in parameters):
+                    name = f"{name}_{tr}"
+                parameters.append((tr, name))
+            self._trace_parameters = parameters
+
+        with self.parent._binary_format():
+            if self._frequencies is None:
+                self._frequencies = self.parent._binary_values(
+                    self.insert_id(":SENS{ch}:FREQ:DATA?"))
+            data = np.empty(len(self._frequencies),
+                            dtype=[("frequency", np.float64)]
+                            + [(name, np.complex128) for _, name in self._trace_parameters])
+            data["frequency"] = self._frequencies
+            for tr, name in self._trace_parameters:
+                values = self.parent._binary_values(
+                    self.insert_id(f":CALC{{ch}}:PAR{tr}:SEL;:CALC{{ch}}:DATA:SDAT?"))
+                # Real and imaginary parts alternate
+                data[name] = values.view(np.complex128)
+        return data
+
     def activate(self):
         """ Set the indicated channel as the active channel. """
         self.write(":DISP:WIND{ch}:ACT")
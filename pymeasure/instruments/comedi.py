@@ -115,54 +115,81 @@ class SynchronousAI:
             if rc is None:
                 break
 
-    def measure(self, hasAborted=lambda: False):
-        """ Initiates the scan after first checking the command
-        and does not block, returns the starting timestamp
+    def _start(self):
+        """ Checks the command, starts the scan and triggers it
         """
         self._verifyCommand()
         sleep(0.01)
         self.subdevice.command()
-
-        length = len(self.channels)
-        dtype = self.subdevice.get_dtype()
-        converters = [c.get_converter() for c in self.channels]
-
-        self.data = np.zeros((self.samples, length), dtype=np.float32)
-
-        # Trigger AI
         self.subdevice.device.do_insn(inttrig_insn(self.subdevice))
 
-        # Measurement loop
-        count = 0
-        size = int(self.data.itemsize / 2) * length
-        previous_bin_slice = b''
-
-        while not hasAborted() and self.samples > count:
-            bin_slice = previous_bin_slice
-            while len(bin_slice) < size:
-                bin_slice += self.subdevice.device.file.read(size)
-            previous_bin_slice = bin_slice[size:]
-            bin_slice = bin_slice[:size]
-            slice = np.fromstring(
-                bin_slice,
-                dtype=dtype,
-                count=length
-            )
-
-            if len(slice) != length:  # Reading finished
-                break
+    def chunks(self, hasAborted=lambda: False, chunk_scans=1024, chunk_time=0.1):
+        """ Initiates the scan and yields the measured values in chunks
 
-            # Convert to physical values
-            for i, c in enumerate(converters):
-                self.data[count, i] = c.to_physical(slice[i])
+        The device file is read in blocks of up to `chunk_scans` scans into
+        a preallocated buffer and each channel of a block is converted to
+        physical values at once, such that the number of loop iterations does
+        not grow with the sample rate. At low sample rates, a block is limited
+        to the scans acquired within `chunk_time`, such that neither aborting
+        nor the first data wait for a full block.
 
+        :param hasAborted: Callable returning True to stop the measurement
+        :param chunk_scans: Maximum number of scans per chunk
+        :param chunk_time: Maximum acquisition time of a chunk in seconds
+        :returns: Iterator of float32 arrays of shape (scans, channels)
+        """
+        scan_time = float(self.period) / self.samples
+        chunk_scans = max(1, min(chunk_scans, int(chunk_time / scan_time)))
+        length = len(self.channels)
+        dtype = np.dtype(self.subdevice.get_dtype())
+        converters = [c.get_converter() for c in self.channels]
+        scan_size = dtype.itemsize * length
+        buffer = bytearray(chunk_scans * scan_size)
+        view = memoryview(buffer)
+        file = self.subdevice.device.file
+
+        self._start()
+        try:
+            count = 0
+            filled = 0  # bytes in the buffer
+            while not hasAborted() and count < self.samples:
+                # Do not wait for more bytes than the remaining scans
+                limit = min(len(buffer), (self.samples - count) * scan_size)
+                read = file.readinto(view[filled:limit])
+                if not read:  # Reading finished
+                    break
+                filled += read
+                scans = filled // scan_size
+                if scans == 0:
+                    continue
+                raw = np.frombuffer(buffer, dtype=dtype, count=scans * length)
+                raw = raw.reshape(scans, length)
+                chunk = np.empty((scans, length), dtype=np.float32)
+                for i, c in enumerate(converters):
+                    chunk[:, i] = c.to_physical(raw[:, i])
+                # Keep an incomplete scan for the next read
+                rest = filled - scans * scan_size
+                buffer[:rest] = buffer[scans * scan_size:filled]
+                filled = rest
+                count += scans
+                yield chunk
+        finally:
+            # Cancel measurement if it is still running (abort event)
+            if self.subdevice.get_flags().running:
+                self.subdevice.cancel()
+
+    def measure(self, hasAborted=lambda: False, chunk_scans=1024, chunk_time=0.1):
+        """ Initiates the scan and stores the values in :code:`data`,
+        calling :code:`emit_progress` and :code:`emit_data` for each chunk
+        of scans (see :meth:`chunks`)
+        """
+        self.data = np.zeros((self.samples, len(self.channels)), dtype=np.float32)
+        count = 0
+        for chunk in self.chunks(hasAborted, chunk_scans, chunk_time):
+            self.data[count:count + len(chunk)] = chunk
+            count += len(chunk)
             self.emit_progress(100. * count / self.samples)
-            self.emit_data(self.data[count])
-            count += 1
-
-        # Cancel measurement if it is still running (abort event)
-        if self.subdevice.get_flags().running:
-            self.subdevice.cancel()
+            self.emit_data(chunk)
 
 
 """ Command for limited samples
@@ -24,6 +24,7 @@
 
 from inspect import getmembers
 import logging
+import time
 from warnings import warn
 
 log = logging.getLogger(__name__)
@@ -70,27 +71,109 @@ class DynamicProperty(property):
             return self
         if self.fget is None:
             raise AttributeError(f"Unreadable attribute {self.name}")
-
-        kwargs = {}
-        for attr in self.fget_params_list:
-            attr_instance_name = self.prefix + "_".join([self.name, attr])
-            if hasattr(obj, attr_instance_name):
-                kwargs[attr] = getattr(obj, attr_instance_name)
-        return self.fget(obj, **kwargs)
+        return self.fget(obj, **self._params(obj, self.fget_params_list))
 
     def __set__(self, obj, value):
         if self.fset is None:
             raise AttributeError(f"Can't set attribute {self.name}")
+        self.fset(obj, value, **self._params(obj, self.fset_params_list))
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def _params(self, obj, params_list):
+        """Return the dynamically configured parameters, which `obj` defines."""
         kwargs = {}
-        for attr in self.fset_params_list:
+        for attr in params_list:
             attr_instance_name = self.prefix + "_".join([self.name, attr])
             if hasattr(obj, attr_instance_name):
                 kwargs[attr] = getattr(obj, attr_instance_name)
-        self.fset(obj, value, **kwargs)
+        return kwargs
+
+
+class _PropertyCache:
+    """Cache of the property values of an instrument or channel with statistics.
+
+    The values are stored by property name together with the parameters of a dynamic
+    property, which have been used to read them.
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, name, ttl, params=None):
+        """Return the cached value of property `name` or raise a KeyError."""
+        try:
+            value, timestamp, cached_params = self.entries[name]
+        except KeyError:
+            self.misses += 1
+            raise
+        if cached_params != params or (ttl is not None and time.monotonic() - timestamp > ttl):
+            del self.entries[name]
+            self.misses += 1
+            raise KeyError(name)
+        self.hits += 1
+        return value
+
+    def store(self, name, value, params=None):
+        self.entries[name] = value, time.monotonic(), params
+
+    def discard(self, *names):
+        """Remove the entries of the properties `names`, or all entries."""
+        for name in names or list(self.entries):
+            if self.entries.pop(name, None) is not None:
+                self.invalidations += 1
+
+
+class _CachedProperty(property):
+    """Property, which caches the value read in the property cache of the instance.
+
+    :param ttl: Maximum age of a cached value in seconds, None for no limit.
+    """
+
+    def __init__(self, fget=None, fset=None, fdel=None, doc=None, ttl=None):
+        super().__init__(fget, fset, fdel, doc)
+        self.ttl = ttl
+        self.name = ""
 
     def __set_name__(self, owner, name):
         self.name = name
 
+    def _cache_params(self, obj):
+        return None
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        cache = obj._get_property_cache()
+        params = self._cache_params(obj)
+        try:
+            return cache.get(self.name, self.ttl, params)
+        except KeyError:
+            value = super().__get__(obj, objtype)
+            cache.store(self.name, value, params)
+            return value
+
+    def __set__(self, obj, value):
+        # The instrument might coerce the value, therefore it is read again.
+        obj._get_property_cache().discard(self.name)
+        super().__set__(obj, value)
+
+
+class _CachedDynamicProperty(_CachedProperty, DynamicProperty):
+    """Dynamic property, which caches the value read as long as its parameters do not
+    change."""
+
+    def __init__(self, *args, ttl=None, **kwargs):
+        DynamicProperty.__init__(self, *args, **kwargs)
+        self.ttl = ttl
+
+    def _cache_params(self, obj):
+        return self._params(obj, self.fget_params_list)
+
 
 class CommonBase:
     """Base class for instruments and channels.
@@ -453,6 +536,8 @@ class CommonBase:
         maxsplit=-1,
         cast=float,
         values_kwargs=None,
+        cache=False,
+        invalidates=(),
         **kwargs
     ):
         """Return a property for the class based on the supplied
@@ -493,6 +578,14 @@ class CommonBase:
             -1 (default) indicates no limit.
         :param cast: A type to cast each element of the splitted string.
         :param dict values_kwargs: Further keyword arguments for :meth:`values`.
+        :param cache: Cache the value read from the instrument, for settings which change
+            rarely but are read often. If True, the cached value is returned until the
+            property is set, :meth:`invalidate_cache` or :meth:`~Instrument.reset` is called.
+            A number limits the age of the cached value to this number of seconds.
+            The value of a dynamic property is read again if its parameters changed.
+            Do not cache values, which the instrument may change by itself.
+        :param invalidates: Names of cached properties, whose values change if this
+            property is set, e.g. the start frequency if the span is set.
         :param \\**kwargs: Keyword arguments for :meth:`values`.
 
             .. deprecated:: 0.12
@@ -616,6 +709,8 @@ class CommonBase:
                     'for CommonBase.control'.format(type(values))
                 )
             self.write(command_process(set_command) % value)
+            if invalidates:
+                self.invalidate_cache(*invalidates)
             if check_set_errors:
                 try:
                     error_list = self.check_set_errors()
@@ -632,16 +727,61 @@ class CommonBase:
 
         # Add the specified document string to the getter
         fget.__doc__ = docs
+        ttl = None if cache is True else cache
 
         if dynamic:
             fget.__doc__ += "(dynamic)"
-            return DynamicProperty(fget=fget, fset=fset,
-                                   fget_params_list=CommonBase._fget_params_list,
-                                   fset_params_list=CommonBase._fset_params_list,
-                                   prefix=CommonBase.__reserved_prefix)
+            params = dict(fget=fget, fset=fset,
+                          fget_params_list=CommonBase._fget_params_list,
+                          fset_params_list=CommonBase._fset_params_list,
+                          prefix=CommonBase.__reserved_prefix)
+            if cache:
+                return _CachedDynamicProperty(ttl=ttl, **params)
+            return DynamicProperty(**params)
+        elif cache:
+            return _CachedProperty(fget, fset, ttl=ttl)
         else:
             return property(fget, fset)
 
+    def _get_property_cache(self):
+        """Return the property cache of this instrument or channel."""
+        cache = self.__dict__.get("_property_cache")
+        if cache is None:
+            cache = self.__dict__["_property_cache"] = _PropertyCache()
+        return cache
+
+    def _property_caches(self):
+        """Return the property caches of this instance and of its channels."""
+        caches = [self._get_property_cache()]
+        for child in list(vars(self).values()):
+            if isinstance(child, CommonBase) and getattr(child, "parent", None) is self:
+                caches.extend(child._property_caches())
+        return caches
+
+    def invalidate_cache(self, *names):
+        """Discard cached property values, such that they are read again from the instrument.
+
+        :param names: Names of the properties to invalidate. If no name is given, the cached
+            values of all properties are invalidated, including those of the channels.
+        """
+        if names:
+            self._get_property_cache().discard(*names)
+        else:
+            for cache in self._property_caches():
+                cache.discard()
+
+    def cache_info(self):
+        """Return the statistics of the property cache of the instrument (and its channels).
+
+        :return: Dictionary with the number of cache "hits", "misses", "invalidations"
+            and the number of cached "entries".
+        """
+        caches = self._property_caches()
+        return {"hits": sum(cache.hits for cache in caches),
+                "misses": sum(cache.misses for cache in caches),
+                "invalidations": sum(cache.invalidations for cache in caches),
+                "entries": sum(len(cache.entries) for cache in caches)}
+
     @staticmethod
     def measurement(get_command, docs, values=(), map_values=None,
                     get_process=lambda v: v,
@@ -23,8 +23,8 @@
 #
 
 from pymeasure.instruments import Instrument, RangeException
+from pymeasure.instruments.waiting import wait_until
 
-from time import sleep
 import numpy as np
 import re
 
@@ -192,8 +192,7 @@ class Danfysik8500(Instrument):
         :param delay: The delay time in seconds between each check for stability
         """
         self.wait_for_ready(has_aborted, delay)
-        while not has_aborted() and not self.is_current_stable():
-            sleep(delay)
+        wait_until(self.is_current_stable, should_stop=has_aborted, interval=delay)
 
     def is_current_stable(self):
         """ Returns True if the current is within 0.02 A of the
@@ -215,8 +214,7 @@ class Danfysik8500(Instrument):
         :param has_aborted: A function that returns True if the process should stop waiting
         :param delay: The delay time in seconds between each check for readiness
         """
-        while not has_aborted() and not self.is_ready():
-            sleep(delay)
+        wait_until(self.is_ready, should_stop=has_aborted, interval=delay)
 
     @property
     def status(self):
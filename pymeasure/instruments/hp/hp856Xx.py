@@ -25,6 +25,7 @@
 import logging
 from math import log10
 from enum import Enum, IntFlag
+import numpy as np
 from numpy import arange
 from datetime import datetime
 
@@ -604,6 +605,9 @@ class HP856Xx(Instrument):
         'HP 8560A, 8561B Operating & Programming'
     """
 
+    #: Number of points of a trace
+    TRACE_POINTS = 601
+
     def __init__(self, adapter, name="Hewlett-Packard HP856Xx", **kwargs):
         super().__init__(
             adapter,
@@ -745,7 +749,9 @@ class HP856Xx(Instrument):
         """,
         validator=strict_discrete_set,
         values=[str(e).upper() for e in AmplitudeUnits],
-        set_process=lambda v: str(v).upper()
+        set_process=lambda v: str(v).upper(),
+        cache=True,
+        invalidates=("reference_level",)
     )
 
     def set_auto_couple(self):
@@ -761,6 +767,7 @@ class HP856Xx(Instrument):
         respectively) are used instead.
         """
         self.write("AUTOCPL")
+        self.invalidate_cache("reference_level")
 
     def exchange_traces(self):
         """Exchange the contents of trace A with those of trace B.
@@ -1420,6 +1427,7 @@ class HP856Xx(Instrument):
         the input or output data buffers;
         """
         self.write("IP")
+        self.invalidate_cache()
 
     logarithmic_scale = Instrument.control(
         "LG?", "LG %d",
@@ -1441,7 +1449,8 @@ class HP856Xx(Instrument):
         """,
         cast=int,
         validator=strict_discrete_set,
-        values=[0, 1, 2, 5, 10]
+        values=[0, 1, 2, 5, 10],
+        cache=True
     )
 
     def set_linear_scale(self):
@@ -1451,6 +1460,7 @@ class HP856Xx(Instrument):
         units.
         """
         self.write("LN")
+        self.invalidate_cache("logarithmic_scale")
 
     def set_minimum_hold(self, trace):
         """Update the chosen trace with the minimum signal level detected at
@@ -1773,6 +1783,7 @@ class HP856Xx(Instrument):
         to set the reference level.
         """
         self.write("MKRL")
+        self.invalidate_cache("reference_level")
 
     def set_marker_delta_to_span(self):
         """Set the frequency span equal to the frequency difference between two
@@ -1927,7 +1938,8 @@ class HP856Xx(Instrument):
         """,
         validator=strict_range,
         values=[-200, 30],
-        cast=int
+        cast=int,
+        invalidates=("reference_level",)
     )
 
     normalized_reference_position = Instrument.control(
@@ -2159,6 +2171,7 @@ class HP856Xx(Instrument):
                              (values, str(inp)))
 
         self.write("RCLS %s" % str(inp))
+        self.invalidate_cache()
 
     def recall_trace(self, trace, number):
         """Recalls previously saved trace data to the display. See
@@ -2229,7 +2242,8 @@ class HP856Xx(Instrument):
         :attr:`amplitude_unit`. Minimum reference level is -120.0 dBm or 2.2 uV
 
         Type: :code:`float`
-        """
+        """,
+        cache=True
     )
 
     reference_level_calibration = Instrument.control(
@@ -2278,7 +2292,8 @@ class HP856Xx(Instrument):
         """,
         cast=int,
         values=[-100, 100],
-        validator=strict_range
+        validator=strict_range,
+        invalidates=("reference_level",)
     )
 
     request_service_conditions = Instrument.control(
@@ -2595,43 +2610,44 @@ class HP856Xx(Instrument):
         values=[e for e in TriggerMode]
     )
 
-    def _get_trace_data(self, trace):
-        self.write("TDF M")
-
-        amp_units = str(self.ask("AUNITS?"))
-        ref_lvl = float(self.ask("RL?"))
-        log_scale = float(self.ask("LG?"))
+    def _get_trace_scale(self):
+        """Return the reference level in dBm and the logarithmic scale in dB per division,
+        from the cached :attr:`amplitude_unit`, :attr:`reference_level` and
+        :attr:`logarithmic_scale`."""
+        amp_units = self.amplitude_unit
+        ref_lvl = float(self.reference_level)
+        log_scale = float(self.logarithmic_scale)
 
-        cmd_str = ""
-        if trace is Trace.A:
-            cmd_str += "TRA?"
-        elif trace is Trace.B:
-            cmd_str += "TRB?"
-
-        values = self.values(cmd_str, cast=int)
-
-        if amp_units is AmplitudeUnits.W:
+        if amp_units == AmplitudeUnits.W:
             # calculate dbm from watts
             ref_lvl = (10 * log10(ref_lvl)) + 30
-        elif amp_units is AmplitudeUnits.DBUV:
+        elif amp_units == AmplitudeUnits.DBUV:
             # calculate dbm from dbuv in 50 Ohm system
             ref_lvl = ref_lvl - 107
-        elif amp_units is AmplitudeUnits.V:
+        elif amp_units == AmplitudeUnits.V:
             # calculate dbm from volts in 50 Ohm system
             ref_lvl = 20 * log10((ref_lvl / 0.05) ** 0.5)
-        elif amp_units is AmplitudeUnits.DBMV:
+        elif amp_units == AmplitudeUnits.DBMV:
             # calculate dbm from dbmv
             ref_lvl = ref_lvl - 46.9897
+        return ref_lvl, log_scale
+
+    def _get_trace_data(self, trace):
+        ref_lvl, log_scale = self._get_trace_scale()
+        if log_scale == 0:
+            raise NotImplementedError("Linear scaling isn't supported by get_trace_data_ ")
+
+        cmd_str = "TDF B;"
+        if trace is Trace.A:
+            cmd_str += "TRA?"
+        elif trace is Trace.B:
+            cmd_str += "TRB?"
 
-        result_values = []
-        for value in values:
-            if log_scale != 0:
-                result_value = round(ref_lvl + (log_scale * ((value - 600) / 60)), 2)
-                result_values.append(result_value)
-            else:
-                raise NotImplementedError("Linear scaling isn't supported by get_trace_data_ ")
+        # Binary format: two bytes per point in measurement units, most significant byte first
+        self.write(cmd_str)
+        values = np.frombuffer(self.read_bytes(2 * self.TRACE_POINTS), dtype=">i2")
 
-        return result_values
+        return np.round(ref_lvl + (log_scale * ((values - 600) / 60)), 2).tolist()
 
     def get_trace_data_a(self):
         """
@@ -2639,6 +2655,8 @@ class HP856Xx(Instrument):
 
         The function returns the 601 data points as a list in the amplitude format.
         Right now it doesn't support the linear scaling due to the manual just being wrong.
+        The data are transferred in binary format, the amplitude scale is read from the
+        cached :attr:`amplitude_unit`, :attr:`reference_level` and :attr:`logarithmic_scale`.
         """
         return self._get_trace_data(Trace.A)
 
@@ -2648,6 +2666,8 @@ class HP856Xx(Instrument):
 
         The function returns the 601 data points as a list in the amplitude format.
         Right now it doesn't support the linear scaling due to the manual just being wrong.
+        The data are transferred in binary format, the amplitude scale is read from the
+        cached :attr:`amplitude_unit`, :attr:`reference_level` and :attr:`logarithmic_scale`.
         """
         return self._get_trace_data(Trace.B)
 
@@ -161,6 +161,30 @@ class Instrument(CommonBase):
         """
         return self.adapter.read_bytes(count, **kwargs)
 
+    def read_ieee_block(self, termination_bytes=1):
+        """Read an IEEE 488.2 definite length block (``#<digits><length><data>``).
+
+        The header is read first, such that exactly the announced number of bytes is read,
+        instead of reading until the adapter times out.
+
+        :param int termination_bytes: Number of bytes following the block, e.g. 1 for
+            a line feed, which are read and discarded.
+        :returns bytes: The data of the block.
+        """
+        header = self.read_bytes(2)
+        if header[:1] != b"#":
+            raise ValueError(f"Expected an IEEE 488.2 block, but read {header!r}.")
+        digits = int(header[1:2])
+        if digits == 0:  # Indefinite length block, ends with the message
+            return self.read_bytes(-1, break_on_termchar=True)[:-termination_bytes or None]
+        length = int(self.read_bytes(digits))
+        data = b""
+        while len(data) < length:
+            data += self.read_bytes(length - len(data))
+        if termination_bytes:
+            self.read_bytes(termination_bytes)
+        return data
+
     def write_binary_values(self, command, values, *args, **kwargs):
         """Write binary values to the device.
 
@@ -194,6 +218,7 @@ class Instrument(CommonBase):
 
     def reset(self):
         """ Resets the instrument. """
+        self.invalidate_cache()
         if self.SCPI:
             self.write("*RST")
         else:
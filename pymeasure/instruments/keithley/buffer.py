@@ -23,12 +23,12 @@
 #
 
 import logging
-from time import sleep, time
 
 import numpy as np
 
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import truncated_range
+from pymeasure.instruments.waiting import wait_until
 from pymeasure.adapters import PrologixAdapter
 
 log = logging.getLogger(__name__)
@@ -72,24 +72,22 @@ class KeithleyBuffer:
         return status_bit == 65
 
     def wait_for_buffer(self, should_stop=lambda: False,
-                        timeout=60, interval=0.1):
+                        timeout=60, interval=0.1, srq_timeout=1):
         """ Blocks the program, waiting for a full buffer. This function
-        returns early if the :code:`should_stop` function returns True or
-        the timeout is reached before the buffer is full.
+        returns early if the :code:`should_stop` function returns True.
+        The service request, which :meth:`config_buffer` enables for a full buffer,
+        is used if the adapter supports it, otherwise the status is polled.
 
         :param should_stop: A function that returns True when this function should return early
-        :param timeout: A time in seconds after which this function should return early
-        :param interval: A time in seconds for how often to check if the buffer is full
+        :param timeout: A time in seconds after which a TimeoutError is raised
+        :param interval: A time in seconds for how often to check if the buffer is full,
+            if service requests are not supported
+        :param srq_timeout: The maximum time in seconds to wait for a service request before
+            checking the buffer and :code:`should_stop` again
         """
-        # TODO: Use SRQ initially instead of constant polling
-        # self.adapter.wait_for_srq()
-        t = time()
-        while not self.is_buffer_full():
-            sleep(interval)
-            if should_stop():
-                return
-            if (time() - t) > timeout:
-                raise Exception("Timed out waiting for Keithley buffer to fill.")
+        wait_until(self.is_buffer_full, timeout=timeout, should_stop=should_stop,
+                   interval=interval, srq=self.adapter, srq_timeout=srq_timeout,
+                   timeout_message="Timed out waiting for Keithley buffer to fill.")
 
     @property
     def buffer_data(self):
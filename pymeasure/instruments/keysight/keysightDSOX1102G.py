@@ -391,6 +391,22 @@ class KeysightDSOX1102G(Instrument):
         values={"ascii": "ASC", "word": "WORD", "byte": "BYTE"},
         map_values=True
     )
+    waveform_byteorder = Instrument.control(
+        ":waveform:byteorder?", ":waveform:byteorder %s",
+        """ A string parameter that controls the byte order of "word" formatted data. Can be
+        "msbf" (most significant byte first) or "lsbf".""",
+        validator=strict_discrete_set,
+        values={"msbf": "MSBF", "lsbf": "LSBF"},
+        map_values=True
+    )
+    waveform_unsigned = Instrument.control(
+        ":waveform:unsigned?", ":waveform:unsigned %d",
+        """ A boolean parameter that controls whether "byte" and "word" formatted data are
+        transmitted as unsigned integers.""",
+        validator=strict_discrete_set,
+        values=BOOLS,
+        map_values=True
+    )
 
     @property
     def waveform_preamble(self):
@@ -484,30 +500,66 @@ class KeysightDSOX1102G(Instrument):
         img = self.binary_values(query, header_bytes=10, dtype=np.uint8)
         return bytearray(img)
 
-    def download_data(self, source, points=62500):
-        """ Get data from specified source of oscilloscope. Returned objects are a np.ndarray of
+    def download_data(self, source, points=62500, format_="word"):
+        """ Get data from specified source(s) of oscilloscope. Returned objects are a np.ndarray of
         data values (no temporal axis) and a dict of the waveform preamble, which can be used to
         build the corresponding time values for all data points.
 
         Multimeter will be stopped for proper acquisition.
 
         :param source: measurement source, can be "channel1", "channel2", "function", "fft",
-            "wmemory1", "wmemory2", or "ext".
+            "wmemory1", "wmemory2", or "ext". A list of sources downloads all of them in one call.
         :param points: integer number of points to acquire. Note that oscilloscope may return fewer
             points than specified, this is not an issue of this library. Can be 100, 250, 500, 1000,
             2000, 5000, 10000, 20000, 50000, or 62500.
+        :param format_: transfer format, can be "word" (16 bit), "byte" (8 bit) or "ascii".
+            The binary formats are much faster and are scaled to voltages with the preamble.
 
         :return data_ndarray, waveform_preamble_dict: see waveform_preamble property for dict
-            format.
+            format. If `source` is a list, both are dicts keyed by source.
         """
-        # TODO: Consider downloading from multiple sources at the same time.
-        self.waveform_source = source
+        sources = [source] if isinstance(source, str) else list(source)
+
+        self.waveform_source = sources[0]
         self.waveform_points_mode = "normal"
         self.waveform_points = points
-
-        preamble = self.waveform_preamble
-        data_bytes = self.waveform_data
-        return np.array(data_bytes), preamble
+        self.waveform_format = format_
+        if format_ != "ascii":
+            self.waveform_unsigned = True
+            self.waveform_byteorder = "msbf"
+
+        data = {}
+        preambles = {}
+        for i, src in enumerate(sources):
+            # Transfer settings are shared, only the source changes between downloads
+            if i > 0:
+                self.waveform_source = src
+            preamble = self.waveform_preamble
+            if format_ == "ascii":
+                data[src] = np.array(self.waveform_data)
+            else:
+                data[src] = self._scaled_waveform(preamble)
+            preambles[src] = preamble
+
+        if isinstance(source, str):
+            return data[source], preambles[source]
+        return data, preambles
+
+    def _scaled_waveform(self, preamble):
+        """
+        Reads the binary waveform block of the selected source and scales it to the vertical units
+        with the preamble values.
+        """
+        dtype = np.dtype(">u2") if preamble["format"] == "WORD" else np.dtype(np.uint8)
+        self.write(":waveform:data?")
+        block = self.read_ieee_block()
+        codes = np.frombuffer(block, dtype=dtype, count=len(block) // dtype.itemsize)
+
+        data = codes.astype(np.float64)
+        data -= preamble["yreference"]
+        data *= preamble["yincrement"]
+        data += preamble["yorigin"]
+        return data
 
     def _timebase(self):
         """
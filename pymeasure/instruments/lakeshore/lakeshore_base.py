@@ -24,10 +24,10 @@
 
 import logging
 import numpy as np
-from time import sleep, time
 
 from pymeasure.instruments import Instrument, Channel
 from pymeasure.instruments.validators import strict_discrete_set
+from pymeasure.instruments.waiting import wait_until
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
@@ -56,7 +56,7 @@ class LakeShoreTemperatureChannel(Channel):
                              interval=1, timeout=360,
                              should_stop=lambda: False):
         """ Blocks the program, waiting for the temperature to reach the target
-        within the accuracy (%), checking this each interval time in seconds.
+        within the accuracy (%), checking this at least each interval time in seconds.
 
         :param target: Target temperature in kelvin, celcius, or sensor units.
         :param unit: 'kelvin', 'celcius', or 'sensor' specifying the unit
@@ -64,24 +64,21 @@ class LakeShoreTemperatureChannel(Channel):
         :param accuracy: An acceptable percentage deviation between the
                          target and temperature.
         :param interval: Interval time in seconds between queries.
-        :param timeout: A timeout in seconds after which an exception is raised
+        :param timeout: A timeout in seconds after which a TimeoutError is raised
         :param should_stop: A function that returns True if waiting should stop, by
                             default this always returns False
         """
         abs_tolerance = target * (accuracy / 100)
-        target_reached = False
-        t = time()
-        while not target_reached:
+
+        def target_reached():
             reading = np.array([getattr(self, unit)])
-            target_reached = np.allclose(reading, target, atol=abs_tolerance)
-            sleep(interval)
-            if (time() - t) > timeout:
-                raise Exception((
-                                    "Timeout occurred after waiting %g seconds for "
-                                    "the LakeShore 331 temperature to reach %g %s."
-                                ) % (timeout, target, unit))
-            if should_stop():
-                return
+            return np.allclose(reading, target, atol=abs_tolerance)
+
+        wait_until(target_reached, timeout=timeout, should_stop=should_stop, interval=interval,
+                   timeout_message=(
+                       "Timeout occurred after waiting %g seconds for "
+                       "the LakeShore 331 temperature to reach %g %s."
+                   ) % (timeout, target, unit))
 
 
 class LakeShoreHeaterChannel(Channel):
@@ -22,10 +22,10 @@
 # THE SOFTWARE.
 #
 
-from time import sleep
 
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import strict_discrete_set
+from pymeasure.instruments.waiting import wait_until
 
 
 class AxisError(Exception):
@@ -222,13 +222,20 @@ class Axis:
         """
         self.write("DH")
 
-    def wait_for_stop(self, delay=0, interval=0.05):
+    def wait_for_stop(self, delay=0, interval=0.05, timeout=None, should_stop=lambda: False):
         """ Blocks the program until the motion is completed. A further
         delay can be specified in seconds.
+
+        :param delay: Time in seconds the controller waits after the motion.
+        :param interval: Maximum time in seconds between checks of the motion status.
+        :param timeout: Time in seconds after which a TimeoutError is raised, None waits
+            indefinitely.
+        :param should_stop: A function that returns True if the waiting should stop early.
         """
         self.write("WS%d" % (delay * 1e3))
-        while not self.motion_done:
-            sleep(interval)
+        wait_until(lambda: self.motion_done, timeout=timeout, should_stop=should_stop,
+                   interval=interval,
+                   timeout_message="Timed out waiting for the ESP300 motion to stop.")
 
 
 class ESP300(Instrument):
@@ -27,6 +27,7 @@
 
 import logging
 import ctypes
+import threading
 import numpy as np
 from sys import platform
 
@@ -54,7 +55,105 @@ DAQmx_Val_Cfg_Default = int32(-1)
 DAQmx_Val_Volts = 10348
 DAQmx_Val_Rising = 10280
 DAQmx_Val_FiniteSamps = 10178
+DAQmx_Val_ContSamps = 10123
 DAQmx_Val_GroupByChannel = 1
+DAQmx_Val_GroupByScanNumber = 0
+
+
+class _ContinuousReader(threading.Thread):
+    """Thread reading a continuous analog input task chunk by chunk into a ring buffer.
+
+    :param daq: The :class:`DAQmx` instance owning the task.
+    :param chunk_size: Number of samples per channel read at once.
+    :param buffer_chunks: Number of (decimated) chunks in the ring buffer.
+    :param decimation: Number of samples combined into one.
+    :param average: Average the combined samples instead of taking the first one.
+    :param callback: Callable called in the thread with each new chunk (a view into the
+        ring buffer, copy it to keep it).
+    :param timeout: Timeout of a single read in seconds.
+    """
+
+    def __init__(self, daq, chunk_size, buffer_chunks, decimation, average, callback,
+                 timeout):
+        super().__init__(daemon=True)
+        if chunk_size % decimation:
+            raise ValueError("The chunk size has to be a multiple of the decimation.")
+        self.daq = daq
+        self.chunk_size = chunk_size
+        self.decimation = decimation
+        self.average = average
+        self.callback = callback
+        self.timeout = timeout
+        channels = daq.numChannels
+        self.raw = np.zeros((chunk_size, channels), dtype=np.float64)
+        self.ring = np.zeros((buffer_chunks, chunk_size // decimation, channels),
+                             dtype=np.float64)
+        self.written = 0  # Number of chunks written into the ring buffer
+        self.overruns = 0  # Number of chunks overwritten before being consumed
+        self.error = None
+        self.condition = threading.Condition()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        read = int32()
+        try:
+            while not self._stop_event.is_set():
+                self.daq.CHK(nidaq.DAQmxReadAnalogF64(
+                    self.daq.taskHandleAI, self.chunk_size, float64(self.timeout),
+                    DAQmx_Val_GroupByScanNumber, self.raw.ctypes.data, self.raw.size,
+                    ctypes.byref(read), None))
+                slot = self.ring[self.written % len(self.ring)]
+                if self.decimation == 1:
+                    slot[:] = self.raw
+                elif self.average:
+                    np.mean(self.raw.reshape(len(slot), self.decimation, -1), axis=1, out=slot)
+                else:
+                    slot[:] = self.raw[::self.decimation]
+                with self.condition:
+                    self.written += 1
+                    self.condition.notify_all()
+                if self.callback is not None:
+                    self.callback(slot)
+        except Exception as exc:
+            if not self._stop_event.is_set():
+                log.exception("Continuous acquisition failed.")
+                self.error = exc
+        finally:
+            with self.condition:
+                self._stop_event.set()
+                self.condition.notify_all()
+
+    def stop(self):
+        self._stop_event.set()
+        with self.condition:
+            self.condition.notify_all()
+
+    def chunks(self, timeout=None):
+        """Yield copies of the chunks in the order of acquisition until the reader stops,
+        starting with the oldest chunk in the ring buffer."""
+        index = 0
+        while True:
+            with self.condition:
+                if not self.condition.wait_for(
+                        lambda: self.written > index or self._stop_event.is_set(), timeout):
+                    raise TimeoutError("No data acquired within the timeout.")
+                written = self.written
+            if written == index:  # stopped
+                if self.error is not None:
+                    raise self.error
+                return
+            # The writer fills the slot of chunk `index` again, once `written` reaches
+            # `index + len(self.ring)`, therefore only newer chunks are safe to read.
+            if written - index >= len(self.ring):
+                skipped = written - index - len(self.ring) + 1
+                self.overruns += skipped
+                log.warning("Consumer too slow, %d chunks were overwritten.", skipped)
+                index += skipped
+            chunk = self.ring[index % len(self.ring)].copy()
+            # Check that the chunk was not overwritten while copying it
+            if self.written - index < len(self.ring):
+                index += 1
+                yield chunk
 
 
 class DAQmx:
@@ -69,6 +168,7 @@ class DAQmx:
         self.taskHandleAI = TaskHandle(0)
         self.taskHandleAO = TaskHandle(0)
         self.terminated = False
+        self._reader = None
 
     def setup_analog_voltage_in(self, channelList, numSamples, sampleRate=10000, scale=3.0):
         resourceString = ""
@@ -78,7 +178,7 @@ class DAQmx:
             resourceString += self.resourceName + "/ai" + str(num)
         self.numChannels = len(channelList)
         self.numSamples = numSamples
-        self.taskHandleAI = TaskHandle(0)
+        self._clear_analog_in()
         self.dataBuffer = np.zeros((self.numSamples, self.numChannels), dtype=np.float64)
         self.CHK(nidaq.DAQmxCreateTask("", ctypes.byref(self.taskHandleAI)))
         self.CHK(nidaq.DAQmxCreateAIVoltageChan(self.taskHandleAI, resourceString, "",
@@ -89,6 +189,86 @@ class DAQmx:
                                              DAQmx_Val_Rising, DAQmx_Val_FiniteSamps,
                                              uInt64(self.numSamples)))
 
+    def start_continuous_acquisition(self, channelList, sampleRate=10000, scale=3.0,
+                                     chunk_size=1000, buffer_chunks=16, decimation=1,
+                                     average=True, callback=None, timeout=10.0):
+        """Start a continuous analog voltage acquisition.
+
+        A background thread reads `chunk_size` samples per channel at a time into a
+        preallocated ring buffer of `buffer_chunks` chunks, such that the memory does not
+        grow with the duration of the acquisition. Get the data with :meth:`chunks` or with
+        a `callback`. If the consumer is slower than the acquisition, the oldest chunks are
+        overwritten.
+
+        :param channelList: List of the analog input channels.
+        :param sampleRate: Sample rate in Hz.
+        :param scale: Input range, the voltages are measured between -scale and scale.
+        :param chunk_size: Number of samples per channel read at once.
+        :param buffer_chunks: Number of chunks held in the ring buffer.
+        :param decimation: Number of consecutive samples combined into one sample.
+        :param average: If True, the combined samples are averaged, otherwise only the first
+            of them is kept.
+        :param callback: Callable called in the reader thread with each new chunk, an array
+            of shape (samples, channels), which is overwritten later on.
+        :param timeout: Timeout in seconds for reading one chunk.
+        """
+        self.stop_continuous_acquisition()
+        # A finite task of setup_analog_voltage_in reserves the channels
+        self._clear_analog_in()
+        resourceString = ", ".join(self.resourceName + "/ai" + str(num)
+                                   for num in range(len(channelList)))
+        self.numChannels = len(channelList)
+        self.numSamples = chunk_size
+        self.CHK(nidaq.DAQmxCreateTask("", ctypes.byref(self.taskHandleAI)))
+        self.CHK(nidaq.DAQmxCreateAIVoltageChan(self.taskHandleAI, resourceString, "",
+                                                DAQmx_Val_Cfg_Default,
+                                                float64(-scale), float64(scale),
+                                                DAQmx_Val_Volts, None))
+        # In continuous mode, the number of samples sets the size of the driver's buffer
+        self.CHK(nidaq.DAQmxCfgSampClkTiming(self.taskHandleAI, "", float64(sampleRate),
+                                             DAQmx_Val_Rising, DAQmx_Val_ContSamps,
+                                             uInt64(chunk_size * buffer_chunks)))
+        self._reader = _ContinuousReader(self, chunk_size, buffer_chunks, decimation,
+                                         average, callback, timeout)
+        self.CHK(nidaq.DAQmxStartTask(self.taskHandleAI))
+        self._reader.start()
+
+    def chunks(self, timeout=None):
+        """Yield the chunks of a continuous acquisition until it is stopped.
+
+        Each chunk is an array of shape (samples, channels).
+
+        :param timeout: Maximum time in seconds to wait for a chunk, None waits forever.
+        :raises TimeoutError: If no chunk arrives within the timeout.
+        """
+        if self._reader is None:
+            raise RuntimeError("No continuous acquisition is running.")
+        return self._reader.chunks(timeout)
+
+    @property
+    def overruns(self):
+        """Get the number of chunks of the continuous acquisition, which were overwritten
+        before being read with :meth:`chunks`."""
+        return 0 if self._reader is None else self._reader.overruns
+
+    def stop_continuous_acquisition(self):
+        """Stop the continuous acquisition and its reader thread."""
+        reader, self._reader = self._reader, None
+        if reader is None:
+            return
+        reader.stop()
+        # Stopping the task interrupts a pending read
+        nidaq.DAQmxStopTask(self.taskHandleAI)
+        reader.join()
+        self._clear_analog_in()
+
+    def _clear_analog_in(self):
+        """Stop and clear the analog input task, if there is one."""
+        if self.taskHandleAI.value:
+            nidaq.DAQmxStopTask(self.taskHandleAI)
+            nidaq.DAQmxClearTask(self.taskHandleAI)
+        self.taskHandleAI = TaskHandle(0)
+
     def setup_analog_voltage_out(self, channel=0):
         resourceString = self.resourceName + "/ao" + str(channel)
         self.taskHandleAO = TaskHandle(0)
@@ -145,9 +325,8 @@ class DAQmx:
             return np.zeros(3)
 
     def stop(self):
-        if self.taskHandleAI.value != 0:
-            nidaq.DAQmxStopTask(self.taskHandleAI)
-            nidaq.DAQmxClearTask(self.taskHandleAI)
+        self.stop_continuous_acquisition()
+        self._clear_analog_in()
         if self.taskHandleAO.value != 0:
             nidaq.DAQmxStopTask(self.taskHandleAO)
             nidaq.DAQmxClearTask(self.taskHandleAO)
@@ -156,12 +335,12 @@ class DAQmx:
         """a simple error checking routine"""
         if err < 0:
             buf_size = 100
-            buf = ctypes.create_string_buffer('\000' * buf_size)
+            buf = ctypes.create_string_buffer(buf_size)
             nidaq.DAQmxGetErrorString(err, ctypes.byref(buf), buf_size)
             raise RuntimeError('nidaq call failed with error %d: %s' % (err, repr(buf.value)))
         if err > 0:
             buf_size = 100
-            buf = ctypes.create_string_buffer('\000' * buf_size)
+            buf = ctypes.create_string_buffer(buf_size)
             nidaq.DAQmxGetErrorString(err, ctypes.byref(buf), buf_size)
             raise RuntimeError('nidaq generated warning %d: %s' % (err, repr(buf.value)))
 
@@ -25,6 +25,7 @@
 import logging
 
 import numpy as np
+
 from pymeasure.instruments.validators import strict_discrete_set
 from pymeasure.instruments import Instrument
 
@@ -61,24 +62,30 @@ class FSL(Instrument):
         "FREQ:SPAN?",
         "FREQ:SPAN %s",
         "Frequency span in Hz.",
+        invalidates=("freq_start", "freq_stop"),
     )
 
     freq_center = Instrument.control(
         "FREQ:CENT?",
         "FREQ:CENT %s",
         "Center frequency in Hz.",
+        invalidates=("freq_start", "freq_stop"),
     )
 
     freq_start = Instrument.control(
         "FREQ:STAR?",
         "FREQ:STAR %s",
-        "Start frequency in Hz.",
+        "Start frequency in Hz (cached, as it is the axis of the traces).",
+        cache=True,
+        invalidates=("freq_stop",),
     )
 
     freq_stop = Instrument.control(
         "FREQ:STOP?",
         "FREQ:STOP %s",
-        "Stop frequency in Hz.",
+        "Stop frequency in Hz (cached, as it is the axis of the traces).",
+        cache=True,
+        invalidates=("freq_start",),
     )
 
     attenuation = Instrument.control(
@@ -135,11 +142,16 @@ class FSL(Instrument):
         """
         Read trace data.
 
+        The data are transferred in binary format (REAL,32). The frequency axis is read
+        from the cached :attr:`freq_start` and :attr:`freq_stop`.
+
         :param n_trace: The trace number (1-6). Default is 1.
         :return: 2d numpy array of the trace data, [[frequency], [amplitude]].
         """
-        y = np.array(self.values(f"TRAC{n_trace}? TRACE{n_trace}"))
-        x = np.linspace(self.freq_start, self.freq_stop, len(y))
+        start, stop = self.freq_start, self.freq_stop
+        self.write(f"FORM REAL,32;:TRAC{n_trace}? TRACE{n_trace}")
+        y = np.frombuffer(self.read_ieee_block(), dtype="<f4").astype(np.float64)
+        x = np.linspace(start, stop, len(y))
         return np.array([x, y])
 
     trace_mode = Instrument.control(
@@ -257,3 +269,4 @@ class FSL(Instrument):
                 passed it is interpreted as a frequency span.
             """
             self.write(f"FUNC:ZOOM {value}; *WAI")
+            self.instrument.invalidate_cache("freq_start", "freq_stop")
@@ -22,6 +22,7 @@
 # THE SOFTWARE.
 #
 
+import logging
 import re
 import time
 import numpy as np
@@ -29,6 +30,10 @@ from enum import IntFlag
 from pymeasure.instruments import Instrument, discreteTruncate
 from pymeasure.instruments.validators import strict_discrete_set, \
     truncated_discrete_set, truncated_range
+from pymeasure.instruments.waiting import wait_until
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
 
 
 class LIAStatus(IntFlag):
@@ -59,6 +64,7 @@ class ERRStatus(IntFlag):
 
 class SR830(Instrument):
 
+    BUFFER_SIZE = 16383
     SAMPLE_FREQUENCIES = [
         62.5e-3, 125e-3, 250e-3, 500e-3, 1, 2, 4, 8, 16,
         32, 64, 128, 256, 512
@@ -482,45 +488,94 @@ class SR830(Instrument):
         else:
             return int(query)
 
+    def stream_buffer(self, count=None, has_aborted=lambda: False, interval=0.1,
+                      chunk_size=4096):
+        """ Generator, which yields the data of the buffer in chunks while it fills.
+        The buffer has to be started before (see :meth:`start_buffer`), it is paused when the
+        generator ends. Each chunk is a tuple of two numpy arrays of channel 1 and 2, which are
+        transferred in binary format. Only the current chunk is kept in memory.
+
+        The buffer holds 16383 points. Once they are all read, the buffer is reset and
+        restarted, which causes a short gap in the data, but allows arbitrarily long acquisitions.
+
+        .. code-block:: python
+
+            lockin.reset_buffer()
+            lockin.start_buffer()
+            for ch1, ch2 in lockin.stream_buffer(has_aborted=self.should_stop):
+                for x, y in zip(ch1, ch2):
+                    self.emit('results', {'X': x, 'Y': y})
+
+        :param count: Number of points after which the generator stops, None streams until
+            :code:`has_aborted` returns True.
+        :param has_aborted: A function that returns True if the streaming should stop.
+        :param interval: The maximum time in seconds between checks for new points.
+        :param chunk_size: The maximum number of points per chunk.
+        """
+        index = 0
+        streamed = 0
+        available = 0
+
+        def new_points():
+            nonlocal available
+            available = self.buffer_count
+            return available > index or available >= self.BUFFER_SIZE
+
+        try:
+            while count is None or streamed < count:
+                if not wait_until(new_points, should_stop=has_aborted, interval=interval):
+                    return
+                if available <= index:
+                    # All points of the full buffer have been read
+                    log.debug("SR830 buffer is full, restarting it.")
+                    self.reset_buffer()
+                    self.write("STRT")
+                    index = available = 0
+                    continue
+                end = min(available, index + chunk_size)
+                if count is not None:
+                    end = min(end, index + count - streamed)
+                chunk = (self._buffer_block(1, index, end), self._buffer_block(2, index, end))
+                streamed += end - index
+                index = end
+                yield chunk
+        finally:
+            self.pause_buffer()
+
+    def _buffer_block(self, channel, start, end):
+        """ Read the points from start to end of a channel in binary format (4 byte little
+        endian floats). """
+        self.write("TRCB?%d,%d,%d" % (channel, start, end - start))
+        return np.frombuffer(self.read_bytes(4 * (end - start)), dtype="<f4")
+
     def fill_buffer(self, count, has_aborted=lambda: False, delay=0.001):
+        """ Read count points of both channels from the started buffer, see
+        :meth:`stream_buffer`. Returns two numpy arrays, which are only partially filled
+        if :code:`has_aborted` returns True before.
+        """
         ch1 = np.empty(count, np.float32)
         ch2 = np.empty(count, np.float32)
-        currentCount = self.buffer_count
         index = 0
-        while currentCount < count:
-            if currentCount > index:
-                ch1[index:currentCount] = self.buffer_data(1, index, currentCount)
-                ch2[index:currentCount] = self.buffer_data(2, index, currentCount)
-                index = currentCount
-                time.sleep(delay)
-            currentCount = self.buffer_count
-            if has_aborted():
-                self.pause_buffer()
-                return ch1, ch2
-        self.pauseBuffer()
-        ch1[index : count + 1] = self.buffer_data(1, index, count)  # noqa: E203
-        ch2[index : count + 1] = self.buffer_data(2, index, count)  # noqa: E203
+        for chunk1, chunk2 in self.stream_buffer(count, has_aborted, interval=delay):
+            ch1[index:index + len(chunk1)] = chunk1
+            ch2[index:index + len(chunk2)] = chunk2
+            index += len(chunk1)
         return ch1, ch2
 
     def buffer_measure(self, count, stopRequest=None, delay=1e-3):
+        """ Start the buffer and measure count points. Returns the mean and standard deviation
+        of both channels, or zeros if the :code:`stopRequest` event is set before.
+        """
         self.write("FAST0;STRD")
-        ch1 = np.empty(count, np.float64)
-        ch2 = np.empty(count, np.float64)
-        currentCount = self.buffer_count
-        index = 0
-        while currentCount < count:
-            if currentCount > index:
-                ch1[index:currentCount] = self.buffer_data(1, index, currentCount)
-                ch2[index:currentCount] = self.buffer_data(2, index, currentCount)
-                index = currentCount
-                time.sleep(delay)
-            currentCount = self.buffer_count
-            if stopRequest is not None and stopRequest.isSet():
-                self.pauseBuffer()
-                return (0, 0, 0, 0)
-        self.pauseBuffer()
-        ch1[index:count] = self.buffer_data(1, index, count)
-        ch2[index:count] = self.buffer_data(2, index, count)
+
+        def has_aborted():
+            return stopRequest is not None and stopRequest.is_set()
+
+        ch1, ch2 = self.fill_buffer(count, has_aborted, delay)
+        if has_aborted():
+            return (0, 0, 0, 0)
+        ch1 = ch1.astype(np.float64)
+        ch2 = ch2.astype(np.float64)
         return (ch1.mean(), ch1.std(), ch2.mean(), ch2.std())
 
     def pause_buffer(self):
@@ -534,15 +589,22 @@ class SR830(Instrument):
 
     def wait_for_buffer(self, count, has_aborted=lambda: False,
                         timeout=60, timestep=0.01):
-        """ Wait for the buffer to fill a certain count
+        """ Wait for the buffer to fill a certain count and pause it. Returns False if
+        :code:`has_aborted` returns True before, without pausing the buffer. The buffer is also
+        paused if the timeout is reached first.
+
+        :param count: Number of points to wait for.
+        :param has_aborted: A function that returns True if the waiting should stop.
+        :param timeout: A time in seconds after which the waiting stops.
+        :param timestep: The maximum time in seconds between checks of the buffer count.
         """
-        i = 0
-        while not self.buffer_count >= count and i < (timeout / timestep):
-            time.sleep(timestep)
-            i += 1
-            if has_aborted():
+        try:
+            if not wait_until(lambda: self.buffer_count >= count, timeout=timeout,
+                              should_stop=has_aborted, interval=timestep):
                 return False
-        self.pauseBuffer()
+        except TimeoutError:
+            log.warning("Timeout waiting for %d points in the SR830 buffer.", count)
+        self.pause_buffer()
 
     def get_buffer(self, channel=1, start=0, end=None):
         """ Aquires the 32 bit floating point data through binary transfer
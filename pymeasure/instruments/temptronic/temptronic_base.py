@@ -44,6 +44,7 @@ from pymeasure.instruments.validators import (strict_discrete_set,
                                               truncated_range,
                                               strict_range
                                               )
+from pymeasure.instruments.waiting import wait_until
 
 from enum import IntFlag
 
@@ -703,11 +704,13 @@ class ATSBase(Instrument):
 
         return self
 
-    def wait_for_settling(self, time_limit=300):
+    def wait_for_settling(self, time_limit=300, should_stop=lambda: False):
         """block script execution until TS is settled.
 
         :param time_limit:
             set the maximum blocking time within TS has to settle (float).
+        :param should_stop:
+            function returning ``True`` to stop waiting early.
 
         :returns: self
 
@@ -716,10 +719,11 @@ class ATSBase(Instrument):
         """
 
         time.sleep(1)
-        t = 0
         t_start = time.time()
-        while not self.at_temperature():  # assert at temperature
-            time.sleep(1)
+
+        def settled():
+            if self.at_temperature():  # assert at temperature
+                return True
             t = time.time() - t_start
 
             tstatus = self.temperature_condition_status_code
@@ -735,10 +739,12 @@ class ATSBase(Instrument):
                      self.temperature,
                      t,
                      tstatus)
+            return False
 
-            if t > time_limit:
-                log.info('no settling achieved')
-                break
+        try:
+            wait_until(settled, timeout=time_limit, should_stop=should_stop, interval=1)
+        except TimeoutError:
+            log.info('no settling achieved')
         log.info('finished this temperature point')
 
         return self
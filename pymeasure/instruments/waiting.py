@@ -0,0 +1,103 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+from time import perf_counter, sleep
+
+from pyvisa import constants
+from pyvisa.errors import VisaIOError
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+def wait_until(condition, timeout=None, should_stop=lambda: False,
+               interval=0.1, min_interval=None, backoff=1.5,
+               srq=None, srq_timeout=1, timeout_message=None):
+    """ Block until the `condition` function returns True.
+
+    The condition is checked with an adaptive interval, which starts at `min_interval` and grows
+    by the factor `backoff` after each check up to `interval`. Fast events are thereby noticed
+    quickly, while slow ones do not flood the bus with queries.
+
+    If an adapter is given as `srq`, the function waits for a service request of the device
+    instead of sleeping, and checks the condition after every request (and at least every
+    `srq_timeout` seconds). If the adapter or its connection does not support service requests,
+    the condition is polled instead.
+
+    .. code-block:: python
+
+        wait_until(lambda: instrument.motion_done, timeout=30,
+                   should_stop=procedure.should_stop)
+
+    :param condition: A function that returns True once the waiting is done.
+    :param timeout: A time in seconds after which a :code:`TimeoutError` is raised,
+        None waits indefinitely.
+    :param should_stop: A function that returns True if the waiting should stop early.
+    :param interval: The maximum time in seconds between two checks.
+    :param min_interval: The time in seconds before the second check, defaults to a tenth
+        of `interval`.
+    :param backoff: The factor by which the interval grows after each check.
+    :param srq: An adapter, whose :code:`wait_for_srq` method is used, or None.
+    :param srq_timeout: The maximum time in seconds to wait for a single service request.
+    :param timeout_message: The message of the :code:`TimeoutError`.
+    :returns: True if the condition is met, False if `should_stop` ended the waiting.
+    :raises TimeoutError: if the timeout is exceeded.
+    """
+    deadline = None if timeout is None else perf_counter() + timeout
+    delay = interval / 10 if min_interval is None else min(min_interval, interval)
+    while True:
+        if condition():
+            return True
+        if should_stop():
+            return False
+        remaining = None if deadline is None else deadline - perf_counter()
+        if remaining is not None and remaining <= 0:
+            raise TimeoutError(timeout_message or
+                               f"Timeout of {timeout} s expired while waiting.")
+
+        if srq is not None:
+            pause = srq_timeout if remaining is None else min(srq_timeout, remaining)
+            try:
+                srq.wait_for_srq(timeout=pause)
+            except TimeoutError:
+                continue  # no service request yet, check the condition anyway
+            except VisaIOError as exc:
+                if exc.error_code == constants.StatusCode.error_timeout:
+                    continue
+                log.debug("Connection of %s does not support service requests (%s), "
+                          "polling instead.", srq, exc)
+                srq = None
+                continue
+            except (AttributeError, NotImplementedError):
+                log.debug("Adapter %s does not support service requests, polling instead.", srq)
+                srq = None
+                continue
+            if condition():
+                return True
+            # The request came from another event, do not spin on a pending request
+            remaining = None if deadline is None else max(deadline - perf_counter(), 0)
+
+        sleep(delay if remaining is None else min(delay, remaining))
+        delay = min(delay * backoff, interval)
@@ -108,9 +108,20 @@ def setup_logging(logger=None, console=False, console_level='INFO', filename=Non
 
 
 class TopicQueueHandler(QueueHandler):
-    def __init__(self, queue, topic='log'):
+    """ Puts the log records into a queue as tuples with the topic.
+
+    :param queue: Queue to put the records into.
+    :param topic: Topic of the records.
+    :param picklable: If True, the arguments and exception information are merged into
+        the message, such that the record can be pickled, e.g. for a multiprocessing queue.
+    """
+
+    def __init__(self, queue, topic='log', picklable=False):
         super().__init__(queue)
         self.topic = topic
+        self.picklable = picklable
 
     def prepare(self, record):
+        if self.picklable:
+            record = super().prepare(record)
         return self.topic, record
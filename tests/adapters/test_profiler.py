@@ -0,0 +1,119 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import pytest
+
+from pymeasure.adapters import CommunicationProfiler, PrologixAdapter, ProtocolAdapter
+from pymeasure.adapters.profiler import command_template
+from pymeasure.instruments import Instrument
+from pymeasure.test import expected_protocol
+
+
+@pytest.mark.parametrize("command, template", (
+    ("SOUR2:VOLT 1.5", "SOUR2:VOLT {}"),
+    (":SENS1:FREQ:STAR 2e+09", ":SENS1:FREQ:STAR {}"),
+    ("APPL:SIN 1000,-0.5,.2", "APPL:SIN {},{},{}"),
+    ("*IDN?", "*IDN?"),
+    (b"DATA:ARB a, #14\x00\x01\x02\x03", "DATA:ARB a, <bytes>"),
+    (None, "<read>"),
+))
+def test_command_template(command, template):
+    assert command_template(command) == template
+
+
+@pytest.fixture
+def instrument():
+    return Instrument(ProtocolAdapter([(None, "abc"), ("VOLT 1", None), ("VOLT 2", None),
+                                       ("VOLT?", "2"), (None, "de")]),
+                      "Test")
+
+
+def test_records(instrument):
+    profiler = CommunicationProfiler()
+    profiler.attach(instrument)
+    assert instrument.read() == "abc"
+    instrument.write("VOLT 1")
+    instrument.write("VOLT 2")
+    assert instrument.ask("VOLT?") == "2"
+    assert instrument.read() == "de"  # belongs to the last exchange
+    records = list(profiler.records)
+    assert [r.command for r in records] == [None, "VOLT 1", "VOLT 2", "VOLT?"]
+    assert [r.instrument for r in records] == ["Test"] * 4
+    assert records[0].bytes_in == 3
+    assert records[1].bytes_in == 0
+    assert records[3].bytes_out == 5
+    assert records[3].bytes_in == 3
+    assert records[3].wait_time >= 0
+
+
+def test_summary_and_report(instrument):
+    profiler = CommunicationProfiler()
+    profiler.attach(instrument, name="dev")
+    instrument.read()
+    instrument.write("VOLT 1")
+    instrument.write("VOLT 2")
+    instrument.ask("VOLT?")
+    summary = profiler.summary()
+    assert summary.loc[("dev", "VOLT {}"), "count"] == 2
+    assert summary.loc[("dev", "VOLT?"), "bytes_in"] == 1
+    assert summary["fraction"].sum() == pytest.approx(1)
+    histograms = profiler.histograms()
+    assert histograms[("dev", "VOLT {}")][0].sum() == 2
+    report = profiler.report()
+    assert "4 message exchanges" in report
+    assert "VOLT {}" in report
+
+
+def test_prologix_read_belongs_to_query():
+    with expected_protocol(
+            PrologixAdapter,
+            [("++auto 0", None), ("++eoi 1", None), ("++eos 2", None),
+             ("++addr 5", None), ("VOLT?", None), ("++read eoi", "2.5")],
+            address=5,
+    ) as adapter:
+        profiler = CommunicationProfiler()
+        profiler.attach(adapter, name="dev")
+        adapter.write("VOLT?")
+        assert adapter.read() == "2.5"
+    records = list(profiler.records)
+    assert [r.command for r in records] == ["++addr 5", "VOLT?"]
+    assert records[1].bytes_in == 3
+    assert records[1].read_time > 0
+
+
+def test_detach(instrument):
+    profiler = CommunicationProfiler(max_records=1)
+    profiler.attach(instrument)
+    instrument.read()
+    instrument.write("VOLT 1")
+    instrument.write("VOLT 2")
+    assert [r.command for r in profiler.records] == ["VOLT 2"]
+    profiler.detach()
+    assert instrument.adapter.profiler is None
+    instrument.ask("VOLT?")
+    assert len(profiler.records) == 1
+
+
+def test_empty_report():
+    assert CommunicationProfiler().report() == "No communication recorded."
@@ -0,0 +1,97 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import io
+import re
+
+import pytest
+
+from pymeasure.adapters import SimulatedAdapter
+from pymeasure.instruments import Instrument
+
+
+def test_response_table():
+    adapter = SimulatedAdapter({"*IDN?": "ACME", re.compile(r"VOLT [\d.]+"): None,
+                                "MEAS?": lambda command: "1.5"}, sleep=None)
+    instrument = Instrument(adapter, "Test")
+    assert instrument.ask("*IDN?") == "ACME"
+    instrument.write("VOLT 2.5")
+    assert instrument.values("MEAS?") == [1.5]
+    with pytest.raises(ValueError, match="No simulated response"):
+        instrument.write("CURR 1")
+    with pytest.raises(ValueError, match="No simulated response to read"):
+        instrument.read()
+
+
+def test_not_strict():
+    adapter = SimulatedAdapter(strict=False, sleep=None)
+    adapter.write("CURR 1")
+
+
+def test_transcript_replay():
+    stream = io.BytesIO(b"WRITE:*IDN?\nREAD:ACME\nWRITE:VOLT 1\nREAD:a\nREAD:b\n")
+    adapter = SimulatedAdapter(transcript=stream, loop=True, sleep=None)
+    for _ in range(2):
+        adapter.write("*IDN?")
+        assert adapter.read() == "ACME"
+        adapter.write("VOLT 1")
+        assert adapter.read_bytes(1) == b"a"
+        assert adapter.read_bytes(1) == b"b"
+    with pytest.raises(ValueError):
+        adapter.write("VOLT 2")
+
+
+def test_transcript_without_loop():
+    adapter = SimulatedAdapter(transcript=[("A", None), (None, "x")], sleep=None)
+    adapter.write("A")
+    assert adapter.read() == "x"
+    with pytest.raises(ValueError):
+        adapter.write("A")
+
+
+def test_timing():
+    sleeps = []
+    adapter = SimulatedAdapter({"MEAS?": "12345", "VOLT 1": None},
+                               latency=0.01, command_latency={"MEAS": 0.1},
+                               bandwidth=1000, sleep=sleeps.append)
+    adapter.write("VOLT 1")
+    assert sleeps == [pytest.approx(0.006), pytest.approx(0.01)]
+    adapter.write("MEAS?")
+    assert len(sleeps) == 3  # processing time passes while reading
+    assert adapter.read() == "12345"
+    assert sleeps[3:] == [pytest.approx(0.1), pytest.approx(0.005)]
+    assert adapter.elapsed == pytest.approx(sum(sleeps))
+    adapter.rewind()
+    assert adapter.elapsed == 0
+
+
+def test_jitter_is_reproducible():
+    def times(seed):
+        adapter = SimulatedAdapter({"A": None}, jitter=1e-3, seed=seed, sleep=None)
+        for _ in range(5):
+            adapter.write("A")
+        return adapter.elapsed
+
+    assert times(3) == times(3)
+    assert 0 < times(3) <= 5e-3
@@ -0,0 +1,128 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import numpy as np
+import pyqtgraph as pg
+import pytest
+
+from pymeasure.display.curves import ResultsCurve
+from pymeasure.display.loader import ResultsLoader, read_preview
+from pymeasure.experiment import Procedure, Results
+
+
+class LoaderProcedure(Procedure):
+    DATA_COLUMNS = ["x", "y"]
+
+
+def write_results(filename, rows):
+    results = Results(LoaderProcedure(), str(filename))
+    with open(filename, "a") as file:
+        for i in range(rows):
+            file.write(results.format({"x": i, "y": i ** 2}) + "\n")
+    return str(filename)
+
+
+@pytest.mark.parametrize("length, max_points", [
+    (0, 5), (1, 5), (10, 20), (10, 5), (11, 5), (10, 3), (10, None), (100, 7),
+])
+def test_read_preview(tmp_path, monkeypatch, length, max_points):
+    monkeypatch.setattr(Results, "CHUNK_SIZE", 4)
+    preview = read_preview(write_results(tmp_path / "data.csv", length), max_points)
+    x = preview["x"].to_numpy()
+    if max_points is None or length <= max_points:
+        assert np.array_equal(x, np.arange(length))
+        return
+    assert len(x) <= max_points + 1  # Including the last row
+    assert x[0] == 0 and x[-1] == length - 1
+    assert len(set(np.diff(x[:-1]))) == 1  # Evenly spaced
+
+
+def test_read_preview_cancelled(tmp_path, monkeypatch):
+    monkeypatch.setattr(Results, "CHUNK_SIZE", 4)
+    filename = write_results(tmp_path / "data.csv", 10)
+    assert read_preview(filename, 5, should_stop=lambda: True) is None
+
+
+@pytest.fixture
+def loader(qapp):
+    loader = ResultsLoader(max_threads=2, preview_points=10)
+    yield loader
+    loader.shutdown()
+
+
+def test_load(qtbot, tmp_path, loader):
+    filenames = [write_results(tmp_path / f"data{i}.csv", 100) for i in range(3)]
+    loaded = []
+    loader.loaded.connect(loaded.append)
+    with qtbot.waitSignal(loader.finished, timeout=5000):
+        loader.load(filenames, LoaderProcedure)
+    assert sorted(results.data_filename for results in loaded) == filenames
+    for results in loaded:
+        assert not results.loaded  # Only the preview is kept
+        assert len(results.preview) <= 11  # Including the last row
+        assert results.preview["x"].iloc[-1] == 99
+        assert len(results.data) == 100
+    assert not loader.is_loading()
+
+
+def test_load_failure(qtbot, tmp_path, loader):
+    with qtbot.waitSignal(loader.failed, timeout=5000) as blocker:
+        loader.load([str(tmp_path / "missing.csv")], LoaderProcedure)
+    assert blocker.args[0].endswith("missing.csv")
+
+
+def test_cancel(qtbot, tmp_path, loader):
+    filenames = [write_results(tmp_path / f"data{i}.csv", 10) for i in range(20)]
+    loaded, progress = [], []
+    loader.loaded.connect(loaded.append)
+    loader.progress.connect(lambda done, total: progress.append((done, total)))
+    with qtbot.waitSignal(loader.finished, timeout=1000):
+        loader.load(filenames, LoaderProcedure)
+        loader.cancel()
+    assert progress[-1] == (20, 20)
+    qtbot.wait(100)  # Jobs which were running are ignored
+    assert loaded == []
+    assert not loader.is_loading()
+
+
+def test_curve_plots_preview_until_zoomed(qtbot, tmp_path):
+    filename = write_results(tmp_path / "data.csv", 1000)
+    results = Results.load(filename, LoaderProcedure, lazy=True)
+    results.preview = read_preview(filename, 10)
+    widget = pg.PlotWidget()
+    qtbot.addWidget(widget)
+    curve = ResultsCurve(results, "x", "y", pen=pg.mkPen())
+    widget.addItem(curve)
+    curve.update_data()
+    assert len(curve.xData) == len(results.preview)
+    assert not results.loaded
+
+    widget.setXRange(0, 100, padding=0)
+    assert curve.full_resolution
+    assert len(curve.xData) == 1000
+
+    widget.setXRange(0, 999, padding=0)
+    assert not curve.full_resolution
+    assert len(curve.xData) == len(results.preview)
@@ -0,0 +1,184 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+from types import SimpleNamespace
+
+import pytest
+
+from pymeasure.display.manager import BaseManager, PendingSequence
+from pymeasure.experiment import Procedure
+
+
+class FakeExperiment:
+    def __init__(self, entry, resources=None):
+        self.entry = entry
+        self.procedure = SimpleNamespace(status=Procedure.QUEUED,
+                                         get_resources=lambda: resources)
+
+
+def make_experiment(entry):
+    return FakeExperiment(entry)
+
+
+class TestPendingSequence:
+    def test_length_from_sequence(self):
+        pending = PendingSequence([1, 2, 3], lambda entry: None)
+        assert pending.length == 3
+        assert pending.remaining == 3
+
+    def test_generator_without_length(self):
+        queued = []
+        pending = PendingSequence((i for i in range(2)), queued.append)
+        assert pending.remaining is None
+        pending.queue_next()
+        pending.queue_next()
+        assert queued == [0, 1]
+        assert not pending.has_next()
+        assert pending.remaining == 0
+        with pytest.raises(StopIteration):
+            pending.queue_next()
+
+    def test_eta(self):
+        pending = PendingSequence([1, 2, 3], lambda entry: None)
+        assert pending.eta() is None
+        pending.queue_next()
+        experiment = object()
+        pending.experiment_queued(experiment)
+        pending.experiment_finished(object(), 100)  # not from this sequence
+        pending.experiment_finished(experiment, 2)
+        assert pending.eta() == pytest.approx(4)
+
+
+class TestManagerPendingSequence:
+    def test_generates_only_when_needed(self):
+        manager = BaseManager()
+        manager._start_on_add = False
+        pending = PendingSequence(
+            range(3), lambda entry: manager.queue(make_experiment(entry))
+        )
+        manager.queue_sequence(pending)
+        assert len(manager.experiments.queue) == 0
+        assert manager.experiments.has_next()
+
+        manager._queue_pending()
+        assert [e.entry for e in manager.experiments.queue] == [0]
+        # A queued experiment is available, nothing else is generated
+        manager._queue_pending()
+        assert len(manager.experiments.queue) == 1
+
+        manager.experiments[0].procedure.status = Procedure.FINISHED
+        manager._queue_pending()
+        assert [e.entry for e in manager.experiments.queue] == [0, 1]
+        assert pending.remaining == 1
+
+    def test_exhausted_sequence_is_removed(self):
+        manager = BaseManager()
+        manager._start_on_add = False
+        pending = PendingSequence(
+            [0], lambda entry: manager.queue(make_experiment(entry))
+        )
+        manager.queue_sequence(pending)
+        manager._queue_pending()
+        assert manager.experiments.pending == []
+
+    def test_failing_sequence_is_removed(self):
+        def fail(entry):
+            raise ValueError("Invalid parameter")
+
+        manager = BaseManager()
+        manager._start_on_add = False
+        manager.queue_sequence(PendingSequence(range(3), fail))
+        manager._queue_pending()
+        assert manager.experiments.pending == []
+        assert not manager.experiments.has_next()
+
+
+class TestManagerScheduling:
+    @pytest.fixture
+    def manager(self):
+        manager = BaseManager(max_workers=3)
+        manager._start_on_add = False
+        return manager
+
+    def startable(self, manager, *resources):
+        for i, res in enumerate(resources):
+            manager.queue(FakeExperiment(i, res))
+        return [experiment.entry for experiment in manager._startable()]
+
+    def test_disjoint_resources_run_in_parallel(self, manager):
+        assert self.startable(manager, {"A"}, {"B"}, {"C"}, {"D"}) == [0, 1, 2]
+
+    def test_overlapping_resources_wait(self, manager):
+        assert self.startable(manager, {"A", "B"}, {"B"}, {"C"}) == [0, 2]
+
+    def test_waiting_experiment_is_not_overtaken(self, manager):
+        assert self.startable(manager, {"A"}, {"A", "B"}, {"B"}, {"C"}) == [0, 3]
+
+    def test_undeclared_resources_run_alone(self, manager):
+        assert self.startable(manager, None, {"A"}) == [0]
+        manager.experiments.queue.clear()
+        assert self.startable(manager, {"A"}, None, {"B"}) == [0]
+
+    def test_exclusive_waits_for_running_without_resources(self, manager):
+        running = FakeExperiment("running", set())
+        manager._running_experiments[running] = SimpleNamespace(resources=frozenset())
+        assert self.startable(manager, None, {"A"}) == []
+        manager._running_experiments.clear()
+        assert self.startable(manager) == [0]
+
+    def test_single_worker(self):
+        manager = BaseManager()
+        manager._start_on_add = False
+        assert self.startable(manager, {"A"}, {"B"}) == [0]
+
+    def test_worker_ports(self, manager, monkeypatch):
+        ports = []
+
+        class FakeWorker:
+            def __init__(self, results, port, log_level):
+                ports.append(port)
+                self.monitor_queue = None
+
+            def start(self):
+                pass
+
+        class FakeMonitor(SimpleNamespace):
+            def __init__(self, queue):
+                super().__init__()
+                for signal in ("worker_running", "worker_failed", "worker_abort_returned",
+                               "worker_finished", "progress", "status", "log"):
+                    setattr(self, signal, SimpleNamespace(connect=lambda slot: None))
+
+            def start(self):
+                pass
+
+        manager.worker_class = FakeWorker
+        monkeypatch.setattr("pymeasure.display.manager.Monitor", FakeMonitor)
+        for i, res in enumerate(({"A"}, {"B"}, {"C"})):
+            experiment = FakeExperiment(i, res)
+            experiment.results = None
+            manager.queue(experiment)
+        manager.next()
+        assert ports == [5888, 5889, 5890]
+        assert len(manager.running_experiments()) == 3
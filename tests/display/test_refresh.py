@@ -0,0 +1,202 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pyqtgraph as pg
+import pytest
+
+from pymeasure.display.curves import ResultsCurve, ResultsImage
+from pymeasure.display.refresh import RefreshScheduler
+from pymeasure.display.widgets.plot_frame import PlotFrame
+from pymeasure.display.widgets.table_widget import ResultsTable, Table
+from pymeasure.experiment import Procedure
+
+
+class FakeResults:
+    """Results with an in-memory data frame, counting the polls of its data."""
+
+    def __init__(self, rows=0, status=Procedure.RUNNING):
+        self.procedure = SimpleNamespace(status=status, x_start=0, x_end=2, x_step=1,
+                                         y_start=0, y_end=1, y_step=1)
+        self.frame = pd.DataFrame(columns=["x", "y", "z"], dtype=float)
+        self.polls = 0
+        self.add_rows(rows)
+
+    def add_rows(self, count):
+        start = len(self.frame)
+        index = np.arange(start, start + count)
+        new = pd.DataFrame({"x": index % 3, "y": index // 3 % 2, "z": index * 1.5})
+        self.frame = pd.concat([self.frame, new], ignore_index=True)
+
+    @property
+    def data(self):
+        self.polls += 1
+        return self.frame
+
+    def reload(self):
+        pass
+
+
+@pytest.fixture
+def scheduler(qapp):
+    scheduler = RefreshScheduler(refresh_time=0.2, adaptive=False)
+    yield scheduler
+    scheduler.timer.stop()
+
+
+@pytest.fixture
+def frame(qtbot, scheduler):
+    frame = PlotFrame("x", "y", refresh_time=None)
+    qtbot.addWidget(frame)
+    frame.show()
+    scheduler.register(frame)
+    return frame
+
+
+def add_curve(frame, results):
+    curve = ResultsCurve(results, "x", "y", pen=pg.mkPen())
+    frame.plot.addItem(curve)
+    return curve
+
+
+def test_results_polled_once_per_tick(qtbot, scheduler, frame):
+    table = Table(refresh_time=None)
+    qtbot.addWidget(table)
+    table.show()
+    scheduler.register(table)
+    results = FakeResults(rows=4)
+    curves = [add_curve(frame, results) for i in range(3)]
+    table.add_table(ResultsTable(results, pg.intColor(0)))
+    results.polls = 0
+
+    scheduler.refresh()
+    assert results.polls == 1
+    assert all(len(curve.xData) == 4 for curve in curves)
+
+    results.add_rows(2)
+    scheduler.refresh()
+    assert results.polls == 2
+    assert all(len(curve.xData) == 6 for curve in curves)
+    assert table.source_model().rowCount() == 6
+
+
+def test_items_without_new_rows_are_skipped(scheduler, frame):
+    results = FakeResults(rows=4)
+    curve = add_curve(frame, results)
+    calls = []
+    curve.sigPlotChanged.connect(calls.append)
+    scheduler.refresh()
+    scheduler.refresh()
+    assert len(calls) == 1
+
+
+def test_preview_curves_do_not_poll_data(scheduler, frame):
+    frame.check_status = False  # Refresh the finished results
+    results = FakeResults(rows=10, status=Procedure.FINISHED)
+    results.preview = results.frame.iloc[::5]
+    curve = add_curve(frame, results)
+    results.polls = 0
+    scheduler.refresh()
+    scheduler.refresh()
+    assert results.polls == 0
+    assert len(curve.xData) == 2
+
+    curve.full_resolution = True
+    scheduler.refresh()
+    assert results.polls == 1
+    assert len(curve.xData) == 10
+
+
+def test_check_status(scheduler, frame):
+    running = FakeResults(rows=3)
+    finished = FakeResults(rows=3, status=Procedure.FINISHED)
+    add_curve(frame, running)
+    add_curve(frame, finished)
+    scheduler.refresh()
+    assert running.polls == 1
+    assert finished.polls == 0
+
+
+def test_hidden_widget_is_refreshed_when_shown(scheduler, frame):
+    results = FakeResults(rows=3)
+    curve = add_curve(frame, results)
+    frame.hide()
+    scheduler.refresh()
+    assert results.polls == 0
+    # Shown again, the curves are refreshed once even without running procedure
+    results.procedure.status = Procedure.FINISHED
+    frame.show()
+    scheduler.refresh()
+    assert len(curve.xData) == 3
+    results.add_rows(1)
+    scheduler.refresh()
+    assert len(curve.xData) == 3
+
+
+def test_refreshed_is_called_for_hidden_widgets(qtbot, scheduler, frame):
+    frame.hide()
+    with qtbot.waitSignal(frame.updated, timeout=100):
+        scheduler.refresh()
+
+
+def test_unregister_stops_timer(scheduler, frame):
+    assert scheduler.timer.isActive()
+    scheduler.unregister(frame)
+    assert not scheduler.timer.isActive()
+
+
+def test_adaptive_interval(scheduler, frame):
+    scheduler.adaptive = True
+    scheduler.last_duration = 0.4
+    scheduler._adapt()
+    assert scheduler.interval == pytest.approx(0.8)
+    assert scheduler.timer.interval() == 800
+    scheduler.last_duration = 10
+    scheduler._adapt()
+    assert scheduler.interval == scheduler.max_refresh_time
+    scheduler.last_duration = 0.001
+    scheduler._adapt()
+    assert scheduler.interval == scheduler.refresh_time
+
+
+def test_shared_scheduler(qapp):
+    assert RefreshScheduler.shared(0.3) is RefreshScheduler.shared(0.3)
+    assert RefreshScheduler.shared(0.3) is not RefreshScheduler.shared(0.4)
+
+
+def test_image_updates_incrementally(qapp):
+    results = FakeResults(rows=2)
+    image = ResultsImage(results, "x", "y", "z")
+    image.update_data()
+    results.add_rows(4)
+    image.update_data(results.frame)
+
+    expected = np.array([[0, 1.5, 3], [4.5, 6, 7.5]])
+    np.testing.assert_array_equal(image.values, expected)
+    colors = image.colormap((expected - 0) / 7.5)
+    np.testing.assert_allclose(image.img_data, colors)
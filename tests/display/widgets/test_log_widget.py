@@ -0,0 +1,98 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+
+import pytest
+
+from pymeasure.display.widgets import LogWidget
+
+
+@pytest.fixture
+def widget(qtbot):
+    wdg = LogWidget("Log")
+    qtbot.addWidget(wdg)
+    return wdg
+
+
+def record(message, level=logging.INFO):
+    return logging.LogRecord("test", level, __file__, 1, message, None, None)
+
+
+def test_messages_are_appended_in_batches(qtbot, widget):
+    for i in range(3):
+        widget.handler.emit(record(f"message {i}"))
+    assert widget.view.toPlainText() == ""
+    qtbot.waitUntil(lambda: widget.view.blockCount() == 3)
+    lines = widget.view.toPlainText().splitlines()
+    assert [line.split(" : ")[1] for line in lines] == [
+        f"message {i} (INFO)" for i in range(3)]
+
+
+def test_repeated_messages_are_aggregated(widget):
+    for _ in range(5):
+        widget.handler.emit(record("same"))
+    widget.flush()
+    assert widget.view.toPlainText().endswith("same (INFO) [repeated 5 times]")
+
+
+def test_excess_messages_are_dropped(widget):
+    widget.max_pending = 2
+    for i in range(5):
+        widget.handler.emit(record(f"message {i}"))
+    widget.flush()
+    lines = widget.view.toPlainText().splitlines()
+    assert lines[0] == "3 log messages dropped"
+    assert lines[1].endswith("message 3 (INFO)")
+    assert len(lines) == 3
+
+
+def test_errors_are_not_dropped(widget):
+    widget.max_pending = 3
+    for i in range(50):
+        widget.handler.emit(record(f"debug {i}", logging.DEBUG))
+    widget.handler.emit(record("failure", logging.ERROR))
+    widget.handler.emit(record("alert", logging.CRITICAL))
+    for i in range(50, 100):
+        widget.handler.emit(record(f"debug {i}", logging.DEBUG))
+    widget.flush()
+    lines = widget.view.toPlainText().splitlines()
+    assert lines[0] == "99 log messages dropped"
+    assert lines[1].endswith("failure (ERROR)")
+    assert lines[2].endswith("alert (CRITICAL)")
+    assert lines[3].endswith("debug 99 (DEBUG)")
+
+
+def test_retained_blocks_are_limited(qtbot):
+    LogWidget.max_blocks, default = 5, LogWidget.max_blocks
+    try:
+        wdg = LogWidget("Log")
+    finally:
+        LogWidget.max_blocks = default
+    qtbot.addWidget(wdg)
+    for i in range(10):
+        wdg.handler.emit(record(f"message {i}"))
+    wdg.flush()
+    assert wdg.view.blockCount() == 5
+    assert wdg.view.toPlainText().endswith("message 9 (INFO)")
@@ -0,0 +1,57 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import os
+
+from pymeasure.display.widgets.results_dialog import ResultsDialog
+from pymeasure.experiment import FloatParameter, Procedure, Results
+
+
+class FieldProcedure(Procedure):
+    field = FloatParameter("Field", units="T", default=0.)
+    DATA_COLUMNS = ["x"]
+
+
+def test_filter(qtbot, tmp_path):
+    for field in (0.5, 1.5):
+        procedure = FieldProcedure()
+        procedure.field = field
+        Results(procedure, str(tmp_path / f"data{field}.csv"))
+    dialog = ResultsDialog(FieldProcedure)
+    qtbot.addWidget(dialog)
+    dialog.setDirectory(str(tmp_path))
+
+    dialog.filter_edit.setText("Field > 1 T")
+    dialog.update_filter()
+    assert dialog.filter_model.filenames == {os.path.normpath(tmp_path / "data1.5.csv")}
+
+    dialog.filter_edit.setText("Field")  # Invalid, the filter is kept
+    dialog.update_filter()
+    assert "Invalid condition" in dialog.filter_edit.toolTip()
+    assert len(dialog.filter_model.filenames) == 1
+
+    dialog.filter_edit.setText("")
+    dialog.update_filter()
+    assert dialog.filter_model.filenames is None
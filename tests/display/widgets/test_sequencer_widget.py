@@ -0,0 +1,55 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+from types import SimpleNamespace
+from unittest import mock
+
+from pymeasure.display.widgets.sequencer_widget import SequencerWidget
+
+
+class QueueingWindow:
+    def __init__(self):
+        self.queued = []
+
+    def make_procedure(self):
+        return mock.MagicMock()
+
+    def queue(self, procedure=None, **kwargs):
+        self.queued.append(kwargs)
+
+
+def test_queue_entry_without_reserved_filenames():
+    window = QueueingWindow()
+    sequencer = SimpleNamespace(_parent=window)
+    SequencerWidget._queue_entry(sequencer, {}, None, {"delay": 1})
+    assert window.queued == [{}]
+
+
+def test_queue_entry_with_reserved_filenames():
+    window = QueueingWindow()
+    sequencer = SimpleNamespace(_parent=window)
+    filenames = iter(["a.csv", "b.csv"])
+    SequencerWidget._queue_entry(sequencer, {}, filenames, {"delay": 1})
+    SequencerWidget._queue_entry(sequencer, {}, filenames, {"delay": 2})
+    assert window.queued == [{"filename": "a.csv"}, {"filename": "b.csv"}]
@@ -0,0 +1,126 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import numpy as np
+import pandas as pd
+import pyqtgraph as pg
+import pytest
+
+from pymeasure.display.widgets.table_widget import (PandasModelByColumn, PandasModelByRow,
+                                                    ResultsTable)
+
+
+class FakeResults:
+    def __init__(self, rows, offset=0):
+        self.data = pd.DataFrame(columns=["x", "y"], dtype=float)
+        self.offset = offset
+        self.add_rows(rows)
+
+    def add_rows(self, count):
+        start = len(self.data)
+        x = np.arange(start, start + count, dtype=float)
+        new = pd.DataFrame({"x": x, "y": x / 3 + self.offset})
+        self.data = pd.concat([self.data, new], ignore_index=True)
+
+
+def make_model(model_class, *lengths, column_index=None):
+    model = model_class(column_index=column_index)
+    tables = []
+    for i, length in enumerate(lengths):
+        results = FakeResults(length, offset=100 * i)
+        table = ResultsTable(results, pg.intColor(i), column_index)
+        model.add_results(table)
+        tables.append(table)
+    return model, tables
+
+
+def display(model, row, col):
+    return model.data(model.index(row, col))
+
+
+@pytest.mark.parametrize("model_class", [PandasModelByRow, PandasModelByColumn])
+def test_display(qapp, model_class):
+    model, tables = make_model(model_class, 3, 2)
+    assert display(model, 1, 1) == "0.333333"
+    row, col = (4, 1) if model_class is PandasModelByRow else (1, 3)
+    assert display(model, row, col) == "100.333"
+
+
+def test_appended_rows_are_inserted_after_their_results(qtbot):
+    model, (first, second) = make_model(PandasModelByRow, 3, 2)
+    with qtbot.waitSignal(model.rowsInserted) as blocker:
+        first.results.add_rows(2)
+        first.update_data()
+    assert blocker.args[1:] == [3, 4]
+    assert model.rowCount() == 7
+    assert display(model, 4, 0) == "4"
+    assert display(model, 5, 1) == "100"
+
+
+def test_appended_rows_by_column(qtbot):
+    model, (first, second) = make_model(PandasModelByColumn, 3, 2)
+    inserted, changed = [], []
+    model.rowsInserted.connect(lambda parent, start, end: inserted.append((start, end)))
+    model.dataChanged.connect(lambda top, bottom: changed.append(
+        (top.row(), top.column(), bottom.row(), bottom.column())))
+    second.results.add_rows(3)
+    second.update_data()
+    # Rows 2 exists already, rows 3 and 4 are new
+    assert inserted == [(3, 4)]
+    assert changed == [(2, 2, 2, 3)]
+    assert display(model, 4, 2) == "4"
+    assert display(model, 4, 0) == ""
+
+
+def test_cell_cache(qapp):
+    model, (table,) = make_model(PandasModelByRow, 10)
+    model.cache_size = 5
+    for row in range(10):
+        display(model, row, 0)
+    assert len(model._cache) == 5
+    assert display(model, 9, 0) == "9"
+
+
+def test_missing_cells_are_not_cached(qapp):
+    model, (first, second) = make_model(PandasModelByColumn, 3, 1)
+    assert display(model, 2, 2) == ""
+    second.results.add_rows(2)
+    second.update_data()
+    assert display(model, 2, 2) == "2"
+
+
+@pytest.mark.parametrize("model_class", [PandasModelByRow, PandasModelByColumn])
+@pytest.mark.parametrize("column_index", [None, "x"])
+def test_export_csv(qapp, tmp_path, model_class, column_index):
+    model, tables = make_model(model_class, 7, 4, column_index=column_index)
+    model.export_chunk_size = 3
+    filename = tmp_path / "export.csv"
+    assert model.export_csv(filename)
+    assert filename.read_text() == model.export_df().to_csv(lineterminator="\n")
+
+
+def test_export_empty(qapp, tmp_path):
+    model = PandasModelByRow()
+    assert not model.export_csv(tmp_path / "export.csv")
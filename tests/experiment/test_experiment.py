@@ -0,0 +1,86 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import os
+
+import pytest
+
+from pymeasure.experiment import Experiment
+from data.procedure_for_testing import RandomProcedure
+
+
+@pytest.fixture
+def experiment(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    experiment = Experiment('test', RandomProcedure())
+    yield experiment
+    if os.path.exists(experiment.filename):
+        os.remove(experiment.filename)
+
+
+def add_rows(experiment, start, stop):
+    with open(experiment.filename, 'a') as file:
+        for i in range(start, stop):
+            file.write(experiment.results.format(
+                {'Iteration': i, 'Random Number': i / 10}) + os.linesep)
+
+
+class TestAnalysis:
+    def test_cached_until_new_data(self, experiment):
+        calls = []
+
+        def analyse(data):
+            calls.append(len(data))
+            data['Double'] = 2 * data['Random Number']
+            return data
+
+        experiment.analyse = analyse
+        add_rows(experiment, 0, 3)
+        data = experiment.data
+        assert list(data['Double']) == pytest.approx([0, 0.2, 0.4])
+        assert experiment.data is data
+        assert calls == [3]
+        add_rows(experiment, 3, 5)
+        assert len(experiment.data) == 5
+        assert calls == [3, 5]
+
+    def test_incremental(self, experiment):
+        calls = []
+
+        def analyse(rows, state):
+            calls.append((len(rows), state))
+            total = (state or 0) + rows['Iteration'].cumsum()
+            rows['Sum'] = total
+            return rows, total.iloc[-1]
+
+        experiment.analyse = analyse
+        experiment.incremental = True
+        add_rows(experiment, 0, 3)
+        assert list(experiment.data['Sum']) == [0, 1, 3]
+        add_rows(experiment, 3, 5)
+        data = experiment.data
+        assert list(data['Sum']) == [0, 1, 3, 6, 10]
+        assert list(data['Iteration']) == [0, 1, 2, 3, 4]
+        assert experiment.data is data
+        assert calls == [(3, None), (2, 3)]
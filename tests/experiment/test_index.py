@@ -0,0 +1,164 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import os
+
+import pytest
+
+from pymeasure.experiment import (FloatParameter, Metadata, Parameter, Procedure, Results,
+                                  ResultsIndex)
+from pymeasure.experiment.index import read_header_values
+
+
+class FieldProcedure(Procedure):
+    field = FloatParameter("Field", units="T", default=0.)
+    sample = Parameter("Sample", default="A1")
+    operator = Metadata("Operator", default="Ada")
+
+    DATA_COLUMNS = ["Time (s)", "Voltage (V)"]
+
+
+def write_results(directory, name, rows=3, **parameters):
+    procedure = FieldProcedure()
+    for key, value in parameters.items():
+        setattr(procedure, key, value)
+    filename = os.path.join(directory, name)
+    results = Results(procedure, filename)
+    procedure.evaluate_metadata()
+    results.store_metadata()
+    with open(filename, "a") as file:
+        for i in range(rows):
+            file.write(results.format({"Time (s)": i, "Voltage (V)": 2 * i}) + "\n")
+    return filename
+
+
+@pytest.fixture
+def directory(tmp_path):
+    write_results(tmp_path, "low.csv", field=0.5, sample="A1")
+    write_results(tmp_path, "high.csv", rows=5, field=1.5, sample="A3")
+    filename = write_results(tmp_path, "higher.csv", field=2, sample="A3")
+    with open(filename) as file:
+        content = file.read()
+    with open(filename, "w") as file:  # Same field in other units
+        file.write(content.replace("Field: 2 T", "Field: 2000 mT"))
+    (tmp_path / "notes.csv").write_text("not a results file\n")
+    return tmp_path
+
+
+@pytest.fixture
+def index(directory):
+    with ResultsIndex(directory) as index:
+        index.update()
+        yield index
+
+
+def test_read_header_values(directory):
+    info = read_header_values(directory / "high.csv")
+    assert info["procedure"].endswith("FieldProcedure")
+    assert info["parameters"] == {"Field": "1.5 T", "Sample": "A3"}
+    assert info["metadata"] == {"Operator": "Ada"}
+    assert info["columns"] == ["Time (s)", "Voltage (V)"]
+    assert info["rows"] == 5
+
+
+def test_entry(index, directory):
+    entry = index.entry(directory / "high.csv")
+    assert entry["filename"] == str(directory / "high.csv")
+    assert entry["rows"] == 5
+    assert entry["status"] == Procedure.FINISHED
+    assert entry["parameters"]["Field"] == "1.5 T"
+    assert entry["metadata"] == {"Operator": "Ada"}
+    assert index.entry(directory / "notes.csv") is None
+
+
+def test_database_is_stored_next_to_the_files(index, directory):
+    assert os.path.exists(directory / ResultsIndex.FILENAME)
+
+
+@pytest.mark.parametrize("conditions, expected", [
+    ((), ["high.csv", "higher.csv", "low.csv"]),
+    (("Field > 1 T",), ["high.csv", "higher.csv"]),
+    (("Field > 1600 mT",), ["higher.csv"]),
+    (("Field <= 0.5 T",), ["low.csv"]),
+    (("Sample = A3",), ["high.csv", "higher.csv"]),
+    (("Sample != A3", "Operator == Ada"), ["low.csv"]),
+    (("Field > 1 V",), []),  # Different dimensionality
+])
+def test_query(index, directory, conditions, expected):
+    assert index.query(*conditions) == [str(directory / name) for name in expected]
+
+
+def test_query_equality_in_other_units(tmp_path):
+    write_results(tmp_path, "tesla.csv", field=0.7)
+    filename = write_results(tmp_path, "millitesla.csv", field=0.7)
+    with open(filename) as file:
+        content = file.read()
+    with open(filename, "w") as file:
+        file.write(content.replace("Field: 0.7 T", "Field: 700 mT"))
+    with ResultsIndex(tmp_path) as index:
+        index.update()
+        both = [str(tmp_path / "millitesla.csv"), str(tmp_path / "tesla.csv")]
+        assert index.query("Field = 0.7 T") == both
+        assert index.query("Field = 700 mT") == both
+        assert index.query("Field != 0.7 T") == []
+        assert index.query("Field = 0.7000001 T") == []
+
+
+def test_query_procedure_and_status(index, directory):
+    assert len(index.query(procedure="FieldProcedure")) == 3
+    assert index.query(procedure="OtherProcedure") == []
+    index.set_status(directory / "low.csv", Procedure.FAILED)
+    assert index.query(status=Procedure.FAILED) == [str(directory / "low.csv")]
+
+
+@pytest.mark.parametrize("condition", ["Field", "Sample > A3"])
+def test_invalid_query(index, condition):
+    with pytest.raises(ValueError):
+        index.query(condition)
+
+
+def test_incremental_update(index, directory):
+    assert index.update() == []
+    write_results(directory, "new.csv", field=3)
+    os.remove(directory / "low.csv")
+    assert index.update() == [str(directory / "new.csv")]
+    assert index.query("Field > 2.5 T") == [str(directory / "new.csv")]
+    assert index.query("Field < 1 T") == []
+    assert index.entry(directory / "low.csv") is None
+
+
+def test_persistence(index, directory):
+    index.set_status(directory / "low.csv", Procedure.ABORTED)
+    index.close()
+    with ResultsIndex(directory) as reopened:
+        assert reopened.update() == []
+        assert reopened.entry(directory / "low.csv")["status"] == Procedure.ABORTED
+
+
+def test_to_dataframe(index):
+    df = index.to_dataframe()
+    assert len(df) == 3
+    assert set(df["Sample"]) == {"A1", "A3"}
+    assert list(df["rows"]) == [5, 3, 3]
@@ -25,6 +25,7 @@
 import os
 import pickle
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import pandas as pd
@@ -32,9 +33,10 @@ import pytest
 import numpy as np
 
 from pymeasure.units import ureg
-from pymeasure.experiment.results import Results, CSVFormatter
+from pymeasure.experiment.results import (Results, CSVFormatter, unique_filename,
+                                          unique_filenames)
 from pymeasure.experiment.procedure import Procedure, Parameter
-from pymeasure.experiment import BooleanParameter
+from pymeasure.experiment import BooleanParameter, Metadata
 from data.procedure_for_testing import RandomProcedure
 
 
@@ -173,3 +175,182 @@ def test_parameter_reading():
     assert results.parameters["check_true"].value is True
     assert results.parameters["check_false"].value is False
     assert results.parameters["check_dir"].value == test_string
+
+
+def write_random_results(filename, rows):
+    procedure = RandomProcedure()
+    results = Results(procedure, filename)
+    with open(filename, "a") as file:
+        for i in range(rows):
+            file.write(results.format({"Iteration": i, "Random Number": i / 10}) + "\n")
+    return results
+
+
+def test_lazy_load(tmp_path):
+    filename = str(tmp_path / "data.csv")
+    write_random_results(filename, 5)
+    results = Results.load(filename, RandomProcedure, lazy=True)
+    assert not results.loaded
+    assert len(results.data) == 5
+    assert results.loaded
+
+
+def test_reload_cancelled(tmp_path, monkeypatch):
+    monkeypatch.setattr(Results, "CHUNK_SIZE", 2)
+    filename = str(tmp_path / "data.csv")
+    write_random_results(filename, 5)
+    results = Results.load(filename, RandomProcedure, lazy=True)
+    calls = []
+    assert not results.reload(should_stop=lambda: calls.append(1) or len(calls) > 2)
+    assert not results.loaded
+    assert results.reload(should_stop=lambda: False)
+    assert len(results.data) == 5
+
+
+def test_data_is_read_only_if_the_file_changed(tmp_path):
+    filename = str(tmp_path / "data.csv")
+    results = write_random_results(filename, 3)
+    assert len(results.data) == 3
+    with mock.patch("pymeasure.experiment.results.pd.read_csv") as read_csv:
+        assert len(results.data) == 3
+    read_csv.assert_not_called()
+    with open(filename, "a") as file:
+        file.write(results.format({"Iteration": 3, "Random Number": 0.3}) + "\n")
+    assert len(results.data) == 4
+
+
+class MetadataProcedure(RandomProcedure):
+    operator = Metadata("Operator", default="Ada")
+    sample = Metadata("Sample", default="A1")
+
+
+class TestStoreMetadata:
+    @pytest.fixture
+    def filename(self, tmp_path):
+        return str(tmp_path / "data.csv")
+
+    def test_written_in_place(self, filename):
+        procedure = MetadataProcedure(iterations=4)
+        results = Results(procedure, filename)
+        size = os.path.getsize(filename)
+        # The data file stays open (as by the Recorder) while the metadata are stored
+        with open(filename, "a") as file:
+            file.write(results.format({"Iteration": 0, "Random Number": 0.}) + "\n")
+            file.flush()
+            procedure.evaluate_metadata()
+            results.store_metadata()
+            file.write(results.format({"Iteration": 1, "Random Number": 0.1}) + "\n")
+        with open(filename) as file:
+            content = file.read()
+        assert "#Metadata:\n#\tOperator: Ada\n#\tSample: A1\n#" in content
+        assert content.endswith("0,0.0\n1,0.1\n")
+        assert os.path.getsize(filename) == size + 12
+        assert list(results.data["Iteration"]) == [0, 1]
+
+        loaded = Results.load(filename)
+        assert loaded.procedure.iterations == 4
+        assert loaded.procedure.operator == "Ada"
+        assert list(loaded.data["Iteration"]) == [0, 1]
+
+    def test_rewritten_if_too_long(self, filename, monkeypatch):
+        monkeypatch.setattr(Results, "METADATA_WIDTH", 2)
+        procedure = MetadataProcedure()
+        results = Results(procedure, filename)
+        with open(filename, "a") as file:
+            file.write(results.format({"Iteration": 0, "Random Number": 0.}) + "\n")
+        procedure.evaluate_metadata()
+        results.store_metadata()
+        with open(filename, "a") as file:
+            file.write(results.format({"Iteration": 1, "Random Number": 0.1}) + "\n")
+        assert list(results.data["Iteration"]) == [0, 1]
+        loaded = Results.load(filename)
+        assert loaded.procedure.sample == "A1"
+        assert list(loaded.data["Iteration"]) == [0, 1]
+
+    def test_mirrored_file_without_reserved_lines(self, tmp_path):
+        filenames = [str(tmp_path / "data.csv"), str(tmp_path / "mirror.csv")]
+        procedure = MetadataProcedure()
+        results = Results(procedure, filenames)
+        with open(filenames[1]) as file:  # e.g. written by an older version
+            lines = [line for line in file if line.strip() != "#"]
+        with open(filenames[1], "w") as file:
+            file.writelines(lines)
+        procedure.evaluate_metadata()
+        results.store_metadata()
+        for i in range(3):
+            for filename in filenames:
+                with open(filename, "a") as file:
+                    file.write(results.format({"Iteration": i, "Random Number": i / 10}) + "\n")
+            # Rows after the first reading are read with the header count
+            assert list(results.data["Iteration"]) == list(range(i + 1))
+        for filename in filenames:
+            loaded = Results.load(filename)
+            assert loaded.procedure.operator == "Ada"
+            assert list(loaded.data["Iteration"]) == [0, 1, 2]
+
+    def test_header_without_metadata(self, filename):
+        results = write_random_results(filename, 1)
+        assert results.store_metadata() is None
+        with open(filename) as file:
+            assert "Metadata" not in file.read()
+
+
+class TestUniqueFilename:
+    def test_indices(self, tmp_path):
+        first = unique_filename(tmp_path, prefix="data", datetimeformat="", claim=True)
+        assert first == str(tmp_path / "data_1.csv")
+        assert os.path.exists(first)  # Claimed
+        assert unique_filename(tmp_path, prefix="data", datetimeformat="") \
+            == str(tmp_path / "data_2.csv")
+        assert unique_filename(tmp_path, prefix="data", suffix="_x", datetimeformat="") \
+            == str(tmp_path / "data_1_x.csv")
+
+    def test_continues_after_existing_files(self, tmp_path):
+        (tmp_path / "DATA_3.csv").write_text("")
+        (tmp_path / "DATA_12.csv").write_text("")
+        (tmp_path / "DATA_13.txt").write_text("")
+        assert unique_filename(tmp_path, datetimeformat="", claim=True) \
+            == str(tmp_path / "DATA_13.csv")
+        # Created by someone else after the index has been cached
+        (tmp_path / "DATA_14.csv").write_text("")
+        assert unique_filename(tmp_path, datetimeformat="", claim=True) \
+            == str(tmp_path / "DATA_15.csv")
+
+    def test_without_claim(self, tmp_path):
+        filename = unique_filename(tmp_path, datetimeformat="")
+        assert filename == str(tmp_path / "DATA_1.csv")
+        assert not os.path.exists(filename)
+        assert unique_filename(tmp_path, datetimeformat="") == filename
+        (tmp_path / "DATA_1.csv").write_text("")
+        assert unique_filename(tmp_path, datetimeformat="") == str(tmp_path / "DATA_2.csv")
+
+    def test_batch(self, tmp_path):
+        filenames = unique_filenames(3, tmp_path, prefix="run", datetimeformat="", claim=True)
+        assert filenames == [str(tmp_path / f"run_{i}.csv") for i in (1, 2, 3)]
+        assert unique_filename(tmp_path, prefix="run", datetimeformat="") \
+            == str(tmp_path / "run_4.csv")
+
+    def test_threads_get_distinct_names(self, tmp_path):
+        with ThreadPoolExecutor(8) as executor:
+            filenames = list(executor.map(
+                lambda i: unique_filename(tmp_path, datetimeformat="", claim=True), range(50)))
+        assert len(set(filenames)) == 50
+
+    def test_claimed_file_is_used_by_results(self, tmp_path):
+        filename = unique_filename(tmp_path, claim=True)
+        results = Results(RandomProcedure(), filename)
+        assert results.procedure.status != Procedure.FINISHED
+        with open(filename) as file:
+            assert file.readline().startswith("#Procedure")
+
+    def test_other_empty_file_is_not_overwritten(self, tmp_path):
+        filename = tmp_path / "empty.csv"
+        filename.write_text("")
+        with pytest.raises(pd.errors.EmptyDataError):
+            Results(RandomProcedure(), str(filename))
+        assert filename.read_text() == ""
+
+    def test_without_index(self, tmp_path):
+        filename = unique_filename(tmp_path, suffix="_a", index=False, datetimeformat="")
+        assert filename == str(tmp_path / "DATA_a.csv")
+        assert not os.path.exists(filename)
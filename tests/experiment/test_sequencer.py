@@ -22,10 +22,11 @@
 # THE SOFTWARE.
 #
 
+import numpy
 import pytest
 
 from io import StringIO
-from pymeasure.experiment.sequencer import SequenceHandler, SequenceEvaluationError
+from pymeasure.experiment.sequencer import SequenceHandler, SequenceEvaluationError, _ArrayCache
 
 
 def non_empty_lines(text):
@@ -124,3 +125,96 @@ def test_sequencer_errors(seq_file_text_err):
     with pytest.raises(exception, match=exc_text):
         seq = SequenceHandler(file_obj=fd)
         seq.parameters_sequence()
+
+
+seq_file_text_4 = """
+- "P1", "[1,2]"
+-- "P2", "[3, 4]"
+-- "P3", "[5]"
+--- "P1", "[6, 7]"
+- "P4", "[8]"
+"""
+
+expected_4 = [
+    {"P1": 1, "P2": 3}, {"P1": 1, "P2": 4}, {"P1": 6, "P3": 5}, {"P1": 7, "P3": 5},
+    {"P1": 2, "P2": 3}, {"P1": 2, "P2": 4}, {"P1": 6, "P3": 5}, {"P1": 7, "P3": 5},
+    {"P4": 8},
+]
+
+
+def test_parameters_sequence():
+    sequence = SequenceHandler(file_obj=StringIO(seq_file_text_4)).parameters_sequence()
+    assert len(sequence) == len(expected_4)
+    assert list(sequence) == expected_4
+
+
+def test_parameters_sequence_names_map():
+    sequence = SequenceHandler(file_obj=StringIO(seq_file_text_1)).parameters_sequence(
+        {"P1": "p1", "P2": "p2"})
+    assert sequence[0] == {"p1": 1, "p2": 3}
+
+
+@pytest.mark.parametrize("index", range(len(expected_4)))
+def test_parameters_sequence_random_access(index):
+    sequence = SequenceHandler(file_obj=StringIO(seq_file_text_4)).parameters_sequence()
+    assert sequence[index] == expected_4[index]
+    assert sequence[index - len(expected_4)] == expected_4[index]
+    assert list(sequence.iter_from(index)) == expected_4[index:]
+
+
+def test_parameters_sequence_index_error():
+    sequence = SequenceHandler(file_obj=StringIO(seq_file_text_4)).parameters_sequence()
+    with pytest.raises(IndexError):
+        sequence[len(expected_4)]
+
+
+def test_parameters_sequence_skip():
+    sequence = SequenceHandler(file_obj=StringIO(seq_file_text_4)).parameters_sequence()
+    skip = {0, 3, 4, 20}
+    assert list(sequence.iter_from(3, skip)) == [expected_4[i] for i in (5, 6, 7, 8)]
+    assert sequence.remaining(3, skip) == 4
+
+
+def test_eval_string_memoizes_pure_expressions(monkeypatch):
+    calls = []
+
+    def linspace(*args):
+        calls.append(args)
+        return numpy.linspace(*args)
+
+    monkeypatch.setitem(SequenceHandler.SAFE_FUNCTIONS, "linspace", linspace)
+    first = SequenceHandler.eval_string("linspace(0, 1, 13)")
+    first[0] = 5  # The result is writable and not shared
+    second = SequenceHandler.eval_string("linspace(0, 1, 13)")
+    assert second[0] == 0
+    assert len(calls) == 1
+
+
+def test_memoized_results_are_bounded():
+    cache = _ArrayCache(max_bytes=100)
+    cache.put("a", numpy.zeros(5))  # 40 bytes
+    cache.put("b", numpy.zeros(5))
+    cache.get("a")
+    cache.put("c", numpy.zeros(5))  # Evicts the least recently used "b"
+    cache.put("large", numpy.zeros(20))  # Too large to be cached
+    assert list(cache.entries) == ["a", "c"]
+    assert cache.size == 80
+
+
+def test_eval_string_does_not_memoize_impure_expressions(monkeypatch):
+    calls = []
+
+    def counter():
+        calls.append(None)
+        return len(calls)
+
+    monkeypatch.setitem(SequenceHandler.SAFE_FUNCTIONS, "counter", counter)
+    assert SequenceHandler.eval_string("[counter()]")[0] == 1
+    assert SequenceHandler.eval_string("[counter()]")[0] == 2
+    # Also in combination with pure functions
+    assert SequenceHandler.eval_string("linspace(0, 1, counter())")[-1] == 1
+    assert len(SequenceHandler.eval_string("linspace(0, 1, counter())")) == 4
+
+
+def test_pure_functions_are_safe():
+    assert SequenceHandler.PURE_FUNCTIONS <= set(SequenceHandler.SAFE_FUNCTIONS)
@@ -27,10 +27,10 @@ import logging
 import pytest
 import os
 import tempfile
-from time import sleep
+from time import perf_counter, sleep
 
 from pymeasure.experiment import Listener, Procedure
-from pymeasure.experiment.workers import Worker
+from pymeasure.experiment.workers import Worker, ProcessWorker
 from pymeasure.experiment.results import Results
 from data.procedure_for_testing import RandomProcedure
 
@@ -65,6 +65,68 @@ def test_worker_finish():
     assert new_results.data.shape == (100, 2)
 
 
+def test_process_worker_finish():
+    procedure = RandomProcedure()
+    procedure.iterations = 100
+    procedure.delay = 0.001
+    file = tempfile.mktemp()
+    results = Results(procedure, file)
+    worker = ProcessWorker(results)
+    worker.start()
+    worker.join(timeout=20.0)
+
+    assert not worker.is_alive()
+    assert worker.exitcode == 0
+
+    messages = []
+    while not worker.monitor_queue.empty():
+        messages.append(worker.monitor_queue.get())
+    assert ('status', Procedure.FINISHED) in messages
+    assert messages[-1] is None
+
+    new_results = Results.load(file, procedure_class=RandomProcedure)
+    assert new_results.data.shape == (100, 2)
+
+
+def test_process_worker_stop():
+    procedure = RandomProcedure()
+    procedure.iterations = 10000
+    procedure.delay = 0.01
+    file = tempfile.mktemp()
+    results = Results(procedure, file)
+    worker = ProcessWorker(results)
+    worker.start()
+    sleep(1)
+    worker.stop()
+    worker.join(timeout=20.0)
+
+    assert not worker.is_alive()
+    messages = []
+    while not worker.monitor_queue.empty():
+        messages.append(worker.monitor_queue.get())
+    assert ('status', Procedure.ABORTED) in messages
+
+
+def test_process_worker_join_does_not_block():
+    procedure = RandomProcedure()
+    procedure.iterations = 10000
+    procedure.delay = 0.01
+    file = tempfile.mktemp()
+    results = Results(procedure, file)
+    worker = ProcessWorker(results)
+    worker.start()
+    sleep(1)
+    start = perf_counter()
+    worker.join()
+    assert perf_counter() - start < 0.5
+    assert worker.should_stop()
+    for _ in range(200):  # The process exits in the background
+        if not worker.is_alive():
+            break
+        sleep(0.1)
+    assert not worker.is_alive()
+
+
 def test_worker_closes_file_after_finishing():
     procedure = RandomProcedure()
     procedure.iterations = 100
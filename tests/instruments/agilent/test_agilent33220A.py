@@ -0,0 +1,42 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+
+from pymeasure.test import expected_protocol
+from pymeasure.instruments.agilent.agilent33220A import Agilent33220A
+
+
+def test_data_arb():
+    with expected_protocol(
+        Agilent33220A,
+        [
+            ("FORM:BORD NORM", None),
+            (b"DATA:DAC VOLATILE, #14\x1f\xff\xe0\x01\n", None),
+            ("FUNC:USER VOLATILE", None),
+        ],
+    ) as inst:
+        inst.data_arb(np.array([1.0, -1.0]), data_format="float")
+        inst.data_arb([8191, -8191])  # identical waveform, not sent again
+        inst.arb_file = "VOLATILE"
@@ -22,6 +22,7 @@
 # THE SOFTWARE.
 #
 
+import numpy as np
 import pytest
 from pymeasure.test import expected_protocol
 from pymeasure.instruments.agilent.agilent33500 import Agilent33500
@@ -304,3 +305,52 @@ def test_channel_phase_synchronization():
         ]
     ) as inst:
         assert inst.phase_sync() is None
+
+
+def test_data_arb_dac():
+    with expected_protocol(
+        Agilent33500,
+        [
+            ("FORM:BORD NORM", None),
+            (b"DATA:ARB:DAC test, #14\x00\x01\xff\xfe\n", None),
+            ("FORM:BORD NORM", None),
+            (b"SOUR2:DATA:ARB:DAC test, #14\x00\x01\xff\xfe\n", None),
+        ],
+    ) as inst:
+        inst.data_arb("test", np.array([1, -2]))
+        inst.ch_2.data_arb("test", [1, -2])
+
+
+def test_data_arb_float():
+    with expected_protocol(
+        Agilent33500,
+        [
+            ("FORM:BORD NORM", None),
+            (b"SOUR1:DATA:ARB test, #18\x3f\x00\x00\x00\xbf\x80\x00\x00\n", None),
+        ],
+    ) as inst:
+        inst.ch_1.data_arb("test", np.array([0.5, -1]), data_format="float")
+
+
+def test_data_arb_cache():
+    with expected_protocol(
+        Agilent33500,
+        [
+            ("FORM:BORD NORM", None),
+            (b"DATA:ARB:DAC test, #14\x00\x01\x00\x02\n", None),
+            ("DATA:VOL:CLE", None),
+            ("FORM:BORD NORM", None),
+            (b"DATA:ARB:DAC test, #14\x00\x01\x00\x02\n", None),
+        ],
+    ) as inst:
+        inst.data_arb("test", [1, 2])
+        inst.data_arb("test", np.array([1, 2]))  # unchanged, not sent again
+        inst.data_volatile_clear()
+        inst.data_arb("test", [1, 2])
+
+
+@pytest.mark.parametrize("data_points, data_format", [([1.5], "float"), ([40000], "DAC")])
+def test_data_arb_out_of_range(data_points, data_format):
+    with expected_protocol(Agilent33500, []) as inst:
+        with pytest.raises(ValueError):
+            inst.data_arb("test", data_points, data_format=data_format)
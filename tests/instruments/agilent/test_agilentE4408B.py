@@ -0,0 +1,55 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import pytest
+from pyvisa.util import to_ieee_block
+
+from pymeasure.test import expected_protocol
+from pymeasure.instruments.agilent.agilentE4408B import AgilentE4408B
+
+
+def test_trace():
+    block = to_ieee_block([-50.5, -60.25, -70], "f", True) + b"\n"
+    with expected_protocol(
+        AgilentE4408B,
+        [(":FORMat:TRACe:DATA REAL,32;:TRACE:DATA? TRACE1;", block),
+         (":FORMat:TRACe:DATA REAL,32;:TRACE:DATA? TRACE2;", block),
+         (":SENS:FREQ:STAR?;", "1E9"),
+         (":SENS:FREQ:STOP?;", "2E9"),
+         (":SENSe:SWEEp:POINts?;", "3"),
+         (":SENS:FREQ:STOP 3.000000e+09 Hz;", None),
+         (":SENS:FREQ:STAR?;", "1E9"),
+         (":SENS:FREQ:STOP?;", "3E9"),
+         (":SENS:FREQ:CENT 2.500000e+09 Hz;", None),
+         (":SENS:FREQ:STAR?;", "2E9"),
+         (":SENS:FREQ:STOP?;", "3E9")],
+    ) as inst:
+        assert list(inst.trace(1)) == [-50.5, -60.25, -70]
+        assert list(inst.trace(2)) == [-50.5, -60.25, -70]
+        assert list(inst.frequencies) == [1e9, 1.5e9, 2e9]
+        assert list(inst.frequencies) == [1e9, 1.5e9, 2e9]  # cached
+        inst.stop_frequency = 3e9
+        assert list(inst.frequencies) == pytest.approx([1e9, 2e9, 3e9])
+        inst.center_frequency = 2.5e9
+        assert list(inst.frequencies) == pytest.approx([2e9, 2.5e9, 3e9])
@@ -23,6 +23,7 @@
 #
 
 import pytest
+from pyvisa.util import to_ieee_block
 
 from pymeasure.test import expected_protocol
 from pymeasure.instruments.anritsu import AnritsuMS464xB, AnritsuMS4642B, AnritsuMS4644B,\
@@ -169,3 +170,84 @@ def test_subclass_MS4647B_frequency_range():
         instr.ch_1.frequency_stop = 7e10
         with pytest.raises(ValueError):
             instr.ch_1.frequency_stop = 8e10
+
+
+def test_read_sparameters():
+    frequencies = to_ieee_block([1e9, 2e9], "d", False) + b"\n"
+    s11 = to_ieee_block([0.5, -0.5, 0.25, 0], "d", False) + b"\n"
+    s21 = to_ieee_block([0.1, 0.2, 0.3, 0.4], "d", False) + b"\n"
+    with expected_protocol(
+        AnritsuMS464xB,
+        [(":CALC1:PAR:COUN?", "2"),
+         (":CALC1:PAR1:DEF?", "S11"),
+         (":CALC1:PAR2:DEF?", "S21"),
+         (":FORM:DATA?", "ASC"),
+         (":FORM:BORD?", "NORM"),
+         ("FDHX?", "0"),
+         (":FORM:DATA REAL;:FORM:BORD SWAP;FDH1", None),
+         (":SENS1:FREQ:DATA?", frequencies),
+         (":CALC1:PAR1:SEL;:CALC1:DATA:SDAT?", s11),
+         (":CALC1:PAR2:SEL;:CALC1:DATA:SDAT?", s21),
+         (":FORM:DATA ASC;:FORM:BORD NORM;FDH0", None),
+         # Frequencies and parameters are cached
+         (":FORM:DATA?", "ASC"),
+         (":FORM:BORD?", "NORM"),
+         ("FDHX?", "0"),
+         (":FORM:DATA REAL;:FORM:BORD SWAP;FDH1", None),
+         (":CALC1:PAR1:SEL;:CALC1:DATA:SDAT?", s11),
+         (":CALC1:PAR2:SEL;:CALC1:DATA:SDAT?", s21),
+         (":FORM:DATA ASC;:FORM:BORD NORM;FDH0", None),
+         # Changing the sweep of another channel keeps the cache
+         (":SENS2:FREQ:STAR 2e+09", None),
+         (":FORM:DATA?", "ASC"),
+         (":FORM:BORD?", "NORM"),
+         ("FDHX?", "0"),
+         (":FORM:DATA REAL;:FORM:BORD SWAP;FDH1", None),
+         (":CALC1:PAR1:SEL;:CALC1:DATA:SDAT?", s11),
+         (":CALC1:PAR2:SEL;:CALC1:DATA:SDAT?", s21),
+         (":FORM:DATA ASC;:FORM:BORD NORM;FDH0", None),
+         (":SENS1:FREQ:STAR 2e+09", None),
+         (":CALC1:PAR:COUN?", "1"),
+         (":CALC1:PAR1:DEF?", "S11"),
+         (":FORM:DATA?", "ASC"),
+         (":FORM:BORD?", "NORM"),
+         ("FDHX?", "0"),
+         (":FORM:DATA REAL;:FORM:BORD SWAP;FDH1", None),
+         (":SENS1:FREQ:DATA?", frequencies),
+         (":CALC1:PAR1:SEL;:CALC1:DATA:SDAT?", s11),
+         (":FORM:DATA ASC;:FORM:BORD NORM;FDH0", None),
+         ],
+        traces_per_channel=2,
+        active_channels=2,
+    ) as instr:
+        data = instr.ch_1.read_sparameters()
+        assert data.dtype.names == ("frequency", "S11", "S21")
+        assert list(data["frequency"]) == [1e9, 2e9]
+        assert list(data["S11"]) == [0.5 - 0.5j, 0.25]
+        assert list(data["S21"]) == [0.1 + 0.2j, 0.3 + 0.4j]
+        instr.ch_1.read_sparameters()
+        instr.ch_2.frequency_start = 2e9
+        instr.ch_1.read_sparameters()
+        instr.ch_1.frequency_start = 2e9
+        assert instr.ch_1.read_sparameters().dtype.names == ("frequency", "S11")
+
+
+def test_read_sparameters_restores_format():
+    frequencies = to_ieee_block([1e9], "d", False) + b"\n"
+    with expected_protocol(
+        AnritsuMS464xB,
+        [(":CALC1:PAR:COUN?", "1"),
+         (":CALC1:PAR1:DEF?", "S11"),
+         (":FORM:DATA?", "REAL32"),
+         (":FORM:BORD?", "NORM"),
+         ("FDHX?", "2"),
+         (":FORM:DATA REAL;:FORM:BORD SWAP;FDH1", None),
+         (":SENS1:FREQ:DATA?", frequencies),
+         (":CALC1:PAR1:SEL;:CALC1:DATA:SDAT?", b"no"),
+         (":FORM:DATA REAL32;:FORM:BORD NORM;FDH2", None),
+         ],
+        traces_per_channel=1,
+        active_channels=1,
+    ) as instr:
+        with pytest.raises(ValueError):
+            instr.ch_1.read_sparameters()
@@ -21,6 +21,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 #
+import struct
 from datetime import datetime
 
 import pytest
@@ -857,14 +858,50 @@ class TestHP856Xx:
         with expected_protocol(
                 HP856Xx,
                 [
-                    ("TDF M", None),
                     ("AUNITS?", "DBM"),
                     ("RL?", "10.0"),
-                    ("LG?", "10.0"),
-                    (cmd + "?", ','.join([str(i) for i in data]))
+                    ("LG?", "10"),
+                    ("TDF B;" + cmd + "?", struct.pack(">601h", *data)),
+                    # the scale is cached
+                    ("TDF B;" + cmd + "?", struct.pack(">601h", *data)),
+                    ("RL 0", None),
+                    ("RL?", "0.0"),
+                    ("TDF B;" + cmd + "?", struct.pack(">601h", *data)),
                 ]
         ) as instr:
             assert getattr(instr, function)() == expected_data
+            assert getattr(instr, function)() == expected_data
+            instr.reference_level = 0
+            assert getattr(instr, function)()[0] == pytest.approx(expected_data[0] - 10)
+
+    def test_trace_scale_after_marker_to_reference_level(self):
+        data = struct.pack(">601h", *[600] * 601)
+        with expected_protocol(
+                HP856Xx,
+                [
+                    ("AUNITS?", "DBM"),
+                    ("RL?", "10.0"),
+                    ("LG?", "10"),
+                    ("TDF B;TRA?", data),
+                    ("MKRL", None),
+                    ("RL?", "-20.0"),
+                    ("TDF B;TRA?", data),
+                    ("AUNITS DBMV", None),
+                    ("AUNITS?", "DBMV"),
+                    ("RL?", "26.9897"),
+                    ("TDF B;TRA?", data),
+                    ("LN", None),
+                    ("LG?", "0"),
+                ]
+        ) as instr:
+            assert instr.get_trace_data_a()[0] == pytest.approx(10)
+            instr.set_marker_to_reference_level()
+            assert instr.get_trace_data_a()[0] == pytest.approx(-20)
+            instr.amplitude_unit = AmplitudeUnits.DBMV
+            assert instr.get_trace_data_a()[0] == pytest.approx(-20)
+            instr.set_linear_scale()
+            with pytest.raises(NotImplementedError):
+                instr.get_trace_data_a()
 
     def test_fft_trace_window(self):
         with expected_protocol(
@@ -77,3 +77,19 @@ def test_measure_voltage():
          ],
     ) as inst:
         inst.measure_voltage(max_voltage=300, ac=True)
+
+
+def test_wait_for_buffer_waits_for_srq():
+    timeouts = []
+
+    def wait_for_srq(timeout=25, delay=0.1):
+        timeouts.append(timeout)
+        raise TimeoutError("Waiting for SRQ timed out.")
+
+    with expected_protocol(
+        Keithley2000,
+        [("*STB?", "0"), ("*STB?", "0"), ("*STB?", "65")],
+    ) as inst:
+        inst.adapter.wait_for_srq = wait_for_srq
+        inst.wait_for_buffer(timeout=60, interval=0.1, srq_timeout=2)
+    assert timeouts == [2, 2]
@@ -0,0 +1,97 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+import pytest
+
+from pymeasure.test import expected_protocol
+from pymeasure.instruments.keysight.keysightDSOX1102G import KeysightDSOX1102G
+
+SETUP = [(b":waveform:source CHAN1", None),
+         (b":waveform:points:mode NORM", None),
+         (b":waveform:points 100", None)]
+BINARY_SETUP = [(b":waveform:unsigned 1", None),
+                (b":waveform:byteorder MSBF", None)]
+
+
+def preamble(format_, yincrement, yorigin, yreference):
+    return (b":waveform:preamble?",
+            f"{format_},0,3,1,1E-6,-1.5E-4,0,{yincrement},{yorigin},{yreference}".encode())
+
+
+def test_download_data_byte():
+    with expected_protocol(
+        KeysightDSOX1102G,
+        SETUP + [(b":waveform:format BYTE", None)] + BINARY_SETUP + [
+            preamble(0, 0.1, 1.0, 128),
+            (b":waveform:data?", b"#800000003\x80\x81\x7e\n"),
+        ],
+    ) as inst:
+        data, pre = inst.download_data("channel1", points=100, format_="byte")
+        assert data == pytest.approx([1.0, 1.1, 0.8])
+        assert pre["format"] == "BYTE"
+        assert pre["xincrement"] == 1e-6
+
+
+def test_download_data_word():
+    with expected_protocol(
+        KeysightDSOX1102G,
+        SETUP + [(b":waveform:format WORD", None)] + BINARY_SETUP + [
+            preamble(1, 0.5, 0, 32768),
+            (b":waveform:data?", b"#800000006\x80\x00\x80\x02\x7f\xff\n"),
+        ],
+    ) as inst:
+        data, pre = inst.download_data("channel1", points=100)
+        assert isinstance(data, np.ndarray)
+        assert data == pytest.approx([0, 1, -0.5])
+
+
+def test_download_data_multiple_sources():
+    with expected_protocol(
+        KeysightDSOX1102G,
+        SETUP + [(b":waveform:format BYTE", None)] + BINARY_SETUP + [
+            preamble(0, 0.1, 0, 128),
+            (b":waveform:data?", b"#800000001\x81\n"),
+            (b":waveform:source CHAN2", None),
+            preamble(0, 0.2, 0, 128),
+            (b":waveform:data?", b"#800000001\x81\n"),
+        ],
+    ) as inst:
+        data, pre = inst.download_data(["channel1", "channel2"], points=100, format_="byte")
+        assert list(data) == ["channel1", "channel2"]
+        assert data["channel1"] == pytest.approx([0.1])
+        assert data["channel2"] == pytest.approx([0.2])
+        assert pre["channel2"]["yincrement"] == 0.2
+
+
+def test_download_data_ascii():
+    with expected_protocol(
+        KeysightDSOX1102G,
+        SETUP + [(b":waveform:format ASC", None),
+                 preamble(4, 0.1, 0, 128),
+                 (b":waveform:format ASC", None),
+                 (b":waveform:data?", b"#800000015 1.0E-1,2.0E-1\n")],
+    ) as inst:
+        data, pre = inst.download_data("channel1", points=100, format_="ascii")
+        assert data == pytest.approx([0.1, 0.2])
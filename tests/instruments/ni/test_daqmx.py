@@ -0,0 +1,156 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import ctypes
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from pymeasure.instruments.ni import daqmx
+
+
+class StubNidaq:
+    """Stub of the NI-DAQmx library delivering a ramp of interleaved samples."""
+
+    def __init__(self, chunks=None):
+        self.chunks = chunks  # Number of chunks before the reads block
+        self.sample = 0
+        self.reads = 0
+        self.calls = []
+        self.stopped = threading.Event()
+
+    def __getattr__(self, name):
+        def call(*args):
+            self.calls.append(name)
+            if name == "DAQmxStopTask":
+                self.stopped.set()
+            return 0
+        return call
+
+    def DAQmxCreateTask(self, name, handle):
+        self.calls.append("DAQmxCreateTask")
+        handle._obj.value = 1
+        return 0
+
+    def DAQmxReadAnalogF64(self, task, samples, timeout, fill_mode, data, size, read,
+                           reserved):
+        assert fill_mode == daqmx.DAQmx_Val_GroupByScanNumber
+        if self.chunks is not None and self.reads >= self.chunks:
+            self.stopped.wait(5)
+            return -200088  # Task is not running
+        buffer = np.ctypeslib.as_array((ctypes.c_double * size).from_address(data))
+        values = np.arange(self.sample, self.sample + samples, dtype=np.float64)
+        channels = size // samples
+        buffer[:] = np.repeat(values, channels) + np.tile(np.arange(channels) * 1000., samples)
+        self.sample += samples
+        self.reads += 1
+        read._obj.value = samples
+        return 0
+
+
+@pytest.fixture
+def nidaq(monkeypatch):
+    stub = StubNidaq(chunks=4)
+    monkeypatch.setattr(daqmx, "nidaq", stub, raising=False)
+    return stub
+
+
+def test_continuous_chunks(nidaq):
+    daq = daqmx.DAQmx("Dev1")
+    daq.start_continuous_acquisition([0, 1], chunk_size=10, buffer_chunks=8)
+    chunks = daq.chunks(timeout=5)
+    data = np.concatenate([next(chunks) for _ in range(4)])
+    daq.stop_continuous_acquisition()
+    assert data.shape == (40, 2)
+    assert list(data[:, 0]) == list(range(40))
+    assert list(data[:, 1]) == list(range(1000, 1040))
+    assert nidaq.calls[-1] == "DAQmxClearTask"
+    assert "DAQmxStopTask" in nidaq.calls
+    assert "DAQmxStartTask" in nidaq.calls
+    assert daq.taskHandleAI.value == 0
+
+
+def test_continuous_clears_finite_task(nidaq):
+    daq = daqmx.DAQmx("Dev1")
+    daq.setup_analog_voltage_in([0, 1], 100)
+    nidaq.calls.clear()
+    daq.start_continuous_acquisition([0, 1], chunk_size=10)
+    assert nidaq.calls[:3] == ["DAQmxStopTask", "DAQmxClearTask", "DAQmxCreateTask"]
+    daq.stop()
+    assert nidaq.calls[-2:] == ["DAQmxStopTask", "DAQmxClearTask"]
+    assert nidaq.calls.count("DAQmxClearTask") == 2
+    assert daq.taskHandleAI.value == 0
+
+
+def test_continuous_decimation(nidaq):
+    daq = daqmx.DAQmx("Dev1")
+    received = []
+    daq.start_continuous_acquisition([0, 1], chunk_size=10, decimation=5,
+                                     callback=lambda chunk: received.append(chunk.copy()))
+    chunks = daq.chunks(timeout=5)
+    first = next(chunks)
+    assert first.shape == (2, 2)
+    assert list(first[:, 0]) == [2, 7]  # mean of 0..4 and 5..9
+    daq.stop()
+    assert len(received) >= 1
+
+
+def test_continuous_without_average(nidaq):
+    daq = daqmx.DAQmx("Dev1")
+    daq.start_continuous_acquisition([0], chunk_size=10, decimation=5, average=False)
+    assert list(next(daq.chunks(timeout=5))[:, 0]) == [0, 5]
+    daq.stop()
+
+
+def test_continuous_overrun(nidaq):
+    daq = daqmx.DAQmx("Dev1")
+    daq.start_continuous_acquisition([0, 1], chunk_size=10, buffer_chunks=2)
+    reader = daq._reader
+    while reader.written < 4:
+        time.sleep(0.01)
+    chunks = daq.chunks(timeout=5)
+    # Only the newest chunk is left, the older ones have been overwritten.
+    assert list(next(chunks)[:, 0]) == list(range(30, 40))
+    assert daq.overruns == 3
+    daq.stop_continuous_acquisition()
+    assert list(chunks) == []
+    assert daq.overruns == 0
+
+
+def test_chunks_timeout(monkeypatch):
+    monkeypatch.setattr(daqmx, "nidaq", StubNidaq(chunks=0), raising=False)
+    daq = daqmx.DAQmx("Dev1")
+    daq.start_continuous_acquisition([0], chunk_size=10)
+    with pytest.raises(TimeoutError):
+        next(daq.chunks(timeout=0.05))
+    daq.stop()
+
+
+def test_invalid_decimation(nidaq):
+    daq = daqmx.DAQmx("Dev1")
+    with pytest.raises(ValueError):
+        daq.start_continuous_acquisition([0], chunk_size=10, decimation=3)
+    daq.stop()
@@ -0,0 +1,96 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+from pyvisa.util import to_ieee_block
+
+from pymeasure.test import expected_protocol
+from pymeasure.instruments.rohdeschwarz.fsl import FSL
+
+
+def test_read_trace():
+    block = to_ieee_block([-80, -70.5, -90], "f", False) + b"\n"
+    with expected_protocol(
+        FSL,
+        [("FREQ:STAR?", "1E6"),
+         ("FREQ:STOP?", "3E6"),
+         ("FORM REAL,32;:TRAC1? TRACE1", block),
+         ("FREQ:CENT?", "2E6"),
+         ("FORM REAL,32;:TRAC1? TRACE1", block),
+         ("FREQ:CENT 10000000.0", None),
+         ("FREQ:STAR?", "9E6"),
+         ("FREQ:STOP?", "1.1E7"),
+         ("FORM REAL,32;:TRAC2? TRACE2", block)],
+    ) as inst:
+        x, y = inst.read_trace()
+        assert list(x) == [1e6, 2e6, 3e6]
+        assert list(y) == [-80, -70.5, -90]
+        assert inst.freq_center == 2e6  # a query keeps the cache
+        inst.read_trace()
+        inst.freq_center = 1e7
+        x, y = inst.read_trace(2)
+        assert list(x) == [9e6, 10e6, 11e6]
+
+
+def test_read_trace_after_marker_zoom():
+    block = to_ieee_block([-80, -70.5, -90], "f", False) + b"\n"
+    with expected_protocol(
+        FSL,
+        [("FREQ:STAR?", "1E6"),
+         ("FREQ:STOP?", "3E6"),
+         ("FORM REAL,32;:TRAC1? TRACE1", block),
+         ("CALC:MARK:STAT ON", None),
+         ("CALC:MARK:FUNC:ZOOM 2; *WAI", None),
+         ("FREQ:STAR?", "1.5E6"),
+         ("FREQ:STOP?", "2.5E6"),
+         ("FORM REAL,32;:TRAC1? TRACE1", block)],
+    ) as inst:
+        inst.read_trace()
+        inst.create_marker().zoom(2)
+        x, y = inst.read_trace()
+        assert list(x) == [1.5e6, 2e6, 2.5e6]
+
+
+def test_read_trace_after_start_frequency():
+    block = to_ieee_block([-80, -70.5, -90], "f", False) + b"\n"
+    with expected_protocol(
+        FSL,
+        [("FREQ:STAR?", "1E6"),
+         ("FREQ:STOP?", "3E6"),
+         ("FORM REAL,32;:TRAC1? TRACE1", block),
+         ("FREQ:STAR 4000000.0", None),  # The stop frequency might be coerced
+         ("FREQ:STAR?", "4E6"),
+         ("FREQ:STOP?", "6E6"),
+         ("FORM REAL,32;:TRAC1? TRACE1", block),
+         ("*RST", None),
+         ("FREQ:STAR?", "0"),
+         ("FREQ:STOP?", "2E6"),
+         ("FORM REAL,32;:TRAC1? TRACE1", block)],
+    ) as inst:
+        inst.read_trace()
+        inst.freq_start = 4e6
+        x, y = inst.read_trace()
+        assert list(x) == [4e6, 5e6, 6e6]
+        inst.reset()
+        x, y = inst.read_trace()
+        assert list(x) == [0, 1e6, 2e6]
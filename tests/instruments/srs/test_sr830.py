@@ -0,0 +1,106 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import struct
+
+import pytest
+
+from pymeasure.test import expected_protocol
+from pymeasure.instruments.srs.sr830 import SR830
+
+
+def floats(*values):
+    return struct.pack(f"<{len(values)}f", *values)
+
+
+def test_stream_buffer():
+    with expected_protocol(
+        SR830,
+        [("SPTS?", "0"),
+         ("SPTS?", "2"),
+         ("TRCB?1,0,2", floats(1, 2)),
+         ("TRCB?2,0,2", floats(3, 4)),
+         ("SPTS?", "3"),
+         ("TRCB?1,2,1", floats(5)),
+         ("TRCB?2,2,1", floats(6)),
+         ("PAUS", None)],
+    ) as inst:
+        chunks = list(inst.stream_buffer(count=3, interval=0.001))
+        assert [(list(ch1), list(ch2)) for ch1, ch2 in chunks] == [([1, 2], [3, 4]), ([5], [6])]
+
+
+def test_stream_buffer_chunk_size_and_restart():
+    with expected_protocol(
+        SR830,
+        [("SPTS?", "16383"),
+         ("TRCB?1,0,10000", floats(*range(10000))),
+         ("TRCB?2,0,10000", floats(*range(10000))),
+         ("SPTS?", "16383"),
+         ("TRCB?1,10000,6383", floats(*range(6383))),
+         ("TRCB?2,10000,6383", floats(*range(6383))),
+         ("SPTS?", "16383"),
+         ("REST", None),
+         ("STRT", None),
+         ("SPTS?", "1"),
+         ("TRCB?1,0,1", floats(7)),
+         ("TRCB?2,0,1", floats(8)),
+         ("PAUS", None)],
+    ) as inst:
+        lengths = [len(ch1) for ch1, ch2 in
+                   inst.stream_buffer(count=16384, chunk_size=10000, interval=0.001)]
+        assert lengths == [10000, 6383, 1]
+
+
+def test_stream_buffer_aborted():
+    with expected_protocol(
+        SR830,
+        [("SPTS?", "0"),
+         ("PAUS", None)],
+    ) as inst:
+        assert list(inst.stream_buffer(has_aborted=lambda: True)) == []
+
+
+def test_fill_buffer():
+    with expected_protocol(
+        SR830,
+        [("SPTS?", "2"),
+         ("TRCB?1,0,2", floats(1, 2)),
+         ("TRCB?2,0,2", floats(3, 4)),
+         ("PAUS", None)],
+    ) as inst:
+        ch1, ch2 = inst.fill_buffer(2)
+        assert list(ch1) == [1, 2]
+        assert list(ch2) == [3, 4]
+
+
+def test_buffer_measure():
+    with expected_protocol(
+        SR830,
+        [("FAST0;STRD", None),
+         ("SPTS?", "2"),
+         ("TRCB?1,0,2", floats(1, 3)),
+         ("TRCB?2,0,2", floats(2, 2)),
+         ("PAUS", None)],
+    ) as inst:
+        assert inst.buffer_measure(2) == pytest.approx((2, 1, 2, 0))
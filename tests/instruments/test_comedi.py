@@ -0,0 +1,140 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import io
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pymeasure.instruments.comedi import SynchronousAI
+
+
+class ShortReadFile(io.BytesIO):
+    """Device file returning at most `max_read` bytes per read."""
+
+    def __init__(self, content, max_read):
+        super().__init__(content)
+        self.max_read = max_read
+        self.requested = []
+
+    def readinto(self, buffer):
+        self.requested.append(len(buffer))
+        return super().readinto(memoryview(buffer)[:self.max_read])
+
+
+class FakeSubdevice:
+    def __init__(self, file):
+        self.device = SimpleNamespace(file=file)
+        self.running = True
+        self.cancelled = False
+
+    def get_dtype(self):
+        return np.uint16
+
+    def get_flags(self):
+        return SimpleNamespace(running=self.running)
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class FakeChannel:
+    def __init__(self, subdevice, gain):
+        self.subdevice = subdevice
+        self.gain = gain
+
+    def get_converter(self):
+        return SimpleNamespace(to_physical=lambda raw: raw * self.gain)
+
+
+@pytest.fixture
+def make_ai(monkeypatch):
+    monkeypatch.setattr(SynchronousAI, "_command", lambda self: None)
+    monkeypatch.setattr(SynchronousAI, "_start", lambda self: None)
+
+    def make_ai(samples, max_read, period=1., scans=None):
+        raw = np.arange(2 * (samples if scans is None else scans), dtype=np.uint16)
+        file = ShortReadFile(raw.tobytes(), max_read)
+        subdevice = FakeSubdevice(file)
+        channels = [FakeChannel(subdevice, 1.), FakeChannel(subdevice, 0.5)]
+        return SynchronousAI(channels, period, samples)
+    return make_ai
+
+
+def expected(scans):
+    raw = np.arange(2 * scans, dtype=np.float32).reshape(scans, 2)
+    raw[:, 1] *= 0.5
+    return raw
+
+
+def test_chunk_boundaries(make_ai):
+    # 4 bytes per scan, reads of 5 bytes split the scans
+    ai = make_ai(samples=7, max_read=5)
+    chunks = list(ai.chunks(chunk_scans=3))
+    assert sum(len(chunk) for chunk in chunks) == 7
+    assert max(len(chunk) for chunk in chunks) <= 3
+    np.testing.assert_array_equal(np.concatenate(chunks), expected(7))
+    # The last read only requests the remaining scans
+    assert ai.subdevice.device.file.requested[-1] <= 4
+    assert ai.subdevice.cancelled
+
+
+def test_partial_final_read(make_ai):
+    # The acquisition ends with an incomplete scan
+    ai = make_ai(samples=5, max_read=64, scans=3)
+    file = ai.subdevice.device.file
+    file.seek(0, io.SEEK_END)
+    file.write(b"\x01")
+    file.seek(0)
+    chunks = list(ai.chunks(chunk_scans=4))
+    np.testing.assert_array_equal(np.concatenate(chunks), expected(3))
+
+
+def test_measure(make_ai):
+    ai = make_ai(samples=6, max_read=8)
+    progress, data = [], []
+    ai.emit_progress = progress.append
+    ai.emit_data = data.append
+    ai.measure(chunk_scans=4)
+    np.testing.assert_array_equal(ai.data, expected(6))
+    assert progress[-1] == 100
+    assert sum(len(chunk) for chunk in data) == 6
+
+
+def test_chunk_limited_by_scan_rate(make_ai):
+    # 10 scans per second: a chunk holds at most 0.2 s of scans
+    ai = make_ai(samples=10, max_read=1024)
+    chunks = list(ai.chunks(chunk_scans=1024, chunk_time=0.2))
+    assert [len(chunk) for chunk in chunks] == [2] * 5
+    assert ai.subdevice.device.file.requested[0] == 2 * 4
+
+
+def test_abort(make_ai):
+    ai = make_ai(samples=10, max_read=1024)
+    chunks = []
+    for chunk in ai.chunks(lambda: len(chunks) > 1, chunk_time=0.2):
+        chunks.append(chunk)
+    assert len(chunks) == 2
+    assert ai.subdevice.cancelled
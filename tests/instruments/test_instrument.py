@@ -163,6 +163,12 @@ class TestInstrumentCommunication:
         instr.read_bytes(5)
         assert instr.adapter.method_calls == [mock.call.read_bytes(5)]
 
+    def test_read_ieee_block(self, instr):
+        instr.adapter.read_bytes.side_effect = [b"#1", b"5", b"abcde", b"\n"]
+        assert instr.read_ieee_block() == b"abcde"
+        assert instr.adapter.method_calls == [mock.call.read_bytes(2), mock.call.read_bytes(1),
+                                              mock.call.read_bytes(5), mock.call.read_bytes(1)]
+
     def test_write_binary_values(self, instr):
         instr.write_binary_values("abc", [5, 6, 7])
         assert instr.adapter.method_calls == [mock.call.write_binary_values("abc", [5, 6, 7])]
@@ -276,3 +282,133 @@ class TestMultiFunctionality:
                 [("X:Volt 123.456000", None)]
         ) as inst:
             inst.f_X.voltage = 123.456
+
+
+class CachedChannel(Channel):
+    scale = Instrument.control("C{ch}:SCAL?", "C{ch}:SCAL %g", "Cached scale.", cache=True)
+
+
+class CachedInstrument(Instrument):
+    def __init__(self, adapter, name="Cached instrument", **kwargs):
+        super().__init__(adapter, name, **kwargs)
+
+    ch_1 = Instrument.ChannelCreator(CachedChannel, 1)
+
+    range_ = Instrument.control("RANG?", "RANG %g", "Cached range.", cache=True,
+                                dynamic=True)
+    level = Instrument.control("LEV?", "LEV %g", "Level cached for 10 s.", cache=10)
+    voltage = Instrument.measurement("VOLT?", "Uncached voltage.")
+    auto_range = Instrument.control("AUTO?", "AUTO %d", "Changes the range.",
+                                    invalidates=("range_",))
+
+
+class TestPropertyCache:
+    def test_cached_until_set(self):
+        with expected_protocol(
+                CachedInstrument,
+                [("RANG?", "1"), ("RANG 2", None), ("RANG?", "2"),
+                 ("VOLT?", "3"), ("VOLT?", "4")],
+        ) as inst:
+            assert inst.range_ == 1
+            assert inst.range_ == 1
+            inst.range_ = 2
+            assert inst.range_ == 2
+            assert inst.range_ == 2
+            assert inst.voltage == 3
+            assert inst.voltage == 4
+            assert inst.cache_info() == {"hits": 2, "misses": 2, "invalidations": 1,
+                                         "entries": 1}
+
+    def test_invalidate(self):
+        with expected_protocol(
+                CachedInstrument,
+                [("RANG?", "1"), ("C1:SCAL?", "5"), ("RANG?", "1"),
+                 ("C1:SCAL?", "6"), ("RANG?", "1"), ("C1:SCAL?", "7")],
+        ) as inst:
+            assert inst.range_ == 1
+            assert inst.ch_1.scale == 5
+            inst.invalidate_cache("range_")
+            assert inst.range_ == 1
+            assert inst.ch_1.scale == 5
+            inst.ch_1.invalidate_cache()
+            assert inst.range_ == 1
+            assert inst.ch_1.scale == 6
+            inst.invalidate_cache()
+            assert inst.range_ == 1
+            assert inst.ch_1.scale == 7
+
+    def test_reset(self):
+        with expected_protocol(
+                CachedInstrument,
+                [("C1:SCAL?", "5"), ("*RST", None), ("C1:SCAL?", "1")],
+        ) as inst:
+            assert inst.ch_1.scale == 5
+            inst.reset()
+            assert inst.ch_1.scale == 1
+            assert inst.ch_1.cache_info()["entries"] == 1
+
+    def test_invalidated_by_other_property(self):
+        with expected_protocol(
+                CachedInstrument,
+                [("RANG?", "1"), ("AUTO 1", None), ("RANG?", "10")],
+        ) as inst:
+            assert inst.range_ == 1
+            inst.auto_range = 1
+            assert inst.range_ == 10
+
+    def test_dynamic_parameters(self):
+        with expected_protocol(
+                CachedInstrument,
+                [("RANG?", "1"), ("RANG?", "1"), ("RANG?", "1")],
+        ) as inst:
+            assert inst.range_ == 1
+            inst.range__get_process = lambda v: 10 * v
+            assert inst.range_ == 10
+            assert inst.range_ == 10
+            inst.range__values = (0, 100)  # Read again
+            assert inst.range_ == 10
+
+    def test_cache_is_stored_by_name(self):
+        with expected_protocol(
+                CachedInstrument,
+                [("RANG?", "1"), ("C1:SCAL?", "5")],
+        ) as inst:
+            assert inst.range_ == 1
+            assert inst.ch_1.scale == 5
+            assert list(inst._property_cache.entries) == ["range_"]
+            assert list(inst.ch_1._property_cache.entries) == ["scale"]
+            assert inst.cache_info()["entries"] == 2
+
+    def test_ttl(self, monkeypatch):
+        now = [100.]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        with expected_protocol(
+                CachedInstrument,
+                [("LEV?", "1"), ("LEV?", "2")],
+        ) as inst:
+            assert inst.level == 1
+            now[0] += 9
+            assert inst.level == 1
+            now[0] += 2
+            assert inst.level == 2
+
+    def test_instances_do_not_share_the_cache(self):
+        with expected_protocol(CachedInstrument, [("RANG?", "1")]) as inst:
+            assert inst.range_ == 1
+        with expected_protocol(CachedInstrument, [("RANG?", "2")]) as inst:
+            assert inst.range_ == 2
+
+
+@pytest.mark.parametrize("message, termination, data", (
+    (b"#15abcde\n", 1, b"abcde"),
+    (b"#3010\n\x00\x01\x02\x03\x04\x05\x06\x07\x08", 0, b"\n\x00\x01\x02\x03\x04\x05\x06\x07\x08"),
+))
+def test_read_ieee_block(message, termination, data):
+    with expected_protocol(Instrument, [(None, message)], name="Test") as instr:
+        assert instr.read_ieee_block(termination) == data
+
+
+def test_read_ieee_block_invalid():
+    with expected_protocol(Instrument, [(None, b"1\n")], name="Test") as instr:
+        with pytest.raises(ValueError):
+            instr.read_ieee_block()
@@ -0,0 +1,113 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2023 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import pytest
+from pyvisa import constants
+from pyvisa.errors import VisaIOError
+
+from pymeasure.instruments.waiting import wait_until
+
+
+class Counter:
+    def __init__(self, calls):
+        self.calls = 0
+        self.needed = calls
+
+    def __call__(self):
+        self.calls += 1
+        return self.calls >= self.needed
+
+
+def test_wait_until_condition_met():
+    condition = Counter(3)
+    assert wait_until(condition, interval=0.01) is True
+    assert condition.calls == 3
+
+
+def test_wait_until_should_stop():
+    assert wait_until(lambda: False, should_stop=lambda: True) is False
+
+
+def test_wait_until_timeout():
+    with pytest.raises(TimeoutError, match="too slow"):
+        wait_until(lambda: False, timeout=0.05, interval=0.01, timeout_message="too slow")
+
+
+def test_wait_until_backoff(monkeypatch):
+    delays = []
+    monkeypatch.setattr("pymeasure.instruments.waiting.sleep", delays.append)
+    wait_until(Counter(6), interval=1, min_interval=0.1, backoff=2)
+    assert delays == pytest.approx([0.1, 0.2, 0.4, 0.8, 1])
+
+
+class FakeSRQAdapter:
+    def __init__(self, condition):
+        self.condition = condition
+        self.requests = 0
+
+    def wait_for_srq(self, timeout=25, delay=0.1):
+        self.requests += 1
+        if self.requests < 3:
+            raise TimeoutError("Waiting for SRQ timed out.")
+        self.condition.needed = 0
+
+
+def test_wait_until_srq():
+    condition = Counter(1000)
+    adapter = FakeSRQAdapter(condition)
+    assert wait_until(condition, timeout=1, srq=adapter) is True
+    assert adapter.requests == 3
+
+
+def test_wait_until_srq_not_supported():
+    condition = Counter(3)
+    assert wait_until(condition, interval=0.01, srq=object()) is True
+
+
+class FailingSRQAdapter:
+    def __init__(self, error_code):
+        self.error_code = error_code
+        self.requests = 0
+
+    def wait_for_srq(self, timeout=25, delay=0.1):
+        self.requests += 1
+        raise VisaIOError(self.error_code)
+
+
+def test_wait_until_srq_visa_timeout(monkeypatch):
+    delays = []
+    monkeypatch.setattr("pymeasure.instruments.waiting.sleep", delays.append)
+    adapter = FailingSRQAdapter(constants.StatusCode.error_timeout)
+    assert wait_until(Counter(3), timeout=1, srq=adapter) is True
+    assert adapter.requests == 2
+    assert delays == []  # The timeout was the waiting time
+
+
+def test_wait_until_srq_visa_error_polls(monkeypatch):
+    delays = []
+    monkeypatch.setattr("pymeasure.instruments.waiting.sleep", delays.append)
+    adapter = FailingSRQAdapter(constants.StatusCode.error_nonsupported_operation)
+    assert wait_until(Counter(4), interval=1, min_interval=0.1, backoff=2, srq=adapter) is True
+    assert adapter.requests == 1  # Falls back to polling
+    assert delays == pytest.approx([0.1, 0.2])
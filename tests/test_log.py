@@ -22,11 +22,14 @@
 # THE SOFTWARE.
 #
 
+import logging
+import pickle
 import time
+from queue import Queue
 from unittest import mock
 
 from pymeasure.process import context
-from pymeasure.log import Scribe, setup_logging
+from pymeasure.log import Scribe, TopicQueueHandler, setup_logging
 
 
 # TODO: Add tests for logging convenience functions and TopicQueueHandler
@@ -56,3 +59,31 @@ def test_setup_file_logging():
         mocked_file_log.assert_not_called()
         setup_logging(filename='log.txt')
         mocked_file_log.assert_called_once()
+
+
+def log_exception(handler):
+    logger = logging.getLogger("test_topic_queue_handler")
+    logger.handlers = [handler]
+    logger.propagate = False
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("Failed %s", "here")
+
+
+def test_topic_queue_handler_keeps_exception():
+    queue = Queue()
+    log_exception(TopicQueueHandler(queue))
+    topic, record = queue.get_nowait()
+    assert topic == "log"
+    assert record.args == ("here",)
+    assert record.exc_info[0] is ValueError
+
+
+def test_topic_queue_handler_picklable():
+    queue = Queue()
+    log_exception(TopicQueueHandler(queue, picklable=True))
+    topic, record = pickle.loads(pickle.dumps(queue.get_nowait()))
+    assert record.exc_info is None
+    assert record.getMessage().startswith("Failed here")
+    assert "ValueError: boom" in record.getMessage()